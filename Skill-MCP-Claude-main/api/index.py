@@ -3,11 +3,23 @@ Skills Manager API for Vercel
 Uses Vercel Blob Storage for skill persistence
 """
 
-from http.server import BaseHTTPRequestHandler
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import re
-from urllib.parse import parse_qs, urlparse
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module
+    orjson = None
 
 # Vercel Blob SDK
 try:
@@ -18,10 +30,63 @@ except ImportError:
 
 BLOB_TOKEN = os.environ.get('BLOB_READ_WRITE_TOKEN', '')
 
+# Shared HTTP session so warm invocations reuse keep-alive TLS connections
+# to the blob store instead of handshaking once per fetched blob.
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+))
+
+# Runs of characters not allowed in a skill directory name
+_INVALID_NAME_CHARS = re.compile(r'[^a-z0-9-]+')
+
+# SKILL.md frontmatter, filled with the encoded name and description
+SKILL_MD_HEADER = b"---\nname: %s\ndescription: %s\n---\n\n"
+
+# Upper bound on skills fetched in parallel by list_skills, to stay within
+# blob store rate limits.
+FETCH_CONCURRENCY = 16
+
+# Frontmatter is expected to close within this many leading characters.
+FRONTMATTER_SCAN_LIMIT = 4096
+
+# Decoded blob contents keyed by (pathname, version) so warm invocations
+# skip re-downloading blobs that have not changed since the last request.
+BLOB_CACHE_SIZE = 256
+_BLOB_CACHE: OrderedDict = OrderedDict()
+_BLOB_CACHE_LOCK = threading.Lock()
+
+# Worker pool for blob writes/deletes that can be issued independently.
+_POOL = ThreadPoolExecutor(max_workers=16)
+
+# Headers sent with every response
+RESPONSE_HEADERS = [
+    (b'content-type', b'application/json'),
+    (b'access-control-allow-origin', b'*'),
+    (b'access-control-allow-methods', b'GET, POST, PUT, DELETE, OPTIONS'),
+    (b'access-control-allow-headers', b'Content-Type'),
+]
+
 
 def sanitize_name(name: str) -> str:
     """Convert name to valid skill directory name."""
-    return re.sub(r'[^a-z0-9-]', '-', name.lower().strip()).strip('-')
+    return _INVALID_NAME_CHARS.sub('-', name.lower().strip()).strip('-')
+
+
+def dumps_json(data, indent: bool = False) -> bytes:
+    """Serialize data straight to UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def loads_json(raw: bytes):
+    """Parse JSON from bytes."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def get_skill_path(name: str, filename: str = 'SKILL.md') -> str:
@@ -29,21 +94,129 @@ def get_skill_path(name: str, filename: str = 'SKILL.md') -> str:
     return f"skills/{name}/{filename}"
 
 
+def fetch_blob(url: str) -> bytes:
+    """Download a blob body over the shared HTTP session."""
+    response = _HTTP.get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+def extract_description_fast(content: str) -> str:
+    """
+    Extract the frontmatter description without scanning the document body.
+
+    Only the first FRONTMATTER_SCAN_LIMIT characters are searched for the
+    closing delimiter, and line iteration stops at the description field.
+    """
+    if not content.startswith('---'):
+        return ''
+    end = content.find('\n---', 3, FRONTMATTER_SCAN_LIMIT)
+    if end == -1:
+        return ''
+    for line in content[3:end].splitlines():
+        if line.startswith('description:'):
+            return line.split(':', 1)[1].strip()
+    return ''
+
+
+def parse_skill_md(raw: bytes) -> tuple[str, str]:
+    """Decode SKILL.md and extract its frontmatter description."""
+    content = raw.decode('utf-8')
+    return content, extract_description_fast(content)
+
+
+def parse_meta(raw: bytes) -> dict:
+    """Decode a _meta.json blob."""
+    return loads_json(raw)
+
+
+def read_blob_cached(pathname: str, blob_info: dict, parse):
+    """
+    Fetch and parse a blob, reusing the cached result for the same version.
+
+    The version is taken from the head() metadata (uploadedAt, falling back
+    to size), so an overwritten blob is fetched again.
+    """
+    key = (pathname, str(blob_info.get('uploadedAt') or blob_info.get('size')))
+    with _BLOB_CACHE_LOCK:
+        if key in _BLOB_CACHE:
+            _BLOB_CACHE.move_to_end(key)
+            return _BLOB_CACHE[key]
+
+    value = parse(fetch_blob(blob_info['url']))
+
+    with _BLOB_CACHE_LOCK:
+        _BLOB_CACHE[key] = value
+        _BLOB_CACHE.move_to_end(key)
+        while len(_BLOB_CACHE) > BLOB_CACHE_SIZE:
+            _BLOB_CACHE.popitem(last=False)
+    return value
+
+
+def build_skill_md(name: str, description: str, content: str) -> bytes:
+    """Build SKILL.md bytes with frontmatter, encoding each part once."""
+    header = SKILL_MD_HEADER % (name.encode('utf-8'), description.encode('utf-8'))
+    return b''.join((header, content.encode('utf-8'), b'\n'))
+
+
+def put_skill_files(name: str, skill_md: bytes, meta_json: bytes) -> None:
+    """Upload a skill's SKILL.md and _meta.json in parallel."""
+    options = {'access': 'public', 'token': BLOB_TOKEN}
+    uploads = [
+        _POOL.submit(put, get_skill_path(name), skill_md, options),
+        _POOL.submit(put, get_skill_path(name, '_meta.json'), meta_json, options),
+    ]
+    for upload in uploads:
+        upload.result()
+
+
+async def fetch_skill_details(name: str, skill_data: dict, semaphore: asyncio.Semaphore) -> dict:
+    """Populate content, description and metadata for one listed skill."""
+    async with semaphore:
+        # Get SKILL.md content
+        skill_md_path = get_skill_path(name)
+        try:
+            blob_info = await asyncio.to_thread(head, skill_md_path, token=BLOB_TOKEN)
+            if blob_info:
+                content, description = await asyncio.to_thread(
+                    read_blob_cached, skill_md_path, blob_info, parse_skill_md
+                )
+                skill_data['content'] = content
+                if description:
+                    skill_data['description'] = description
+        except Exception:
+            pass
+
+        # Get _meta.json if exists
+        meta_path = get_skill_path(name, '_meta.json')
+        try:
+            blob_info = await asyncio.to_thread(head, meta_path, token=BLOB_TOKEN)
+            if blob_info:
+                meta = await asyncio.to_thread(read_blob_cached, meta_path, blob_info, parse_meta)
+                skill_data.update(meta)
+        except Exception:
+            pass
+
+    skill_data['file_count'] = len(skill_data['files'])
+    return skill_data
+
+
 async def list_skills():
     """List all skills from blob storage."""
     if not blob_list:
         return {"skills": [], "error": "Blob storage not configured"}
 
     try:
-        result = blob_list(prefix="skills/", token=BLOB_TOKEN)
+        result = await asyncio.to_thread(blob_list, prefix="skills/", token=BLOB_TOKEN)
 
         # Group files by skill name
         skills_map = {}
         for blob in result.get('blobs', []):
             path = blob['pathname']
-            parts = path.split('/')
-            if len(parts) >= 2:
-                skill_name = parts[1]
+            if path.startswith('skills/'):
+                # Skill name is the component after the 'skills/' prefix
+                slash = path.find('/', 7)
+                skill_name = path[7:slash] if slash >= 0 else path[7:]
                 if skill_name not in skills_map:
                     skills_map[skill_name] = {
                         'name': skill_name,
@@ -54,53 +227,19 @@ async def list_skills():
                     }
                 skills_map[skill_name]['files'].append(path)
 
-        # Fetch content and metadata for each skill
-        skills = []
-        for name, skill_data in skills_map.items():
-            # Get SKILL.md content
-            skill_md_path = get_skill_path(name)
-            try:
-                from urllib.request import urlopen
-                blob_info = head(skill_md_path, token=BLOB_TOKEN)
-                if blob_info:
-                    with urlopen(blob_info['url']) as response:
-                        content = response.read().decode('utf-8')
-                        skill_data['content'] = content
-
-                        # Extract description from frontmatter
-                        if content.startswith('---'):
-                            try:
-                                end = content.index('---', 3)
-                                for line in content[3:end].split('\n'):
-                                    if line.startswith('description:'):
-                                        skill_data['description'] = line.split(':', 1)[1].strip()
-                                        break
-                            except ValueError:
-                                pass
-            except Exception:
-                pass
-
-            # Get _meta.json if exists
-            meta_path = get_skill_path(name, '_meta.json')
-            try:
-                blob_info = head(meta_path, token=BLOB_TOKEN)
-                if blob_info:
-                    from urllib.request import urlopen
-                    with urlopen(blob_info['url']) as response:
-                        meta = json.loads(response.read().decode('utf-8'))
-                        skill_data.update(meta)
-            except Exception:
-                pass
-
-            skill_data['file_count'] = len(skill_data['files'])
-            skills.append(skill_data)
+        # Fetch content and metadata for all skills concurrently
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        skills = await asyncio.gather(*(
+            fetch_skill_details(name, skill_data, semaphore)
+            for name, skill_data in skills_map.items()
+        ))
 
         return {"skills": skills}
     except Exception as e:
         return {"skills": [], "error": str(e)}
 
 
-async def get_skill(name: str):
+def get_skill(name: str):
     """Get a specific skill."""
     if not head:
         return {"error": "Blob storage not configured"}, 500
@@ -115,18 +254,14 @@ async def get_skill(name: str):
         if not blob_info:
             return {"error": f"Skill '{name}' not found"}, 404
 
-        from urllib.request import urlopen
-        with urlopen(blob_info['url']) as response:
-            skill_data['content'] = response.read().decode('utf-8')
+        skill_data['content'], _ = read_blob_cached(skill_md_path, blob_info, parse_skill_md)
 
         # Get _meta.json
         meta_path = get_skill_path(name, '_meta.json')
         try:
             meta_info = head(meta_path, token=BLOB_TOKEN)
             if meta_info:
-                with urlopen(meta_info['url']) as response:
-                    meta = json.loads(response.read().decode('utf-8'))
-                    skill_data.update(meta)
+                skill_data.update(read_blob_cached(meta_path, meta_info, parse_meta))
         except Exception:
             pass
 
@@ -141,7 +276,7 @@ async def get_skill(name: str):
         return {"error": str(e)}, 500
 
 
-async def create_skill(data: dict):
+def create_skill(data: dict):
     """Create a new skill."""
     if not put:
         return {"error": "Blob storage not configured"}, 500
@@ -153,23 +288,10 @@ async def create_skill(data: dict):
     description = data.get('description', '')
     content = data.get('content', '')
 
-    skill_md = f"""---
-name: {name}
-description: {description}
----
-
-{content}
-"""
+    skill_md = build_skill_md(name, description, content)
 
     try:
-        # Upload SKILL.md
-        put(
-            get_skill_path(name),
-            skill_md.encode('utf-8'),
-            {'access': 'public', 'token': BLOB_TOKEN}
-        )
-
-        # Upload _meta.json
+        # Upload SKILL.md and _meta.json
         meta = {
             'name': name,
             'description': description,
@@ -177,10 +299,10 @@ description: {description}
             'sub_skills': data.get('sub_skills', []),
             'source': 'web-upload'
         }
-        put(
-            get_skill_path(name, '_meta.json'),
-            json.dumps(meta, indent=2).encode('utf-8'),
-            {'access': 'public', 'token': BLOB_TOKEN}
+        put_skill_files(
+            name,
+            skill_md,
+            dumps_json(meta, indent=True),
         )
 
         return {"success": True, "name": name}, 200
@@ -188,7 +310,7 @@ description: {description}
         return {"error": str(e)}, 500
 
 
-async def update_skill(name: str, data: dict):
+def update_skill(name: str, data: dict):
     """Update an existing skill."""
     if not put:
         return {"error": "Blob storage not configured"}, 500
@@ -196,32 +318,19 @@ async def update_skill(name: str, data: dict):
     description = data.get('description', '')
     content = data.get('content', '')
 
-    skill_md = f"""---
-name: {name}
-description: {description}
----
-
-{content}
-"""
+    skill_md = build_skill_md(name, description, content)
 
     try:
-        # Upload updated SKILL.md
-        put(
-            get_skill_path(name),
-            skill_md.encode('utf-8'),
-            {'access': 'public', 'token': BLOB_TOKEN}
-        )
-
-        # Update _meta.json
+        # Upload updated SKILL.md and _meta.json
         meta = {
             'name': name,
             'description': description,
             'tags': data.get('tags', [])
         }
-        put(
-            get_skill_path(name, '_meta.json'),
-            json.dumps(meta, indent=2).encode('utf-8'),
-            {'access': 'public', 'token': BLOB_TOKEN}
+        put_skill_files(
+            name,
+            skill_md,
+            dumps_json(meta, indent=True),
         )
 
         return {"success": True, "name": name}, 200
@@ -229,7 +338,7 @@ description: {description}
         return {"error": str(e)}, 500
 
 
-async def delete_skill(name: str):
+def delete_skill(name: str):
     """Delete a skill."""
     if not blob_delete or not blob_list:
         return {"error": "Blob storage not configured"}, 500
@@ -241,84 +350,116 @@ async def delete_skill(name: str):
         if not result.get('blobs'):
             return {"error": f"Skill '{name}' not found"}, 404
 
-        # Delete all files
-        for blob in result['blobs']:
-            blob_delete(blob['url'], token=BLOB_TOKEN)
+        # Delete all files in parallel, collecting any that failed
+        blobs = result['blobs']
+        deletions = [
+            _POOL.submit(blob_delete, blob['url'], token=BLOB_TOKEN)
+            for blob in blobs
+        ]
+        failed = [
+            blob['pathname']
+            for blob, deletion in zip(blobs, deletions)
+            if deletion.exception() is not None
+        ]
+        if failed:
+            return {"error": f"Failed to delete {len(failed)} file(s)", "failed": failed}, 500
 
         return {"success": True, "name": name}, 200
     except Exception as e:
         return {"error": str(e)}, 500
 
 
-class handler(BaseHTTPRequestHandler):
-    def _send_response(self, data, status=200):
-        self.send_response(status)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
-
-    def do_OPTIONS(self):
-        self._send_response({})
-
-    def do_GET(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
-
-        import asyncio
-
+async def read_json_body(scope, receive):
+    """
+    Read and parse the JSON request body.
+
+    A declared Content-Length of 0 short-circuits to {} without touching the
+    receive channel; otherwise the body is joined once from its chunks.
+    """
+    for header, value in scope['headers']:
+        if header == b'content-length':
+            if value == b'0':
+                return {}
+            break
+
+    message = await receive()
+    body = message.get('body', b'')
+    if message.get('more_body', False):
+        chunks = [body]
+        while message.get('more_body', False):
+            message = await receive()
+            chunks.append(message.get('body', b''))
+        body = b''.join(chunks)
+    return loads_json(body) if body else {}
+
+
+async def send_json(send, data, status: int = 200) -> None:
+    """Send a JSON response with CORS headers."""
+    await send({'type': 'http.response.start', 'status': status, 'headers': RESPONSE_HEADERS})
+    await send({'type': 'http.response.body', 'body': dumps_json(data)})
+
+
+async def lifespan(receive, send) -> None:
+    """Acknowledge ASGI lifespan startup/shutdown events."""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """
+    ASGI entrypoint picked up by the Vercel Python runtime.
+
+    Runs on the platform's event loop, so list_skills fans out directly;
+    the synchronous blob helpers are pushed to worker threads.
+    """
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    method = scope['method']
+    path = scope['path']
+    name = path.replace('/api/skills/', '') if path.startswith('/api/skills/') else None
+
+    if method == 'OPTIONS':
+        await send_json(send, {})
+    elif method == 'GET':
         if path == '/api/skills':
-            result = asyncio.run(list_skills())
-            self._send_response(result)
-        elif path.startswith('/api/skills/'):
-            name = path.replace('/api/skills/', '')
-            result, status = asyncio.run(get_skill(name))
-            self._send_response(result, status)
+            await send_json(send, await list_skills())
+        elif name is not None:
+            result, status = await asyncio.to_thread(get_skill, name)
+            await send_json(send, result, status)
         else:
-            self._send_response({"error": "Not found"}, 404)
+            await send_json(send, {"error": "Not found"}, 404)
+    elif method == 'POST':
+        data = await read_json_body(scope, receive)
 
-    def do_POST(self):
-        content_length = int(self.headers.get('Content-Length', 0))
-        body = self.rfile.read(content_length)
-        data = json.loads(body) if body else {}
-
-        import asyncio
-
-        if self.path == '/api/skills':
-            result, status = asyncio.run(create_skill(data))
-            self._send_response(result, status)
-        elif self.path == '/api/reload':
-            self._send_response({"success": True, "message": "Skills reloaded"})
+        if path == '/api/skills':
+            result, status = await asyncio.to_thread(create_skill, data)
+            await send_json(send, result, status)
+        elif path == '/api/reload':
+            await send_json(send, {"success": True, "message": "Skills reloaded"})
         else:
-            self._send_response({"error": "Not found"}, 404)
-
-    def do_PUT(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
+            await send_json(send, {"error": "Not found"}, 404)
+    elif method == 'PUT':
+        if name is not None:
+            data = await read_json_body(scope, receive)
 
-        if path.startswith('/api/skills/'):
-            name = path.replace('/api/skills/', '')
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length)
-            data = json.loads(body) if body else {}
-
-            import asyncio
-            result, status = asyncio.run(update_skill(name, data))
-            self._send_response(result, status)
+            result, status = await asyncio.to_thread(update_skill, name, data)
+            await send_json(send, result, status)
         else:
-            self._send_response({"error": "Not found"}, 404)
-
-    def do_DELETE(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
-
-        if path.startswith('/api/skills/'):
-            name = path.replace('/api/skills/', '')
-
-            import asyncio
-            result, status = asyncio.run(delete_skill(name))
-            self._send_response(result, status)
+            await send_json(send, {"error": "Not found"}, 404)
+    elif method == 'DELETE':
+        if name is not None:
+            result, status = await asyncio.to_thread(delete_skill, name)
+            await send_json(send, result, status)
         else:
-            self._send_response({"error": "Not found"}, 404)
+            await send_json(send, {"error": "Not found"}, 404)
+    else:
+        await send_json(send, {"error": "Method not allowed"}, 405)
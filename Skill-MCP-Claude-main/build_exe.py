@@ -36,6 +36,7 @@ def main():
         "--hidden-import", "flask",
         "--hidden-import", "flask_cors",
         "--hidden-import", "werkzeug",
+        "--hidden-import", "waitress",
         "--clean",                            # Clean build
         "skills_manager_launcher.py"
     ]
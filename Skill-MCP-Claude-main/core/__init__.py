@@ -1,11 +1,24 @@
 # Core module for Skills Manager
 # Shared functionality between API server and standalone app
 
-from .config import get_skills_dir, get_app_dir, find_claude_cli
-from .utils import sanitize_name, extract_description_from_frontmatter, parse_frontmatter
+from .config import CORS_ORIGINS, get_skills_dir, get_skills_dir_resolved, get_app_dir, find_claude_cli
+from .utils import (
+    CoreError,
+    sanitize_name,
+    extract_description_from_frontmatter,
+    parse_frontmatter,
+    count_entries,
+    walk_files,
+    write_file,
+    copy_file,
+    copy_tree,
+)
 from .skills import (
     list_all_skills,
+    iter_all_skills,
+    skills_etag,
     get_skill_by_name,
+    iter_skill_files,
     create_skill,
     update_skill,
     delete_skill,
@@ -22,16 +35,27 @@ from .claude_cli import (
 
 __all__ = [
     # Config
+    'CORS_ORIGINS',
     'get_skills_dir',
+    'get_skills_dir_resolved',
     'get_app_dir',
     'find_claude_cli',
     # Utils
+    'CoreError',
     'sanitize_name',
     'extract_description_from_frontmatter',
     'parse_frontmatter',
+    'count_entries',
+    'walk_files',
+    'write_file',
+    'copy_file',
+    'copy_tree',
     # Skills CRUD
     'list_all_skills',
+    'iter_all_skills',
+    'skills_etag',
     'get_skill_by_name',
+    'iter_skill_files',
     'create_skill',
     'update_skill',
     'delete_skill',
@@ -2,10 +2,16 @@
 # RESTRICTED filesystem browser - ONLY allows browsing within skills/ directory
 # This is a SECURITY-CRITICAL module
 
-from pathlib import Path
+import heapq
+import os
+from operator import attrgetter
 from typing import Any
 
-from .config import get_skills_dir
+from .config import get_skills_dir, get_skills_dir_resolved
+from .utils import CoreError
+
+# Maximum number of dirs (and, separately, files) returned per listing
+MAX_ENTRIES = 100
 
 
 def browse_skills_directory(relative_path: str = "") -> tuple[dict[str, Any] | None, str | None]:
@@ -31,74 +37,78 @@ def browse_skills_directory(relative_path: str = "") -> tuple[dict[str, Any] | N
 
         # SECURITY: Prevent path traversal attacks
         if ".." in relative_path:
-            return None, "Path traversal not allowed"
+            return None, CoreError("Path traversal not allowed", "forbidden")
 
         target_path = skills_dir / relative_path
+
+        # SECURITY: Ensure the resolved path is still within skills directory
+        try:
+            # resolve() will follow symlinks and normalize the path
+            if not target_path.resolve().is_relative_to(get_skills_dir_resolved()):
+                return None, CoreError("Access denied: Path outside skills directory", "forbidden")
+        except (OSError, ValueError):
+            return None, CoreError("Invalid path", "not_found")
     else:
         target_path = skills_dir
 
-    # SECURITY: Ensure the resolved path is still within skills directory
-    try:
-        # resolve() will follow symlinks and normalize the path
-        resolved_target = target_path.resolve()
-        resolved_skills = skills_dir.resolve()
-
-        # Check that target is within or equal to skills directory
-        if not (resolved_target == resolved_skills or
-                str(resolved_target).startswith(str(resolved_skills) + "/" ) or
-                str(resolved_target).startswith(str(resolved_skills) + "\\")):
-            return None, "Access denied: Path outside skills directory"
-    except (OSError, ValueError):
-        return None, "Invalid path"
-
     if not target_path.exists():
-        return None, f"Path not found: {relative_path or '(root)'}"
+        return None, CoreError(f"Path not found: {relative_path or '(root)'}", "not_found")
 
     if not target_path.is_dir():
-        return None, "Path is not a directory"
+        return None, CoreError("Path is not a directory", "not_found")
+
+    # Path relative to skills directory, always "/"-separated so paths sent
+    # back by the client parse the same on every platform
+    rel_path = "" if target_path == skills_dir else target_path.relative_to(skills_dir).as_posix()
+    rel_prefix = rel_path + "/" if rel_path else ""
 
-    dirs = []
-    files = []
+    dir_entries = []
+    file_entries = []
 
     try:
-        for item in sorted(target_path.iterdir()):
-            # Skip hidden files
-            if item.name.startswith('.'):
-                continue
-
-            # Get path relative to skills directory
-            rel_path = str(item.relative_to(skills_dir))
-
-            if item.is_dir():
-                # Check if it looks like a skill folder
-                is_skill = (item / "SKILL.md").exists()
-                dirs.append({
-                    "name": item.name,
-                    "path": rel_path,
-                    "is_skill": is_skill,
-                })
-            else:
-                files.append({
-                    "name": item.name,
-                    "path": rel_path,
-                })
+        # scandir entries carry their file type, so is_dir() needs no extra stat
+        with os.scandir(target_path) as it:
+            for entry in it:
+                # Skip hidden files
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    dir_entries.append(entry)
+                else:
+                    file_entries.append(entry)
     except PermissionError:
-        return None, "Permission denied"
+        return None, CoreError("Permission denied", "forbidden")
+
+    # Keep only the first MAX_ENTRIES of each kind by name, without sorting everything
+    by_name = attrgetter("name")
+    dirs = [
+        {
+            "name": entry.name,
+            "path": rel_prefix + entry.name,
+            # Check if it looks like a skill folder
+            "is_skill": os.path.isfile(os.path.join(entry.path, "SKILL.md")),
+        }
+        for entry in heapq.nsmallest(MAX_ENTRIES, dir_entries, key=by_name)
+    ]
+    files = [
+        {
+            "name": entry.name,
+            "path": rel_prefix + entry.name,
+        }
+        for entry in heapq.nsmallest(MAX_ENTRIES, file_entries, key=by_name)
+    ]
 
     # Calculate parent path (only if we're not at root)
     parent = None
     if relative_path:
-        parent_path = Path(relative_path).parent
-        if parent_path != Path("."):
-            parent = str(parent_path)
-        else:
-            parent = ""  # Empty string means root
+        # Empty string means root
+        parent = rel_path.rpartition("/")[0]
 
     return {
         "path": relative_path or "",
         "parent": parent,
-        "dirs": dirs[:100],  # Limit results
-        "files": files[:100],
+        "dirs": dirs,
+        "files": files,
         "restricted": True,  # Flag indicating this is the restricted browser
         "base_dir": "skills/",  # Inform client of the base directory
     }, None
@@ -1,14 +1,49 @@
 # core/claude_cli.py
 # Claude Code CLI integration
 
+import atexit
 import subprocess
+import threading
+import time
 from typing import Any
 
 from .config import find_claude_cli, get_skills_dir
+from .utils import CoreError
+
+# One idle `claude -p` process, started after a prompt completes, for that
+# prompt's (cli, cwd) pair, so the next prompt skips the CLI's startup.
+# Cost: once a prompt has run, one extra CLI process stays resident for the
+# life of the server. A prompt for another (cli, cwd) pair replaces it. It is
+# killed at exit; if the server dies without running atexit (e.g. its
+# console window is closed), the process sees EOF on stdin and exits.
+_warm_cli: tuple[tuple[str, str | None], subprocess.Popen] | None = None
+_warm_cli_lock = threading.Lock()
+
+# How long a get_claude_status() result is reused before re-running the CLI
+STATUS_CACHE_SECONDS = 60
+
+# (timestamp, status) of the last get_claude_status() call
+_status_cache: tuple[float, dict[str, Any]] | None = None
 
 
 def get_claude_status() -> dict[str, Any]:
-    """Check if Claude CLI is available and get version info."""
+    """
+    Check if Claude CLI is available and get version info.
+
+    The result is cached for STATUS_CACHE_SECONDS, since the UI polls this.
+    """
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache is not None and now - _status_cache[0] < STATUS_CACHE_SECONDS:
+        return _status_cache[1]
+
+    status = _check_claude_status()
+    _status_cache = (now, status)
+    return status
+
+
+def _check_claude_status() -> dict[str, Any]:
+    """Run the CLI's --version check."""
     cli_path = find_claude_cli()
 
     if not cli_path:
@@ -29,6 +64,74 @@ def get_claude_status() -> dict[str, Any]:
         return {"available": False, "error": str(e)}
 
 
+def _start_cli(cli_path: str, cwd: str | None) -> subprocess.Popen:
+    """Start a `claude -p` process that reads its prompt from stdin."""
+    return subprocess.Popen(
+        [cli_path, '-p', '--output-format', 'text'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        cwd=cwd,
+    )
+
+
+def _take_cli_process(cli_path: str, cwd: str | None) -> subprocess.Popen:
+    """Take the warm CLI process if it matches and is alive, else start one."""
+    global _warm_cli
+    with _warm_cli_lock:
+        warm, _warm_cli = _warm_cli, None
+    if warm is not None:
+        key, proc = warm
+        if key == (cli_path, cwd) and proc.poll() is None:
+            return proc
+        proc.kill()
+    return _start_cli(cli_path, cwd)
+
+
+def _prestart_cli(cli_path: str, cwd: str | None) -> None:
+    """Start the warm CLI process for the next prompt, if there isn't one."""
+    global _warm_cli
+    with _warm_cli_lock:
+        if _warm_cli is not None:
+            return
+        _warm_cli = ((cli_path, cwd), _start_cli(cli_path, cwd))
+
+
+def _run_cli(
+    cli_path: str,
+    prompt: str,
+    timeout: float,
+    cwd: str | None = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a prompt through a `claude -p` process, warm if one is waiting.
+
+    The prompt is written to stdin, so its size is not bound by
+    command-line length limits. Raises subprocess.TimeoutExpired.
+    """
+    proc = _take_cli_process(cli_path, cwd)
+    try:
+        stdout, stderr = proc.communicate(prompt, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    _prestart_cli(cli_path, cwd)
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+@atexit.register
+def _shutdown_warm_cli() -> None:
+    """Terminate the idle CLI process when the server exits."""
+    global _warm_cli
+    with _warm_cli_lock:
+        warm, _warm_cli = _warm_cli, None
+    if warm is not None:
+        warm[1].kill()
+
+
 def run_claude_prompt(
     prompt: str,
     skill_context: str = "",
@@ -45,20 +148,14 @@ def run_claude_prompt(
     """
     cli_path = find_claude_cli()
     if not cli_path:
-        return None, "Claude Code CLI not found"
+        return None, CoreError("Claude Code CLI not found", "not_found")
 
     full_prompt = prompt
     if skill_context:
         full_prompt = f"Using this skill context:\n\n{skill_context}\n\n{prompt}"
 
     try:
-        result = subprocess.run(
-            [cli_path, '-p', full_prompt],
-            capture_output=True,
-            text=True,
-            cwd=str(get_skills_dir()),
-            timeout=120
-        )
+        result = _run_cli(cli_path, full_prompt, timeout=120, cwd=str(get_skills_dir()))
         return {
             "success": True,
             "stdout": result.stdout,
@@ -66,9 +163,9 @@ def run_claude_prompt(
             "returncode": result.returncode,
         }, None
     except subprocess.TimeoutExpired:
-        return None, "Timeout"
+        return None, CoreError("Timeout", "timeout")
     except Exception as e:
-        return None, str(e)
+        return None, CoreError(str(e), "internal")
 
 
 def generate_skill_with_claude(idea: str) -> tuple[dict[str, Any] | None, str | None]:
@@ -82,11 +179,11 @@ def generate_skill_with_claude(idea: str) -> tuple[dict[str, Any] | None, str |
         Tuple of (result_data, error_message)
     """
     if not idea:
-        return None, "Skill idea required"
+        return None, CoreError("Skill idea required", "bad_request")
 
     cli_path = find_claude_cli()
     if not cli_path:
-        return None, "Claude Code CLI not found"
+        return None, CoreError("Claude Code CLI not found", "not_found")
 
     prompt = f"""Generate a Claude skill based on this idea: {idea}
 
@@ -117,12 +214,7 @@ Example
 Only output the SKILL.md content."""
 
     try:
-        result = subprocess.run(
-            [cli_path, '-p', prompt, '--output-format', 'text'],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
+        result = _run_cli(cli_path, prompt, timeout=180)
         output = result.stdout.strip()
 
         skill_data = {"content": output}
@@ -141,9 +233,9 @@ Only output the SKILL.md content."""
 
         return {"success": True, "skill": skill_data}, None
     except subprocess.TimeoutExpired:
-        return None, "Timeout"
+        return None, CoreError("Timeout", "timeout")
     except Exception as e:
-        return None, str(e)
+        return None, CoreError(str(e), "internal")
 
 
 def improve_skill_with_claude(
@@ -164,11 +256,11 @@ def improve_skill_with_claude(
     skill_file = skills_dir / skill_name / "SKILL.md"
 
     if not skill_file.exists():
-        return None, f"Skill '{skill_name}' not found"
+        return None, CoreError(f"Skill '{skill_name}' not found", "not_found")
 
     cli_path = find_claude_cli()
     if not cli_path:
-        return None, "Claude Code CLI not found"
+        return None, CoreError("Claude Code CLI not found", "not_found")
 
     current_content = skill_file.read_text(encoding="utf-8")
     prompt = f"""Improve this skill: {improvement_request}
@@ -179,18 +271,13 @@ Current SKILL.md:
 Output the complete improved SKILL.md file only."""
 
     try:
-        result = subprocess.run(
-            [cli_path, '-p', prompt, '--output-format', 'text'],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
+        result = _run_cli(cli_path, prompt, timeout=180)
         return {
             "success": True,
             "improved_content": result.stdout.strip(),
             "original_content": current_content,
         }, None
     except subprocess.TimeoutExpired:
-        return None, "Timeout"
+        return None, CoreError("Timeout", "timeout")
     except Exception as e:
-        return None, str(e)
+        return None, CoreError(str(e), "internal")
@@ -4,39 +4,61 @@
 import os
 import sys
 import shutil
+from functools import cache, lru_cache
 from pathlib import Path
 
-# Cache for computed paths
-_app_dir = None
-_skills_dir = None
+# Security: browser origins allowed to call the Flask apps' /api routes,
+# localhost only
+CORS_ORIGINS = (
+    'http://localhost:5050',
+    'http://127.0.0.1:5050',
+    'http://localhost:3000',  # Dev server
+    'http://127.0.0.1:3000',
+)
 
+# Server settings shared by skills_manager_app.py and skills_manager_launcher.py
+# waitress worker threads; Claude CLI calls can hold one for minutes
+SERVER_THREADS = 8
+# Seconds a port probe may wait; loopback answers far sooner
+PORT_PROBE_TIMEOUT = 0.1
+# Longest the browser waits for the server before opening anyway
+BROWSER_WAIT_SECONDS = 10
+# Connections waitress keeps open at once before it stops accepting more
+SERVER_CONNECTION_LIMIT = 64
 
+
+@cache
 def get_app_dir() -> Path:
     """Get the application directory (handles frozen PyInstaller builds)."""
-    global _app_dir
-    if _app_dir is None:
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller bundle
-            _app_dir = Path(sys.executable).parent
-        else:
-            # Running as script - go up from core/ to project root
-            _app_dir = Path(__file__).parent.parent
-    return _app_dir
+    if getattr(sys, 'frozen', False):
+        # Running as PyInstaller bundle
+        return Path(sys.executable).parent
+    # Running as script - go up from core/ to project root
+    return Path(__file__).parent.parent
 
 
+@cache
 def get_skills_dir() -> Path:
     """Get the skills directory path."""
-    global _skills_dir
-    if _skills_dir is None:
-        _skills_dir = get_app_dir() / "skills"
-        _skills_dir.mkdir(exist_ok=True)
-    return _skills_dir
+    skills_dir = get_app_dir() / "skills"
+    skills_dir.mkdir(exist_ok=True)
+    return skills_dir
+
 
+@cache
+def get_skills_dir_resolved() -> Path:
+    """Get the skills directory with symlinks resolved (computed once)."""
+    return get_skills_dir().resolve()
 
+
+@lru_cache(maxsize=1)
 def find_claude_cli() -> str | None:
     """
     Find the Claude Code CLI executable using portable path resolution.
 
+    The result is cached for the life of the process; call
+    find_claude_cli.cache_clear() to search again.
+
     Search order:
     1. PATH (via shutil.which)
     2. ~/.claude/claude.exe (Windows)
@@ -0,0 +1,87 @@
+# core/flask_json.py
+# orjson-backed JSON for the Flask apps
+#
+# Kept out of core/__init__ so the rest of core doesn't need Flask.
+
+from operator import itemgetter
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    # Keep Flask's stdlib json provider
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with orjson.
+
+    Used by jsonify() and request.json alike; the latter parses the raw
+    body bytes without decoding them to str first. Output matches the
+    default provider: keys are sorted, debug responses are indented, and
+    datetimes and dataclasses go through Flask's own default().
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class JSONFields:
+    """
+    Pick fields out of a JSON request body as positional arguments.
+
+    Fields are given in the order the target core function takes its
+    parameters, each with the default used when the body omits it.
+    Defaults are shared by every request, so they must be immutable.
+    """
+
+    def __init__(self, **defaults: Any):
+        self.defaults = defaults
+        self._get = itemgetter(*defaults)
+        # itemgetter with one key returns the bare value, not a 1-tuple
+        self._single = len(defaults) == 1
+
+    def __call__(self, data: dict[str, Any]) -> tuple:
+        values = self._get(self.defaults | data)
+        return (values,) if self._single else values
+
+
+# HTTP status for each CoreError kind
+ERROR_STATUS = {
+    "bad_request": 400,
+    "forbidden": 403,
+    "not_found": 404,
+    "exists": 409,
+    "timeout": 408,
+    "internal": 500,
+}
+
+
+# Request bodies of the apps' POST/PUT routes, in core argument order
+CREATE_SKILL_FIELDS = JSONFields(name="", description="", content="", tags=(), sub_skills=(), overwrite=False)
+UPDATE_SKILL_FIELDS = JSONFields(description="", content="", tags=None)
+IMPORT_FOLDER_FIELDS = JSONFields(path="", name="")
+IMPORT_FILES_FIELDS = JSONFields(skill_name="", files=())
+RUN_PROMPT_FIELDS = JSONFields(prompt="", skill_context="")
+IMPROVE_SKILL_FIELDS = JSONFields(skill_name="", request="")
+
+
+def use_orjson(app: Flask) -> None:
+    """Switch app to OrjsonProvider when orjson is installed."""
+    if orjson:
+        app.json = OrjsonProvider(app)
@@ -0,0 +1,80 @@
+# core/flask_static.py
+# In-memory, pre-compressed static pages and the cached skills listing
+# for the Flask apps
+#
+# Kept out of core/__init__ so the rest of core doesn't need Flask.
+
+import gzip
+import hashlib
+import os
+from pathlib import Path
+
+from flask import Flask, Response, abort, jsonify, request
+
+from .skills import list_all_skills, skills_etag
+
+# path -> ((mtime_ns, size), raw bytes, gzipped bytes, etag)
+_STATIC_CACHE: dict[str, tuple[tuple[int, int], bytes, bytes, str]] = {}
+
+# app name -> (etag, encoded body) of its last skills listing
+_SKILLS_RESPONSES: dict[str, tuple[str, bytes]] = {}
+
+
+def static_file_response(path: Path, mimetype: str) -> Response:
+    """
+    Serve a small static file from memory, gzipped when the client accepts it.
+
+    The file is read, compressed and hashed once per change on disk
+    (keyed on mtime and size) instead of on every request, and carries a
+    strong ETag so reloads get 304 Not Modified.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        abort(404)
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _STATIC_CACHE.get(str(path))
+    if cached is None or cached[0] != signature:
+        raw = Path(path).read_bytes()
+        etag = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cached = (signature, raw, gzip.compress(raw, 6), etag)
+        _STATIC_CACHE[str(path)] = cached
+    _, raw, compressed, etag = cached
+
+    if "gzip" in request.accept_encodings:
+        response = Response(compressed, mimetype=mimetype)
+        response.headers["Content-Encoding"] = "gzip"
+        # Each encoding needs its own strong ETag
+        response.set_etag(f"{etag}-gzip")
+    else:
+        response = Response(raw, mimetype=mimetype)
+        response.set_etag(etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"
+    response.last_modified = stat.st_mtime
+    return response.make_conditional(request)
+
+
+def cached_skills_response(app: Flask) -> Response:
+    """
+    Serve GET /api/skills, re-encoding the listing only when skills_etag changes.
+
+    The response carries that ETag, so a client that already has the
+    listing gets 304 Not Modified.
+    """
+    etag = skills_etag()
+    cached = _SKILLS_RESPONSES.get(app.name)
+    if cached is None or cached[0] != etag:
+        # The UI previews and exports SKILL.md straight from the listing
+        body = jsonify({"skills": list_all_skills(include_content=True)}).get_data()
+        cached = _SKILLS_RESPONSES[app.name] = (etag, body)
+
+    response = app.response_class(cached[1], mimetype=app.json.mimetype)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def drop_skills_response(app: Flask) -> None:
+    """Forget app's cached listing after a route changes the skills on disk."""
+    _SKILLS_RESPONSES.pop(app.name, None)
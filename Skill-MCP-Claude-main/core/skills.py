@@ -1,62 +1,225 @@
 # core/skills.py
 # Skills CRUD operations
 
+import copy
 import json
+import os
 import shutil
 import base64
+import hashlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module
+    orjson = None
 
 from .config import get_skills_dir
-from .utils import sanitize_name, extract_description_from_frontmatter, create_skill_markdown
+from .utils import (
+    CoreError,
+    sanitize_name,
+    extract_description_from_frontmatter,
+    extract_description_fast,
+    create_skill_markdown,
+    copy_tree,
+    count_entries,
+    walk_files,
+    write_file,
+)
 
 
-def list_all_skills() -> list[dict[str, Any]]:
-    """List all skills with their metadata."""
-    skills_dir = get_skills_dir()
-    skills = []
+def _jloads(raw: bytes) -> Any:
+    """Parse JSON straight from file bytes."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
-    if not skills_dir.exists():
-        return skills
 
-    for skill_dir in skills_dir.iterdir():
-        if not skill_dir.is_dir():
-            continue
+def _jdumps(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
-        skill_data = {"name": skill_dir.name}
 
-        # Load metadata from _meta.json
-        meta_file = skill_dir / "_meta.json"
-        if meta_file.exists():
-            try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-                skill_data.update(meta)
-            except (json.JSONDecodeError, OSError):
-                pass  # Skip invalid metadata
-
-        # Load content from SKILL.md
-        skill_file = skill_dir / "SKILL.md"
-        if skill_file.exists():
+# Characters read from SKILL.md when only the description is needed
+FRONTMATTER_READ_LIMIT = 4096
+
+# Cached listing entries: (skill dir path, include_content) -> (signature, skill_data)
+_LIST_CACHE: dict[tuple[str, bool], tuple[tuple, dict[str, Any]]] = {}
+
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _tree_mtimes(root: str, root_mtime_ns: int) -> tuple[int, ...]:
+    """mtimes of root and of every directory below it, in walk order."""
+    mtimes = [root_mtime_ns]
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    mtimes.append(entry.stat(follow_symlinks=False).st_mtime_ns)
+                    stack.append(entry.path)
+    return tuple(mtimes)
+
+
+def _skill_signature(skill_path: str, dir_mtime_ns: int) -> tuple:
+    """
+    Change marker for a cached skill entry.
+
+    file_count covers the whole tree, so the mtime of every directory in
+    it is included: adding, removing or renaming an entry anywhere (e.g.
+    under scripts/) changes its parent's mtime. In-place rewrites of
+    SKILL.md and _meta.json don't touch any directory, so their own mtimes
+    are part of the signature too.
+    """
+    return (
+        _tree_mtimes(skill_path, dir_mtime_ns),
+        _mtime_ns(os.path.join(skill_path, "SKILL.md")),
+        _mtime_ns(os.path.join(skill_path, "_meta.json")),
+    )
+
+
+# Bumped on every _invalidate_listing() so skills_etag() changes even when
+# a write lands within the same mtime tick
+_list_generation = 0
+
+
+def _invalidate_listing(skill_dir: Path) -> None:
+    global _list_generation
+    _list_generation += 1
+    _LIST_CACHE.pop((str(skill_dir), True), None)
+    _LIST_CACHE.pop((str(skill_dir), False), None)
+
+
+def _read_frontmatter_description(skill_md: Path) -> str | None:
+    """Read a SKILL.md description, reading the whole file only for long frontmatter."""
+    with open(skill_md, encoding="utf-8") as f:
+        head = f.read(FRONTMATTER_READ_LIMIT)
+        if len(head) == FRONTMATTER_READ_LIMIT and head.find("---", 3) == -1:
+            head += f.read()
+    return extract_description_fast(head)
+
+
+def _load_skill_summary(skill_dir: Path, include_content: bool) -> dict[str, Any]:
+    skill_data = {"name": skill_dir.name}
+
+    # Load metadata from _meta.json
+    meta_file = skill_dir / "_meta.json"
+    if meta_file.exists():
+        try:
+            meta = _jloads(meta_file.read_bytes())
+            skill_data.update(meta)
+        except (json.JSONDecodeError, OSError):
+            pass  # Skip invalid metadata
+
+    # Load content from SKILL.md; without content only the frontmatter is read
+    skill_file = skill_dir / "SKILL.md"
+    if skill_file.exists() and not include_content:
+        if "description" not in skill_data:
             try:
-                content = skill_file.read_text(encoding="utf-8")
-                skill_data["content"] = content
-
-                # Extract description if not in metadata
-                if "description" not in skill_data:
-                    desc = extract_description_from_frontmatter(content)
-                    if desc:
-                        skill_data["description"] = desc
-            except OSError:
+                desc = _read_frontmatter_description(skill_file)
+                if desc:
+                    skill_data["description"] = desc
+            except (OSError, UnicodeDecodeError):
                 pass
+    elif skill_file.exists():
+        try:
+            content = skill_file.read_text(encoding="utf-8")
+            skill_data["content"] = content
 
-        # Add file structure info
-        skill_data["has_scripts"] = (skill_dir / "scripts").exists()
-        skill_data["has_references"] = (skill_dir / "references").exists()
-        skill_data["file_count"] = len(list(skill_dir.rglob("*")))
+            # Extract description if not in metadata
+            if "description" not in skill_data:
+                desc = extract_description_from_frontmatter(content)
+                if desc:
+                    skill_data["description"] = desc
+        except OSError:
+            pass
 
-        skills.append(skill_data)
+    # Add file structure info
+    skill_data["has_scripts"] = (skill_dir / "scripts").exists()
+    skill_data["has_references"] = (skill_dir / "references").exists()
+    skill_data["file_count"] = count_entries(str(skill_dir))
 
-    return skills
+    return skill_data
+
+
+def iter_all_skills(include_content: bool = False) -> Iterator[dict[str, Any]]:
+    """
+    Yield each skill with its metadata as its directory is processed.
+
+    SKILL.md is only read in full when include_content is set; otherwise
+    at most its frontmatter is read, and only if _meta.json has no
+    description.
+
+    Entries are cached per skill and rebuilt only when a directory in the
+    skill folder, its SKILL.md or its _meta.json changes on disk. Stale cache entries are
+    dropped once the iterator is exhausted.
+    """
+    skills_dir = get_skills_dir()
+    if not skills_dir.exists():
+        return
+
+    seen = set()
+    with os.scandir(skills_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+
+            key = (entry.path, include_content)
+            signature = _skill_signature(entry.path, entry.stat().st_mtime_ns)
+            cached = _LIST_CACHE.get(key)
+            if cached and cached[0] == signature:
+                skill_data = cached[1]
+            else:
+                skill_data = _load_skill_summary(Path(entry.path), include_content)
+                _LIST_CACHE[key] = (signature, skill_data)
+
+            seen.add(key)
+            # Deep copy, so callers can't mutate the cached tags or sub_skills
+            yield copy.deepcopy(skill_data)
+
+    for key in _LIST_CACHE.keys() - seen:
+        if key[1] == include_content:
+            _LIST_CACHE.pop(key, None)
+
+
+def list_all_skills(include_content: bool = False) -> list[dict[str, Any]]:
+    """List all skills with their metadata."""
+    return list(iter_all_skills(include_content))
+
+
+def skills_etag() -> str:
+    """
+    ETag for the skills listing.
+
+    Hashes the same per-skill signatures iter_all_skills() checks before
+    reusing a cached entry, so it changes whenever the listing can,
+    without reading any skill files.
+    """
+    skills_dir = get_skills_dir()
+    digest = hashlib.blake2b(f"{_list_generation}\0".encode("utf-8"), digest_size=16)
+    if skills_dir.exists():
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                if entry.is_dir():
+                    signature = _skill_signature(entry.path, entry.stat().st_mtime_ns)
+                    digest.update(f"{entry.name}\0{signature}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def iter_skill_files(skill_dir: Path) -> Iterator[str]:
+    """Yield the relative path of each file in a skill, without listing the whole tree first."""
+    for rel_path, _ in walk_files(str(skill_dir)):
+        yield rel_path
 
 
 def get_skill_by_name(name: str) -> tuple[dict[str, Any] | None, str | None]:
@@ -70,7 +233,7 @@ def get_skill_by_name(name: str) -> tuple[dict[str, Any] | None, str | None]:
     skill_dir = skills_dir / name
 
     if not skill_dir.exists():
-        return None, f"Skill '{name}' not found"
+        return None, CoreError(f"Skill '{name}' not found", "not_found")
 
     skill_data = {"name": name, "files": []}
 
@@ -78,7 +241,7 @@ def get_skill_by_name(name: str) -> tuple[dict[str, Any] | None, str | None]:
     meta_file = skill_dir / "_meta.json"
     if meta_file.exists():
         try:
-            skill_data.update(json.loads(meta_file.read_text(encoding="utf-8")))
+            skill_data.update(_jloads(meta_file.read_bytes()))
         except (json.JSONDecodeError, OSError):
             pass
 
@@ -91,9 +254,7 @@ def get_skill_by_name(name: str) -> tuple[dict[str, Any] | None, str | None]:
             pass
 
     # List all files
-    for f in skill_dir.rglob("*"):
-        if f.is_file():
-            skill_data["files"].append(str(f.relative_to(skill_dir)))
+    skill_data["files"] = list(iter_skill_files(skill_dir))
 
     return skill_data, None
 
@@ -114,15 +275,16 @@ def create_skill(
     """
     name = sanitize_name(name)
     if not name:
-        return None, "Skill name is required"
+        return None, CoreError("Skill name is required", "bad_request")
 
     skills_dir = get_skills_dir()
     skill_dir = skills_dir / name
 
     if skill_dir.exists() and not overwrite:
-        return None, f"Skill '{name}' already exists"
+        return None, CoreError(f"Skill '{name}' already exists", "exists")
 
     skill_dir.mkdir(parents=True, exist_ok=True)
+    _invalidate_listing(skill_dir)
 
     # Write SKILL.md
     skill_md = create_skill_markdown(name, description, content)
@@ -136,7 +298,7 @@ def create_skill(
         "sub_skills": sub_skills or [],
         "source": "created",
     }
-    (skill_dir / "_meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    (skill_dir / "_meta.json").write_bytes(_jdumps(meta))
 
     return {"success": True, "name": name, "path": str(skill_dir)}, None
 
@@ -157,7 +319,9 @@ def update_skill(
     skill_dir = skills_dir / name
 
     if not skill_dir.exists():
-        return None, f"Skill '{name}' not found"
+        return None, CoreError(f"Skill '{name}' not found", "not_found")
+
+    _invalidate_listing(skill_dir)
 
     # Write updated SKILL.md
     skill_md = create_skill_markdown(name, description, content)
@@ -168,7 +332,7 @@ def update_skill(
     meta = {}
     if meta_file.exists():
         try:
-            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            meta = _jloads(meta_file.read_bytes())
         except (json.JSONDecodeError, OSError):
             pass
 
@@ -177,7 +341,7 @@ def update_skill(
         "description": description,
         "tags": tags if tags is not None else meta.get("tags", []),
     })
-    meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    meta_file.write_bytes(_jdumps(meta))
 
     return {"success": True, "name": name}, None
 
@@ -193,9 +357,10 @@ def delete_skill(name: str) -> tuple[dict[str, Any] | None, str | None]:
     skill_dir = skills_dir / name
 
     if not skill_dir.exists():
-        return None, f"Skill '{name}' not found"
+        return None, CoreError(f"Skill '{name}' not found", "not_found")
 
     shutil.rmtree(skill_dir)
+    _invalidate_listing(skill_dir)
     return {"success": True, "name": name}, None
 
 
@@ -210,14 +375,14 @@ def import_folder(
         Tuple of (result_data, error_message)
     """
     if not source_path:
-        return None, "Source path is required"
+        return None, CoreError("Source path is required", "bad_request")
 
     source = Path(source_path)
     if not source.exists():
-        return None, f"Path not found: {source_path}"
+        return None, CoreError(f"Path not found: {source_path}", "not_found")
 
     if not source.is_dir():
-        return None, "Path must be a directory"
+        return None, CoreError("Path must be a directory", "bad_request")
 
     # Determine skill name
     skill_name = sanitize_name(new_name) if new_name else sanitize_name(source.name)
@@ -225,11 +390,23 @@ def import_folder(
     dest = skills_dir / skill_name
 
     if dest.exists():
-        return None, f"Skill '{skill_name}' already exists. Use overwrite option."
+        return None, CoreError(f"Skill '{skill_name}' already exists. Use overwrite option.", "exists")
+
+    # Read the description from the source while it is still warm, and only
+    # when _meta.json will have to be generated
+    imported_description = "Imported skill"
+    source_skill_md = source / "SKILL.md"
+    if not (source / "_meta.json").exists() and source_skill_md.exists():
+        try:
+            desc = _read_frontmatter_description(source_skill_md)
+            if desc:
+                imported_description = desc
+        except (OSError, UnicodeDecodeError):
+            pass  # Keep the default description
 
     try:
         # Copy entire directory
-        shutil.copytree(source, dest)
+        copy_tree(str(source), str(dest))
 
         # Verify SKILL.md exists or create minimal one
         skill_md = dest / "SKILL.md"
@@ -242,22 +419,17 @@ def import_folder(
         # Create _meta.json if missing
         meta_file = dest / "_meta.json"
         if not meta_file.exists():
-            description = "Imported skill"
-            if skill_md.exists():
-                desc = extract_description_from_frontmatter(skill_md.read_text(encoding="utf-8"))
-                if desc:
-                    description = desc
-
             meta = {
                 "name": skill_name,
-                "description": description,
+                "description": imported_description,
                 "tags": [],
                 "sub_skills": [],
                 "source": "imported",
             }
-            meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            meta_file.write_bytes(_jdumps(meta))
 
-        file_count = len(list(dest.rglob("*")))
+        _invalidate_listing(dest)
+        file_count = count_entries(str(dest))
         return {
             "success": True,
             "name": skill_name,
@@ -269,7 +441,7 @@ def import_folder(
         # Cleanup on failure
         if dest.exists():
             shutil.rmtree(dest)
-        return None, str(e)
+        return None, CoreError(str(e), "internal")
 
 
 def import_files_json(
@@ -287,7 +459,7 @@ def import_files_json(
         Tuple of (result_data, error_message)
     """
     if not skill_name:
-        return None, "Skill name is required"
+        return None, CoreError("Skill name is required", "bad_request")
 
     skill_name = sanitize_name(skill_name)
     skills_dir = get_skills_dir()
@@ -296,20 +468,28 @@ def import_files_json(
 
     imported = []
 
+    # Directories already created, with their ancestors, so each is made once
+    seen_dirs: set[Path] = {skill_dir}
+
     for f in files:
         file_path = f.get("path", "")
         content = f.get("content", "")
         is_base64 = f.get("base64", False)
 
         # Security: prevent path traversal
-        if not file_path or ".." in file_path:
+        if not file_path or not isinstance(file_path, str) or ".." in file_path:
             continue
 
         dest_path = skill_dir / file_path.replace("\\", "/")
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        parent = dest_path.parent
+        if parent not in seen_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            while parent not in seen_dirs and parent != parent.parent:
+                seen_dirs.add(parent)
+                parent = parent.parent
 
         if is_base64:
-            dest_path.write_bytes(base64.b64decode(content))
+            write_file(str(dest_path), base64.b64decode(content, validate=False))
         else:
             dest_path.write_text(content, encoding="utf-8")
 
@@ -332,6 +512,7 @@ def import_files_json(
             "sub_skills": [],
             "source": "json-upload",
         }
-        meta_file.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        meta_file.write_bytes(_jdumps(meta))
 
+    _invalidate_listing(skill_dir)
     return {"success": True, "name": skill_name, "files_imported": imported}, None
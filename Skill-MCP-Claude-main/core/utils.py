@@ -1,15 +1,135 @@
 # core/utils.py
 # Shared utility functions
 
+import errno
+import os
 import re
-from typing import Optional
+import shutil
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl that clones a file's extents (copy-on-write) on btrfs/XFS
+FICLONE = 0x40049409
+
+
+class CoreError(str):
+    """
+    Error message returned by core functions, tagged with what went wrong.
+
+    kind is one of 'bad_request', 'forbidden', 'not_found', 'exists',
+    'timeout' or 'internal'. Callers that only show the message can treat it
+    as a plain str; the Flask apps map kind straight to an HTTP status.
+    """
+
+    def __new__(cls, message: str, kind: str):
+        error = super().__new__(cls, message)
+        error.kind = kind
+        return error
+
+
+_SANITIZE_RE = re.compile(r'[^a-z0-9-]')
 
 
 def sanitize_name(name: str) -> str:
     """Convert name to valid skill directory name."""
     if not name:
         return ""
-    return re.sub(r'[^a-z0-9-]', '-', name.lower().strip()).strip('-')
+    cleaned = name.lower().strip()
+    if _SANITIZE_RE.search(cleaned) is None:
+        return cleaned.strip('-')
+    return _SANITIZE_RE.sub('-', cleaned).strip('-')
+
+
+def count_entries(root: str) -> int:
+    """Count every file and directory below root, like len(list(rglob("*")))."""
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return count
+
+
+def walk_files(root: str) -> Iterator[tuple[str, os.DirEntry]]:
+    """
+    Yield (relative_path, entry) for every file below root.
+
+    Relative paths always use forward slashes.
+    """
+    prefix_len = len(root) + 1
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path[prefix_len:].replace(os.sep, "/"), entry
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_file(path: str, data: bytes) -> None:
+    """Write bytes with raw os calls, bypassing Python's buffered file layer."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def copy_file(src: str, dst: str) -> None:
+    """
+    Copy one file, cloning it when the filesystem supports reflinks.
+
+    Tries FICLONE, then copy_file_range, then falls back to shutil.copyfile.
+    Metadata is copied like shutil.copy2.
+    """
+    copied = False
+    if fcntl is not None and hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                copied = True
+            except OSError:
+                try:
+                    remaining = os.fstat(src_fd).st_size
+                    while remaining > 0:
+                        sent = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                    copied = remaining == 0
+                except OSError as e:
+                    if e.errno not in (errno.ENOTSUP, errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+                        raise
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def copy_tree(src: str, dst: str) -> None:
+    """Recursively copy src to a new dst directory, like shutil.copytree."""
+    os.makedirs(dst)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                copy_tree(entry.path, target)
+            else:
+                copy_file(entry.path, target)
+    shutil.copystat(src, dst)
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -38,10 +158,33 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
         return {}, content
 
 
+def extract_description_fast(content: str) -> Optional[str]:
+    """
+    Extract the description field without copying the frontmatter or body.
+
+    Lines are scanned in place up to the closing '---' and the scan stops
+    at the first description line.
+    """
+    if not content.startswith('---'):
+        return None
+    end = content.find('---', 3)
+    if end == -1:
+        return None
+    pos = 3
+    while pos < end:
+        line_end = content.find('\n', pos, end)
+        if line_end == -1:
+            line_end = end
+        key, sep, value = content[pos:line_end].partition(':')
+        if sep and key.strip() == 'description':
+            return value.strip()
+        pos = line_end + 1
+    return None
+
+
 def extract_description_from_frontmatter(content: str) -> Optional[str]:
     """Extract description field from markdown frontmatter."""
-    frontmatter, _ = parse_frontmatter(content)
-    return frontmatter.get('description')
+    return extract_description_fast(content)
 
 
 def create_skill_markdown(name: str, description: str, content: str) -> str:
@@ -1,36 +1,113 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+import atexit
 import base64
+import hashlib
 import os
 import sqlite3
-from typing import Iterable
+import threading
+from typing import Iterable, Iterator
+
+from core.utils import walk_files, write_file
 
 DEFAULT_DB_PATH = Path(__file__).parent / "creation_station.db"
+TEXT_SUFFIXES = {".md", ".json", ".txt"}
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=4)
+def _resolve_db_path(env_value: str | None) -> Path:
+    return Path(env_value or str(DEFAULT_DB_PATH)).resolve()
+
+
 def get_db_path() -> Path:
-    return Path(
-        os.environ.get("CREATION_STATION_DB_PATH", str(DEFAULT_DB_PATH))
-    ).resolve()
+    return _resolve_db_path(os.environ.get("CREATION_STATION_DB_PATH"))
 
 
 def connect(db_path: Path | None = None) -> sqlite3.Connection:
-    connection = sqlite3.connect(str(db_path or get_db_path()))
+    # Autocommit mode: functions that write several rows wrap them in a
+    # savepoint (_atomic), and callers may group more in BEGIN ... COMMIT.
+    database = str(db_path or get_db_path())
+    connection = sqlite3.connect(database, isolation_level=None)
     connection.row_factory = sqlite3.Row
+    if database != ":memory:":
+        connection.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;"
+        )
+    connection.executescript(
+        "PRAGMA temp_store=MEMORY;"
+        " PRAGMA mmap_size=268435456;"
+        " PRAGMA cache_size=-65536;"
+    )
     return connection
 
 
-def init_db(db_path: Path | None = None) -> None:
+@contextmanager
+def _atomic(conn: sqlite3.Connection, name: str) -> Iterator[None]:
+    """
+    Run the block in a savepoint, so it commits or rolls back as a whole.
+
+    Outside a transaction the savepoint is the transaction; inside one
+    (e.g. the seed's) it nests, and only the block is rolled back.
+    """
+    conn.execute(f"SAVEPOINT {name}")
+    try:
+        yield
+    except BaseException:
+        conn.execute(f"ROLLBACK TO {name}")
+        conn.execute(f"RELEASE {name}")
+        raise
+    conn.execute(f"RELEASE {name}")
+
+
+_TLS = threading.local()
+_OPEN_CONNECTIONS: list[sqlite3.Connection] = []
+_OPEN_CONNECTIONS_LOCK = threading.Lock()
+
+
+def get_conn(db_path: Path | None = None) -> sqlite3.Connection:
+    """Return this thread's connection to db_path, opening it on first use."""
+    database = str(db_path or get_db_path())
+    connections = getattr(_TLS, "connections", None)
+    if connections is None:
+        connections = _TLS.connections = {}
+    conn = connections.get(database)
+    if conn is None:
+        conn = connections[database] = connect(Path(database))
+        with _OPEN_CONNECTIONS_LOCK:
+            _OPEN_CONNECTIONS.append(conn)
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    with _OPEN_CONNECTIONS_LOCK:
+        for conn in _OPEN_CONNECTIONS:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass  # Owned by another thread
+        _OPEN_CONNECTIONS.clear()
+
+
+def init_db(
+    db_path: Path | None = None, conn: sqlite3.Connection | None = None
+) -> None:
     db_path = db_path or get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with connect(db_path) as conn:
+    if conn is None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = get_conn(db_path)
+    with conn:
         conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS skills (
@@ -62,9 +139,17 @@ def init_db(db_path: Path | None = None) -> None:
                 is_binary INTEGER NOT NULL DEFAULT 0,
                 encoding TEXT NOT NULL DEFAULT 'utf-8',
                 created_at TEXT NOT NULL,
+                content_hash BLOB,
                 FOREIGN KEY(skill_version_id) REFERENCES skill_versions(id)
             );
 
+            -- File contents shared by every version that contains them,
+            -- keyed by SHA-256 digest
+            CREATE TABLE IF NOT EXISTS blob_store (
+                hash BLOB PRIMARY KEY,
+                data BLOB NOT NULL
+            );
+
             CREATE TABLE IF NOT EXISTS runs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 created_at TEXT NOT NULL,
@@ -113,8 +198,20 @@ def init_db(db_path: Path | None = None) -> None:
                 linked_skill_name TEXT,
                 linked_skill_version_id INTEGER
             );
+
+            -- Foreign keys are not indexed automatically in SQLite.
+            CREATE INDEX IF NOT EXISTS idx_sv_skill
+                ON skill_versions(skill_id, version_number DESC);
+            CREATE INDEX IF NOT EXISTS idx_sf_version
+                ON skill_files(skill_version_id, path);
+            CREATE INDEX IF NOT EXISTS idx_ro_run ON run_outputs(run_id);
+            CREATE INDEX IF NOT EXISTS idx_fb_run ON feedback(run_id);
             """
         )
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(skill_files)")}
+        if "content_hash" not in columns:
+            # Databases created before contents moved to blob_store
+            conn.execute("ALTER TABLE skill_files ADD COLUMN content_hash BLOB")
 
 
 @dataclass
@@ -124,34 +221,43 @@ class SkillFile:
     is_binary: bool
 
 
+def _read_skill_file(entry: tuple[str, str, bool]) -> SkillFile:
+    file_path, rel_path, is_text = entry
+    if is_text:
+        with open(file_path, encoding="utf-8") as handle:
+            return SkillFile(path=rel_path, content=handle.read(), is_binary=False)
+    with open(file_path, "rb") as handle:
+        return SkillFile(path=rel_path, content=handle.read(), is_binary=True)
+
+
 def load_skill_files(skill_dir: Path) -> list[SkillFile]:
-    files: list[SkillFile] = []
-    for file_path in skill_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-        rel_path = str(file_path.relative_to(skill_dir)).replace("\\", "/")
-        if file_path.suffix.lower() in {".md", ".json", ".txt"}:
-            files.append(
-                SkillFile(
-                    path=rel_path,
-                    content=file_path.read_text(encoding="utf-8"),
-                    is_binary=False,
-                )
-            )
-        else:
-            files.append(
-                SkillFile(
-                    path=rel_path,
-                    content=file_path.read_bytes(),
-                    is_binary=True,
-                )
-            )
-    return files
+    entries = [
+        (entry.path, rel_path, os.path.splitext(entry.name)[1].lower() in TEXT_SUFFIXES)
+        for rel_path, entry in walk_files(str(skill_dir))
+    ]
+    if len(entries) <= 2:
+        return [_read_skill_file(entry) for entry in entries]
+    with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(entries))) as executor:
+        return list(executor.map(_read_skill_file, entries))
+
+
+# INSERT ... RETURNING needs SQLite 3.35+
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 def upsert_skill(conn: sqlite3.Connection, name: str) -> int:
-    row = conn.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()
     now = utc_now()
+    if HAS_RETURNING:
+        row = conn.execute(
+            """
+            INSERT INTO skills (name, created_at, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET updated_at = excluded.updated_at
+            RETURNING id
+            """,
+            (name, now, now),
+        ).fetchone()
+        return int(row["id"])
+    row = conn.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()
     if row:
         conn.execute(
             "UPDATE skills SET updated_at = ? WHERE id = ?", (now, row["id"])
@@ -164,6 +270,20 @@ def upsert_skill(conn: sqlite3.Connection, name: str) -> int:
     return int(cursor.lastrowid)
 
 
+def skill_has_versions(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        """
+        SELECT EXISTS(
+            SELECT 1 FROM skill_versions v
+            JOIN skills s ON s.id = v.skill_id
+            WHERE s.name = ?
+        )
+        """,
+        (name,),
+    ).fetchone()
+    return bool(row[0])
+
+
 def next_version_number(conn: sqlite3.Connection, skill_id: int) -> int:
     row = conn.execute(
         "SELECT MAX(version_number) AS max_version FROM skill_versions WHERE skill_id = ?",
@@ -172,18 +292,32 @@ def next_version_number(conn: sqlite3.Connection, skill_id: int) -> int:
     return int(row["max_version"] or 0) + 1
 
 
-def create_version(
+def _insert_version_row(
     conn: sqlite3.Connection,
-    *,
     skill_id: int,
-    files: Iterable[SkillFile],
     status: str,
-    summary: str | None = None,
-    published: bool = False,
+    summary: str | None,
+    created_at: str,
+    published_at: str | None,
 ) -> int:
+    if HAS_RETURNING:
+        row = conn.execute(
+            """
+            INSERT INTO skill_versions (
+                skill_id, version_number, status, summary, created_at, published_at
+            )
+            VALUES (
+                ?,
+                (SELECT COALESCE(MAX(version_number), 0) + 1
+                 FROM skill_versions WHERE skill_id = ?),
+                ?, ?, ?, ?
+            )
+            RETURNING id
+            """,
+            (skill_id, skill_id, status, summary, created_at, published_at),
+        ).fetchone()
+        return int(row["id"])
     version_number = next_version_number(conn, skill_id)
-    created_at = utc_now()
-    published_at = created_at if published else None
     cursor = conn.execute(
         """
         INSERT INTO skill_versions (
@@ -193,33 +327,80 @@ def create_version(
         """,
         (skill_id, version_number, status, summary, created_at, published_at),
     )
-    version_id = int(cursor.lastrowid)
+    return int(cursor.lastrowid)
+
+
+def _collect_file_rows(
+    version_id: int,
+    files: Iterable[SkillFile],
+    created_at: str,
+    blob_rows: list[tuple],
+    file_rows: list[tuple],
+) -> None:
     for skill_file in files:
         if skill_file.is_binary:
-            content_blob = (
+            data = (
                 skill_file.content
                 if isinstance(skill_file.content, bytes)
                 else base64.b64decode(skill_file.content)
             )
-            conn.execute(
-                """
-                INSERT INTO skill_files (
-                    skill_version_id, path, content_blob, is_binary, encoding, created_at
-                )
-                VALUES (?, ?, ?, 1, 'base64', ?)
-                """,
-                (version_id, skill_file.path, content_blob, created_at),
-            )
+            encoding = "base64"
         else:
-            conn.execute(
-                """
-                INSERT INTO skill_files (
-                    skill_version_id, path, content_text, is_binary, encoding, created_at
-                )
-                VALUES (?, ?, ?, 0, 'utf-8', ?)
-                """,
-                (version_id, skill_file.path, str(skill_file.content), created_at),
+            data = str(skill_file.content).encode("utf-8")
+            encoding = "utf-8"
+        digest = hashlib.sha256(data).digest()
+        blob_rows.append((digest, data))
+        file_rows.append(
+            (
+                version_id,
+                skill_file.path,
+                int(skill_file.is_binary),
+                encoding,
+                created_at,
+                digest,
             )
+        )
+
+
+def _insert_file_rows(
+    conn: sqlite3.Connection, blob_rows: list[tuple], file_rows: list[tuple]
+) -> None:
+    if not file_rows:
+        return
+    conn.executemany(
+        "INSERT OR IGNORE INTO blob_store (hash, data) VALUES (?, ?)",
+        blob_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO skill_files (
+            skill_version_id, path, is_binary, encoding, created_at, content_hash
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        file_rows,
+    )
+
+
+def create_version(
+    conn: sqlite3.Connection,
+    *,
+    skill_id: int,
+    files: Iterable[SkillFile],
+    status: str,
+    summary: str | None = None,
+    published: bool = False,
+) -> int:
+    created_at = utc_now()
+    published_at = created_at if published else None
+    with _atomic(conn, "create_version"):
+        version_id = _insert_version_row(
+            conn, skill_id, status, summary, created_at, published_at
+        )
+        blob_rows: list[tuple] = []
+        file_rows: list[tuple] = []
+        _collect_file_rows(version_id, files, created_at, blob_rows, file_rows)
+        _insert_file_rows(conn, blob_rows, file_rows)
     return version_id
 
 
@@ -227,14 +408,15 @@ def publish_version(
     conn: sqlite3.Connection, skill_id: int, version_id: int
 ) -> None:
     published_at = utc_now()
-    conn.execute(
-        "UPDATE skill_versions SET status = ?, published_at = ? WHERE id = ?",
-        ("published", published_at, version_id),
-    )
-    conn.execute(
-        "UPDATE skills SET current_published_version_id = ?, updated_at = ? WHERE id = ?",
-        (version_id, published_at, skill_id),
-    )
+    with _atomic(conn, "publish_version"):
+        conn.execute(
+            "UPDATE skill_versions SET status = ?, published_at = ? WHERE id = ?",
+            ("published", published_at, version_id),
+        )
+        conn.execute(
+            "UPDATE skills SET current_published_version_id = ?, updated_at = ? WHERE id = ?",
+            (version_id, published_at, skill_id),
+        )
 
 
 def fetch_skill_versions(conn: sqlite3.Connection, skill_id: int) -> list[sqlite3.Row]:
@@ -254,58 +436,138 @@ def fetch_version_files(
 ) -> list[sqlite3.Row]:
     return conn.execute(
         """
-        SELECT path, content_text, content_blob, is_binary, encoding
-        FROM skill_files
-        WHERE skill_version_id = ?
-        ORDER BY path
+        SELECT
+            f.path,
+            COALESCE(
+                f.content_text,
+                CASE WHEN f.is_binary = 0 THEN CAST(b.data AS TEXT) END
+            ) AS content_text,
+            COALESCE(
+                f.content_blob,
+                CASE WHEN f.is_binary = 1 THEN b.data END
+            ) AS content_blob,
+            f.is_binary,
+            f.encoding
+        FROM skill_files f
+        LEFT JOIN blob_store b ON b.hash = f.content_hash
+        WHERE f.skill_version_id = ?
+        ORDER BY f.path
         """,
         (version_id,),
     ).fetchall()
 
 
-def decode_skill_file(row: sqlite3.Row) -> SkillFile:
-    if row["is_binary"]:
-        return SkillFile(
-            path=row["path"],
-            content=bytes(row["content_blob"] or b""),
-            is_binary=True,
-        )
-    return SkillFile(path=row["path"], content=row["content_text"] or "", is_binary=False)
+def fetch_version_file_index(
+    conn: sqlite3.Connection, version_id: int
+) -> list[sqlite3.Row]:
+    """List a version's files with their sizes, without loading any contents."""
+    return conn.execute(
+        """
+        SELECT
+            f.path,
+            f.is_binary,
+            COALESCE(
+                length(f.content_blob),
+                length(CAST(f.content_text AS BLOB)),
+                length(b.data)
+            ) AS size,
+            f.encoding
+        FROM skill_files f
+        LEFT JOIN blob_store b ON b.hash = f.content_hash
+        WHERE f.skill_version_id = ?
+        ORDER BY f.path
+        """,
+        (version_id,),
+    ).fetchall()
 
 
-def seed_skills_from_filesystem(skills_dir: Path, db_path: Path | None = None) -> None:
-    with connect(db_path) as conn:
+def fetch_one_file_blob(
+    conn: sqlite3.Connection, version_id: int, path: str
+) -> bytes | None:
+    """Load one file's raw bytes (UTF-8 for text files), or None if missing."""
+    row = conn.execute(
+        """
+        SELECT COALESCE(f.content_blob, CAST(f.content_text AS BLOB), b.data)
+        FROM skill_files f
+        LEFT JOIN blob_store b ON b.hash = f.content_hash
+        WHERE f.skill_version_id = ? AND f.path = ?
+        """,
+        (version_id, path),
+    ).fetchone()
+    if row is None:
+        return None
+    return bytes(row[0] or b"")
+
+
+def seed_skills_from_filesystem(
+    skills_dir: Path,
+    db_path: Path | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> list[str]:
+    """
+    Seed every skill folder that has no versions yet, in one transaction.
+
+    Each skill runs inside its own savepoint; a skill that fails to load or
+    insert is rolled back and skipped without losing the rest of the batch.
+    File rows for all skills are inserted together at the end, and ANALYZE
+    runs afterwards if anything was seeded.
+
+    Returns the names of the skills that were skipped because of an error.
+    """
+    conn = conn or get_conn(db_path)
+    failed: list[str] = []
+    seeded = 0
+    blob_rows: list[tuple] = []
+    file_rows: list[tuple] = []
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
         for skill_dir in skills_dir.iterdir():
             if not skill_dir.is_dir():
                 continue
-            skill_id = upsert_skill(conn, skill_dir.name)
-            existing = conn.execute(
-                "SELECT COUNT(*) AS count FROM skill_versions WHERE skill_id = ?",
-                (skill_id,),
-            ).fetchone()
-            if existing and existing["count"]:
+            if skill_has_versions(conn, skill_dir.name):
                 continue
-            files = load_skill_files(skill_dir)
-            version_id = create_version(
-                conn,
-                skill_id=skill_id,
-                files=files,
-                status="published",
-                summary="Seeded from filesystem",
-                published=True,
-            )
-            publish_version(conn, skill_id, version_id)
+            try:
+                with _atomic(conn, "seed_skill"):
+                    files = load_skill_files(skill_dir)
+                    skill_id = upsert_skill(conn, skill_dir.name)
+                    created_at = utc_now()
+                    version_id = _insert_version_row(
+                        conn,
+                        skill_id,
+                        "published",
+                        "Seeded from filesystem",
+                        created_at,
+                        created_at,
+                    )
+                    publish_version(conn, skill_id, version_id)
+                    skill_blobs: list[tuple] = []
+                    skill_files: list[tuple] = []
+                    _collect_file_rows(
+                        version_id, files, created_at, skill_blobs, skill_files
+                    )
+            except (OSError, UnicodeDecodeError, sqlite3.Error):
+                failed.append(skill_dir.name)
+                continue
+            seeded += 1
+            blob_rows.extend(skill_blobs)
+            file_rows.extend(skill_files)
+        _insert_file_rows(conn, blob_rows, file_rows)
+    if seeded:
+        # Refresh planner statistics once the tables hold real data
+        conn.execute("ANALYZE")
+    return failed
 
 
 def write_version_to_filesystem(
     conn: sqlite3.Connection, version_id: int, destination: Path
 ) -> None:
-    files = fetch_version_files(conn, version_id)
-    for row in files:
-        skill_file = decode_skill_file(row)
-        target_path = destination / skill_file.path
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        if skill_file.is_binary:
-            target_path.write_bytes(skill_file.content)  # type: ignore[arg-type]
-        else:
-            target_path.write_text(str(skill_file.content), encoding="utf-8")
+    # Contents are loaded one file at a time so peak memory is one file
+    seen_dirs: set[Path] = set()
+    for row in fetch_version_file_index(conn, version_id):
+        target_path = destination / row["path"]
+        parent = target_path.parent
+        if parent not in seen_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            seen_dirs.add(parent)
+        data = fetch_one_file_blob(conn, version_id, row["path"])
+        write_file(str(target_path), data or b"")
@@ -16,15 +16,145 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import shutil
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+from core.utils import copy_file
+
+
+try:
+    import ahocorasick
+except ImportError:
+    # Fall back to the regex alternation below
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module
+    orjson = None
 
 SKILLS_DIR = Path(__file__).parent / "skills"
 
 
+def _dumps(data) -> bytes:
+    """Serialize _meta.json content to indented UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse JSON straight from file bytes."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Keywords used to derive tags from SKILL.md content
+_KEYWORDS = [
+    'React', 'Vue', 'Angular', 'Svelte',
+    'TypeScript', 'JavaScript', 'Python', 'Rust', 'Go',
+    'Three.js', 'WebGL', 'Canvas', 'SVG',
+    'multiplayer', 'networking', 'sync', 'websocket',
+    'physics', 'collision', 'gravity',
+    'validation', 'form', 'input',
+    'accessibility', 'a11y', 'WCAG', 'ARIA',
+    'performance', 'optimization', 'caching',
+    'security', 'authentication', 'authorization',
+    'testing', 'jest', 'vitest', 'cypress',
+]
+
+# One alternation so the content is scanned once for every keyword
+_ALL_KEYWORDS_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _KEYWORDS)) + r')\b', re.IGNORECASE
+)
+
+# The keywords are plain literals, so a multi-string automaton over the
+# lowercased content finds them all in one linear pass
+if ahocorasick:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword.lower(), _keyword.lower())
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+# Code patterns whose names become sub-skill triggers
+_TRIGGER_RES = [
+    re.compile(r'class\s+(\w+)'),
+    re.compile(r'function\s+(\w+)'),
+    re.compile(r'const\s+(\w+)\s*='),
+    re.compile(r'interface\s+(\w+)'),
+]
+# The same patterns as (keyword, needs "=" after the name) for _scan_names
+_TRIGGER_KEYWORDS = (("class", False), ("function", False), ("const", True), ("interface", False))
+# Below this size the substring scan beats running the trigger regexes
+SMALL_DOC_CHARS = 4096
+
+# First paragraph after the first line: skip blank and heading lines, then
+# take consecutive lines that are neither blank nor headings
+_DESCRIPTION_RE = re.compile(
+    r'\n(?:[^\S\n]*(?:#[^\n]*)?\n)*'
+    r'([^\S\n]*[^\s#][^\n]*(?:\n[^\S\n]*[^\s#][^\n]*)*)'
+)
+
+MAX_TRIGGERS = 10
+MAX_TAGS = 10
+
+# (subdir, suffixes) copied alongside SKILL.md; DOC_SPECS skips the .js scripts
+FOLDER_SPECS = (("references", (".md",)), ("scripts", (".md", ".js")))
+DOC_SPECS = (("references", (".md",)), ("scripts", (".md",)))
+
+_HEADING_RE = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+_CLEAN_RE = re.compile(r'[^\w\s-]')
+
+# Spaces and underscores in skill names become dashes, then runs collapse
+_NAME_TRANS = str.maketrans({' ': '-', '_': '-'})
+_DASHES_RE = re.compile(r'-+')
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def find_keywords(content: str, limit: int = None) -> list[str]:
+    """Return the lowercased tag keywords that appear as whole words in content.
+
+    Keywords come back in first-seen order, and scanning stops once limit
+    distinct keywords have been found.
+    """
+    # dict keys dedupe while keeping discovery order
+    keywords = {}
+    text = content.lower()
+    # Lowercasing a few characters (such as U+0130) changes the string
+    # length, and boundary checks on the result would no longer line up
+    if _KEYWORD_AUTOMATON is None or len(text) != len(content):
+        for match in _ALL_KEYWORDS_RE.finditer(content):
+            keywords[match.group(1).lower()] = None
+            if len(keywords) == limit:
+                break
+        return list(keywords)
+
+    last = len(text) - 1
+    for end, keyword in _KEYWORD_AUTOMATON.iter(text):
+        start = end - len(keyword) + 1
+        # Same word boundaries as the \b anchors in the regex fallback
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        keywords[keyword] = None
+        if len(keywords) == limit:
+            break
+    return list(keywords)
+
+
 def extract_metadata_from_skill_md(content: str, skill_name: str) -> dict:
     """Extract metadata from SKILL.md content."""
     meta = {
@@ -34,148 +164,294 @@ def extract_metadata_from_skill_md(content: str, skill_name: str) -> dict:
         "sub_skills": []
     }
 
-    lines = content.split('\n')
-
-    # Extract title as part of description
-    for line in lines:
-        if line.startswith('# '):
-            title = line[2:].strip()
-            break
-
-    # Extract description from first paragraph after title
-    in_description = False
+    # Extract description from first paragraph after the first line
     description_lines = []
-    for line in lines[1:]:
-        stripped = line.strip()
-        if not stripped:
-            if in_description:
-                break
-            continue
-        if stripped.startswith('#'):
-            if in_description:
-                break
-            continue
-        in_description = True
-        description_lines.append(stripped)
+    first_newline = content.find('\n')
+    if first_newline != -1:
+        match = _DESCRIPTION_RE.match(content, first_newline)
+        if match:
+            description_lines = [line.strip() for line in match.group(1).split('\n')]
 
     meta["description"] = ' '.join(description_lines)[:200]
 
     # Extract tags from content keywords
-    keywords = set()
-    keyword_patterns = [
-        r'\b(React|Vue|Angular|Svelte)\b',
-        r'\b(TypeScript|JavaScript|Python|Rust|Go)\b',
-        r'\b(Three\.js|WebGL|Canvas|SVG)\b',
-        r'\b(multiplayer|networking|sync|websocket)\b',
-        r'\b(physics|collision|gravity)\b',
-        r'\b(validation|form|input)\b',
-        r'\b(accessibility|a11y|WCAG|ARIA)\b',
-        r'\b(performance|optimization|caching)\b',
-        r'\b(security|authentication|authorization)\b',
-        r'\b(testing|jest|vitest|cypress)\b',
+    meta["tags"] = find_keywords(content, limit=MAX_TAGS)
+
+    return meta
+
+
+def _list_files(directory: Path, suffixes: tuple[str, ...]) -> list[os.DirEntry]:
+    """Files directly inside directory ending with one of the suffixes, like glob()."""
+    with os.scandir(directory) as it:
+        return [entry for entry in it if entry.name.endswith(suffixes) and entry.is_file()]
+
+
+def _find_file(root: Path, name: str) -> str | None:
+    """Breadth-first search below root for a file called name, like rglob()."""
+    pending = [str(root)]
+    while pending:
+        subdirs = []
+        for directory in pending:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name == name and entry.is_file():
+                            return entry.path
+            except OSError:
+                continue
+        pending = subdirs
+    return None
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _doc_name(folder: str, file_name: str) -> str:
+    name = Path(file_name).stem
+    if folder == "scripts":
+        name = name.replace('.js', '').replace('.ts', '')
+    return name
+
+
+def build_sub_skills(docs: list[tuple[str, str, str]]) -> list[dict]:
+    """Generate sub_skills metadata from (name, content, file) tuples."""
+    return [
+        {
+            "name": name,
+            "file": file,
+            "triggers": extract_triggers(content, name),
+        }
+        for name, content, file in docs
     ]
 
-    for pattern in keyword_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        keywords.update(m.lower() for m in matches)
 
-    meta["tags"] = list(keywords)[:10]
+def _copy_doc(data: bytes, target: Path, folder: str, docs: list) -> None:
+    """Write a copied .md doc and remember its content for sub_skills."""
+    target.write_bytes(data)
+    docs.append((
+        _doc_name(folder, target.name),
+        data.decode("utf-8", errors="ignore"),
+        f"{folder}/{target.name}",
+    ))
 
-    return meta
 
+def _mirror_subdirs(source_dir: Path, target_dir: Path, specs: tuple, verbose: bool = True) -> list:
+    """Copy each (folder, suffixes) subdir of source_dir into target_dir.
+
+    .md docs are copied first and returned as (name, content, file) tuples
+    for sub_skills; any other matching files are copied as-is afterwards.
+    """
+    docs = []
+    for folder, suffixes in specs:
+        folder_source = os.path.join(source_dir, folder)
+        if not os.path.isdir(folder_source):
+            continue
+        folder_target = target_dir / folder
+        folder_target.mkdir(exist_ok=True)
+        files = _list_files(folder_source, suffixes)
+        for doc_file in files:
+            if doc_file.name.endswith(".md"):
+                _copy_doc(_read_bytes(doc_file.path), folder_target / doc_file.name, folder, docs)
+                if verbose:
+                    print(f"  Copied {folder}/{doc_file.name}")
+        for other_file in files:
+            if not other_file.name.endswith(".md"):
+                copy_file(other_file.path, str(folder_target / other_file.name))
+                if verbose:
+                    print(f"  Copied {folder}/{other_file.name}")
+    return docs
+
+
+def _scan_names(content: str, keyword: str, needs_equals: bool, limit: int = 3) -> list[str]:
+    """str.find version of the _TRIGGER_RES patterns: the names after keyword."""
+    names = []
+    size = len(content)
+    idx = content.find(keyword)
+    while idx != -1 and len(names) < limit:
+        pos = idx + len(keyword)
+        # keyword\s+(\w+), plus \s*= for const
+        ws = pos
+        while ws < size and content[ws].isspace():
+            ws += 1
+        end = ws
+        while end < size and _is_word_char(content[end]):
+            end += 1
+        if ws > pos and end > ws:
+            stop = end
+            if needs_equals:
+                while stop < size and content[stop].isspace():
+                    stop += 1
+                if stop < size and content[stop] == '=':
+                    stop += 1
+                else:
+                    stop = -1
+            if stop != -1:
+                names.append(content[ws:end])
+                idx = content.find(keyword, stop)
+                continue
+        idx = content.find(keyword, idx + 1)
+    return names
 
-def find_references(source_dir: Path) -> list[dict]:
-    """Find reference files and generate sub_skills metadata."""
-    sub_skills = []
 
-    # Check for references directory
-    refs_dir = source_dir / "references"
-    if refs_dir.exists():
-        for ref_file in refs_dir.glob("*.md"):
-            name = ref_file.stem
-            content = ref_file.read_text(encoding="utf-8", errors="ignore")
+def extract_triggers(content: str, name: str) -> list[str]:
+    """Extract up to 10 unique trigger words from content, in discovery order."""
+    # dict keys keep first-seen order, unlike a set
+    triggers = {name: None}
+
+    # Look for code patterns (first three matches of each); small docs skip
+    # the regex engine and use plain substring scans
+    if len(content) < SMALL_DOC_CHARS:
+        found = (_scan_names(content, keyword, needs_equals) for keyword, needs_equals in _TRIGGER_KEYWORDS)
+    else:
+        found = ([m.group(1) for m in islice(pattern.finditer(content), 3)] for pattern in _TRIGGER_RES)
+    for names in found:
+        for trigger in names:
+            triggers[trigger] = None
+        if len(triggers) >= MAX_TRIGGERS:
+            return list(triggers)[:MAX_TRIGGERS]
 
-            # Extract triggers from content
-            triggers = extract_triggers(content, name)
+    # Look for headings as triggers
+    for match in islice(_HEADING_RE.finditer(content), 5):
+        # Clean heading
+        clean = _CLEAN_RE.sub('', match.group(1)).strip()
+        if len(clean) > 3 and len(clean) < 30:
+            triggers[clean] = None
+            if len(triggers) >= MAX_TRIGGERS:
+                break
 
-            sub_skills.append({
-                "name": name,
-                "file": f"references/{ref_file.name}",
-                "triggers": triggers
-            })
+    return list(triggers)[:MAX_TRIGGERS]
 
-    # Check for scripts directory (treat .md files as references)
-    scripts_dir = source_dir / "scripts"
-    if scripts_dir.exists():
-        for script_file in scripts_dir.glob("*.md"):
-            name = script_file.stem.replace('.js', '').replace('.ts', '')
-            content = script_file.read_text(encoding="utf-8", errors="ignore")
 
-            triggers = extract_triggers(content, name)
+def _normalize_skill_name(skill_name: str) -> str:
+    return _DASHES_RE.sub('-', skill_name.lower().translate(_NAME_TRANS)).strip('-')
 
-            sub_skills.append({
-                "name": name,
-                "file": f"scripts/{script_file.name}",
-                "triggers": triggers
-            })
 
-    return sub_skills
+def _write_meta(target_dir: Path, skill_content: str, skill_name: str, docs: list) -> None:
+    """
+    Generate _meta.json for a migrated skill from the docs copied into it.
 
+    The file is left untouched when it already holds exactly this
+    metadata, so re-running a migration doesn't rewrite it or bump its
+    mtime. Only schema keys are written: the TypeScript server rejects
+    any others.
+    """
+    meta = extract_metadata_from_skill_md(skill_content, skill_name)
+    meta["sub_skills"] = build_sub_skills(docs)
+    data = _dumps(meta)
 
-def extract_triggers(content: str, name: str) -> list[str]:
-    """Extract trigger words from content."""
-    triggers = [name]
-
-    # Look for code patterns
-    patterns = [
-        (r'class\s+(\w+)', 'class'),
-        (r'function\s+(\w+)', 'function'),
-        (r'const\s+(\w+)\s*=', 'const'),
-        (r'interface\s+(\w+)', 'interface'),
+    meta_path = target_dir / "_meta.json"
+    try:
+        if meta_path.read_bytes() == data:
+            print("  _meta.json is up to date")
+            return
+    except OSError:
+        pass
+
+    meta_path.write_bytes(data)
+    print(f"  Generated _meta.json with {len(meta['sub_skills'])} sub-skills")
+
+
+def _archive_members(names: list[str], prefix: str, folder: str, suffixes: tuple[str, ...]) -> list[str]:
+    """Archive files directly inside prefix/folder/ with one of the suffixes, like glob()."""
+    folder_prefix = f"{prefix}{folder}/"
+    return [
+        name for name in names
+        if name.startswith(folder_prefix)
+        and '/' not in name[len(folder_prefix):]
+        and name.endswith(suffixes)
     ]
 
-    for pattern, _ in patterns:
-        matches = re.findall(pattern, content)
-        triggers.extend(matches[:3])
 
-    # Look for headings as triggers
-    headings = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
-    for heading in headings[:5]:
-        # Clean heading
-        clean = re.sub(r'[^\w\s-]', '', heading).strip()
-        if len(clean) > 3 and len(clean) < 30:
-            triggers.append(clean)
+def _stream_member(zf: zipfile.ZipFile, name: str, target: Path) -> None:
+    with zf.open(name) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+
 
-    return list(set(triggers))[:10]
+# macOS Finder adds AppleDouble copies of every zipped file under this folder
+_MACOS_METADATA_DIR = "__MACOSX/"
+
+_UNSAFE_PARTS = ('', '.', '..')
+
+
+def _is_safe_member(name: str) -> bool:
+    """True for a relative archive file path with no empty, '.' or '..' parts."""
+    return all(part not in _UNSAFE_PARTS for part in name.split('/'))
 
 
 def migrate_skill_archive(archive_path: Path, target_name: str = None) -> Path:
-    """Migrate a .skill ZIP archive."""
+    """Migrate a .skill ZIP archive, streaming only the needed members."""
     print(f"Migrating skill archive: {archive_path}")
 
-    # Extract to temp directory
-    temp_dir = Path(__file__).parent / "_temp_extract"
-    temp_dir.mkdir(exist_ok=True)
-
-    try:
-        with zipfile.ZipFile(archive_path, 'r') as zf:
-            zf.extractall(temp_dir)
-
-        # Find the skill directory (usually the first directory in the archive)
-        extracted_dirs = [d for d in temp_dir.iterdir() if d.is_dir()]
-        if extracted_dirs:
-            source_dir = extracted_dirs[0]
-            skill_name = target_name or source_dir.name.replace('-skill', '')
+    with zipfile.ZipFile(archive_path, 'r') as zf:
+        # Directory entries end in '/' and so have an empty last part;
+        # absolute or '..' members would be written outside SKILLS_DIR
+        names = [
+            name for name in zf.namelist()
+            if _is_safe_member(name) and not name.startswith(_MACOS_METADATA_DIR)
+        ]
+
+        # The skill directory is usually the top-level directory in the archive
+        top_dirs = sorted({name.split('/', 1)[0] for name in names if '/' in name})
+        if top_dirs:
+            prefix = top_dirs[0] + '/'
+            skill_name = target_name or top_dirs[0].replace('-skill', '')
         else:
-            # Files extracted directly
-            source_dir = temp_dir
+            # Files stored at the archive root
+            prefix = ''
             skill_name = target_name or archive_path.stem.replace('-skill', '').replace('.skill', '')
 
-        return migrate_skill_folder(source_dir, skill_name)
-
-    finally:
-        # Cleanup temp directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        skill_name = _normalize_skill_name(skill_name)
+        if skill_name in _UNSAFE_PARTS:
+            print(f"  Warning: Invalid skill name {skill_name!r} for {archive_path}")
+            return None
+        print(f"Migrating skill folder: {archive_path}:{prefix} -> {skill_name}")
+
+        # Find SKILL.md, falling back to the shallowest one in a subdirectory
+        skill_md = prefix + "SKILL.md"
+        if skill_md not in names:
+            nested = [name for name in names if name.startswith(prefix) and name.endswith('/SKILL.md')]
+            if not nested:
+                print(f"  Warning: No SKILL.md found in {archive_path}")
+                return None
+            skill_md = min(nested, key=lambda name: (name.count('/'), name))
+            prefix = skill_md[:-len("SKILL.md")]
+
+        # Only created once the archive is known to hold a skill
+        target_dir = SKILLS_DIR / skill_name
+        if not target_dir.resolve().is_relative_to(SKILLS_DIR.resolve()):
+            print(f"  Warning: {skill_name!r} is outside {SKILLS_DIR}")
+            return None
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        # Copy SKILL.md
+        skill_content = zf.read(skill_md).decode("utf-8", errors="ignore")
+        (target_dir / "SKILL.md").write_text(skill_content, encoding="utf-8")
+        print(f"  Copied SKILL.md")
+
+        # Copy references and scripts (.md docs plus .js for reference)
+        docs = []
+        for folder, suffixes in FOLDER_SPECS:
+            members = _archive_members(names, prefix, folder, suffixes)
+            if not members:
+                continue
+            folder_target = target_dir / folder
+            folder_target.mkdir(exist_ok=True)
+            # .md docs first, matching the order sub_skills are listed in
+            members.sort(key=lambda name: not name.endswith(".md"))
+            for name in members:
+                file_name = name.rsplit('/', 1)[1]
+                if name.endswith(".md"):
+                    _copy_doc(zf.read(name), folder_target / file_name, folder, docs)
+                else:
+                    _stream_member(zf, name, folder_target / file_name)
+                print(f"  Copied {folder}/{file_name}")
+
+    _write_meta(target_dir, skill_content, skill_name, docs)
+    return target_dir
 
 
 def migrate_skill_folder(source_dir: Path, skill_name: str = None) -> Path:
@@ -184,8 +460,7 @@ def migrate_skill_folder(source_dir: Path, skill_name: str = None) -> Path:
     skill_name = skill_name or source_dir.name
 
     # Normalize skill name
-    skill_name = skill_name.lower().replace(' ', '-').replace('_', '-')
-    skill_name = re.sub(r'-+', '-', skill_name).strip('-')
+    skill_name = _normalize_skill_name(skill_name)
 
     print(f"Migrating skill folder: {source_dir} -> {skill_name}")
 
@@ -196,9 +471,9 @@ def migrate_skill_folder(source_dir: Path, skill_name: str = None) -> Path:
     skill_md = source_dir / "SKILL.md"
     if not skill_md.exists():
         # Try to find it in subdirectories
-        skill_mds = list(source_dir.rglob("SKILL.md"))
-        if skill_mds:
-            skill_md = skill_mds[0]
+        found = _find_file(source_dir, "SKILL.md")
+        if found:
+            skill_md = Path(found)
             source_dir = skill_md.parent
 
     if not skill_md.exists():
@@ -210,43 +485,17 @@ def migrate_skill_folder(source_dir: Path, skill_name: str = None) -> Path:
     (target_dir / "SKILL.md").write_text(skill_content, encoding="utf-8")
     print(f"  Copied SKILL.md")
 
-    # Copy references directory
-    refs_source = source_dir / "references"
-    if refs_source.exists():
-        refs_target = target_dir / "references"
-        refs_target.mkdir(exist_ok=True)
-        for ref_file in refs_source.glob("*.md"):
-            shutil.copy2(ref_file, refs_target / ref_file.name)
-            print(f"  Copied references/{ref_file.name}")
-
-    # Copy scripts directory (only .md files for documentation)
-    scripts_source = source_dir / "scripts"
-    if scripts_source.exists():
-        scripts_target = target_dir / "scripts"
-        scripts_target.mkdir(exist_ok=True)
-        for script_file in scripts_source.glob("*.md"):
-            shutil.copy2(script_file, scripts_target / script_file.name)
-            print(f"  Copied scripts/{script_file.name}")
-        # Also copy .js files if they exist (for reference)
-        for script_file in scripts_source.glob("*.js"):
-            shutil.copy2(script_file, scripts_target / script_file.name)
-            print(f"  Copied scripts/{script_file.name}")
-
-    # Generate _meta.json
-    meta = extract_metadata_from_skill_md(skill_content, skill_name)
-    meta["sub_skills"] = find_references(target_dir)
-
-    meta_path = target_dir / "_meta.json"
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
-    print(f"  Generated _meta.json with {len(meta['sub_skills'])} sub-skills")
+    # Copy references and scripts (.md docs plus .js for reference)
+    docs = _mirror_subdirs(source_dir, target_dir, FOLDER_SPECS)
 
+    _write_meta(target_dir, skill_content, skill_name, docs)
     return target_dir
 
 
 def migrate_single_skill_md(skill_md_path: Path, skill_name: str) -> Path:
     """Migrate a single SKILL.md file."""
     skill_md_path = Path(skill_md_path)
-    skill_name = skill_name.lower().replace(' ', '-').replace('_', '-')
+    skill_name = skill_name.lower().translate(_NAME_TRANS)
 
     print(f"Migrating single SKILL.md: {skill_md_path} -> {skill_name}")
 
@@ -258,51 +507,75 @@ def migrate_single_skill_md(skill_md_path: Path, skill_name: str) -> Path:
     (target_dir / "SKILL.md").write_text(skill_content, encoding="utf-8")
 
     # Check for sibling references or scripts directories
-    parent_dir = skill_md_path.parent
-
-    refs_source = parent_dir / "references"
-    if refs_source.exists():
-        refs_target = target_dir / "references"
-        refs_target.mkdir(exist_ok=True)
-        for ref_file in refs_source.glob("*.md"):
-            shutil.copy2(ref_file, refs_target / ref_file.name)
-
-    scripts_source = parent_dir / "scripts"
-    if scripts_source.exists():
-        scripts_target = target_dir / "scripts"
-        scripts_target.mkdir(exist_ok=True)
-        for script_file in scripts_source.glob("*.md"):
-            shutil.copy2(script_file, scripts_target / script_file.name)
-
-    # Generate _meta.json
-    meta = extract_metadata_from_skill_md(skill_content, skill_name)
-    meta["sub_skills"] = find_references(target_dir)
-
-    meta_path = target_dir / "_meta.json"
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    docs = _mirror_subdirs(skill_md_path.parent, target_dir, DOC_SPECS, verbose=False)
 
+    _write_meta(target_dir, skill_content, skill_name, docs)
     return target_dir
 
 
+def _count_sub_skills(skill_dir: Path) -> int | None:
+    meta_file = skill_dir / "_meta.json"
+    if not meta_file.exists():
+        return None
+    meta = _loads(meta_file.read_bytes())
+    return len(meta.get("sub_skills", []))
+
+
+def migrate_batch(batch_dir: Path) -> int:
+    """Migrate every subfolder of batch_dir that has a SKILL.md, one process per skill."""
+    if not batch_dir.is_dir():
+        print(f"Error: Batch source is not a directory: {batch_dir}")
+        return 1
+
+    sources = sorted(d for d in batch_dir.iterdir() if (d / "SKILL.md").is_file())
+    if not sources:
+        print(f"No skill folders with SKILL.md found in {batch_dir}")
+        return 1
+
+    # Skills are independent (separate sources and targets), so they can be
+    # scanned and copied on all cores at once
+    migrated = 0
+    failed = []
+    with ProcessPoolExecutor(max_workers=min(len(sources), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(migrate_skill_folder, d, d.name) for d in sources]
+        # One skill failing doesn't undo the others, so report it and go on
+        for source, future in zip(sources, futures):
+            try:
+                if future.result():
+                    migrated += 1
+            except Exception as e:
+                failed.append(source.name)
+                print(f"Error: Failed to migrate {source.name}: {e}")
+
+    print(f"\nMigrated {migrated} of {len(sources)} skills into {SKILLS_DIR}")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    print("Run 'reload_index' in the MCP server to load the new skills")
+    return 1 if failed else 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Migrate Claude skills to skills-mcp format")
     parser.add_argument("source", nargs="?", help="Path to .skill file, skill folder, or SKILL.md")
     parser.add_argument("--name", "-n", help="Override skill name")
     parser.add_argument("--list", "-l", action="store_true", help="List current skills")
+    parser.add_argument("--batch", "-b", metavar="DIR", help="Migrate every skill folder in DIR in parallel")
 
     args = parser.parse_args()
 
     if args.list:
         print("\nCurrent skills:")
-        for skill_dir in sorted(SKILLS_DIR.iterdir()):
-            if skill_dir.is_dir():
-                meta_file = skill_dir / "_meta.json"
-                if meta_file.exists():
-                    meta = json.loads(meta_file.read_text())
-                    sub_count = len(meta.get("sub_skills", []))
+        skill_dirs = sorted(d for d in SKILLS_DIR.iterdir() if d.is_dir())
+        with ThreadPoolExecutor() as executor:
+            counts = executor.map(_count_sub_skills, skill_dirs)
+            for skill_dir, sub_count in zip(skill_dirs, counts):
+                if sub_count is not None:
                     print(f"  {skill_dir.name}: {sub_count} sub-skills")
         return
 
+    if args.batch:
+        return migrate_batch(Path(args.batch))
+
     if not args.source:
         parser.print_help()
         return 1
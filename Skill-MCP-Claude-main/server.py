@@ -2,12 +2,39 @@
 from fastmcp import FastMCP
 from pathlib import Path
 from datetime import datetime
-from threading import Thread, Lock
+from functools import lru_cache
+from threading import Thread, Lock, Timer
 import json
 import re
 import time
 import logging
-from collections import deque
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from operator import itemgetter
+import heapq
+import mmap
+import os
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    # Fall back to polling file mtimes
+    Observer = None
+    FileSystemEventHandler = object
+
+try:
+    import ahocorasick
+except ImportError:
+    # Fall back to scanning the vocabulary once per query word
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -24,20 +51,26 @@ if not SKILLS_DIR.exists():
     logger.warning(f"Skills directory not found, creating: {SKILLS_DIR}")
     SKILLS_DIR.mkdir(parents=True, exist_ok=True)
 
-_INDEX = None
+_INDEX = None  # Rebound to a freshly built dict on reload, never mutated
 _CONTENT_INDEX = None  # Full-text search index
-_FILE_MTIMES = {}  # For file watching
+_POSTINGS = {}  # Inverted index over _CONTENT_INDEX: token -> {key: count}
+_POSTINGS_SOURCE = None  # The _CONTENT_INDEX dict _POSTINGS was built from
+_VOCAB = None  # (tokens, newline-joined tokens, start offsets) of _POSTINGS
+_FILE_MTIMES = {}  # For file watching when polling
+_PENDING_EVENTS = deque()  # Paths reported by the event-driven watcher
+_RELOAD_TIMER = None
 _USAGE_STATS = {
-    "tool_calls": {},
-    "skill_loads": {},
+    "tool_calls": Counter(),
+    "skill_loads": Counter(),
     "searches": deque(maxlen=100),  # Use deque for efficient size limiting
     "start_time": datetime.now().isoformat()
 }
 
 # Thread synchronization locks
-_INDEX_LOCK = Lock()
+_INIT_LOCK = Lock()  # Serializes the first index build only
 _CONTENT_INDEX_LOCK = Lock()
 _FILE_MTIMES_LOCK = Lock()
+_RELOAD_TIMER_LOCK = Lock()
 _STATS_LOCK = Lock()
 
 # Schema for _meta.json validation
@@ -51,24 +84,62 @@ META_SCHEMA = {
 }
 
 
+def _jloads(raw: bytes):
+    """Parse JSON from file bytes, with orjson when available."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Only allow alphanumeric, hyphens, and underscores. \Z rather than $, which
+# would also accept a trailing newline
+_SAFE_NAME_RE = re.compile(r'[A-Za-z0-9_-]+\Z')
+
+
 def is_safe_skill_name(name: str) -> bool:
     """Validate that a skill name is safe for filesystem operations."""
     if not name or not isinstance(name, str):
         return False
-    # Only allow alphanumeric, hyphens, and underscores
-    return bool(re.match(r'^[a-zA-Z0-9\-_]+$', name))
+    return _SAFE_NAME_RE.match(name) is not None
+
+
+@lru_cache(maxsize=8)
+def _resolve_dir(directory: Path) -> Path:
+    """Resolve SKILLS_DIR once per value instead of on every path check."""
+    return directory.resolve()
 
 
 def validate_skill_path(skill_path: Path) -> bool:
     """Validate that a resolved path is within SKILLS_DIR."""
     try:
-        resolved_path = skill_path.resolve()
-        skills_dir_resolved = SKILLS_DIR.resolve()
-        return str(resolved_path).startswith(str(skills_dir_resolved))
+        # A component-wise check, so /a/skills_evil isn't inside /a/skills
+        return skill_path.resolve().is_relative_to(_resolve_dir(SKILLS_DIR))
     except (OSError, ValueError):
         return False
 
 
+@lru_cache(maxsize=1024)
+def _resolve_skill_path(skills_dir: Path, *parts: str) -> Path | None:
+    """Resolved skills_dir/parts if it stays inside skills_dir, else None.
+
+    Memoized so repeated loads of a skill skip realpath(); the cache is
+    cleared whenever the index is reloaded.
+    """
+    path = skills_dir.joinpath(*parts)
+    return path.resolve() if validate_skill_path(path) else None
+
+
+@lru_cache(maxsize=512)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a skill file; keyed on mtime and size so edits miss the cache."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_skill_text(file: Path) -> str:
+    stat = file.stat()
+    return _read_text_cached(str(file), stat.st_mtime_ns, stat.st_size)
+
+
 def validate_meta(meta: dict, skill_name: str) -> list[str]:
     """Validate _meta.json against schema. Returns list of errors."""
     errors = []
@@ -98,69 +169,330 @@ def validate_meta(meta: dict, skill_name: str) -> list[str]:
     return errors
 
 
+# Threads used to read skill files while building the content index
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Tokens recorded per indexed file for the inverted index
+_TOKEN_RE = re.compile(r'[a-z0-9_]+')
+
+
+# Files above this size are decoded straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_index_text(file: Path, size: int) -> str:
+    """Read a skill file as text for indexing.
+
+    Large files are decoded from a read-only mapping of the page cache
+    instead of first being copied whole into a bytes object.
+    """
+    if size <= MMAP_THRESHOLD:
+        return file.read_text(encoding="utf-8", errors="ignore")
+    with open(file, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Truncated to empty since it was stat'ed
+            return ""
+        with mapped:
+            text = str(mapped, "utf-8", "ignore")
+    # Match read_text's universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _index_file(skill_name: str, rel_file: str, file: Path, previous: dict = None) -> dict:
+    """Build the content index entry for one skill file.
+
+    A previous entry whose mtime and size still match the file is reused
+    as is, skipping the read and lowercasing.
+    """
+    stat = file.stat()
+    if previous and previous["mtime"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+        return previous
+
+    if rel_file == "SKILL.md":
+        sub_skill = None
+    else:
+        folder, _, file_name = rel_file.partition("/")
+        sub_skill = Path(file_name).stem
+        if folder == "scripts":
+            sub_skill = sub_skill.replace('.js', '').replace('.ts', '')
+    # Lowercase with full Unicode rules, then keep the text as UTF-8 bytes:
+    # about half the memory of a non-ASCII str, and since UTF-8 is
+    # self-synchronizing, byte substring search matches str search exactly
+    text = _read_index_text(file, stat.st_size).lower()
+    return {
+        "domain": skill_name,
+        "sub_skill": sub_skill,
+        "file": rel_file,
+        "content": text.encode("utf-8"),
+        "tokens": Counter(_TOKEN_RE.findall(text)),
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size
+    }
+
+
+def _scan_skill(skill_dir: Path) -> tuple[Path | None, list[tuple[str, Path]]]:
+    """One scandir pass over a skill: its _meta.json and the .md files to index.
+
+    The files are (relative file, path) pairs for SKILL.md, references/*.md
+    and scripts/*.md.
+    """
+    meta_file = None
+    skill_file = None
+    folders = {}
+    with os.scandir(skill_dir) as it:
+        for entry in it:
+            if entry.name == "_meta.json":
+                meta_file = Path(entry.path)
+            elif entry.name == "SKILL.md":
+                skill_file = Path(entry.path)
+            elif entry.name in ("references", "scripts") and entry.is_dir():
+                folders[entry.name] = entry.path
+
+    files = [("SKILL.md", skill_file)] if skill_file else []
+    for folder in ("references", "scripts"):
+        if folder in folders:
+            with os.scandir(folders[folder]) as it:
+                files.extend((f"{folder}/{entry.name}", Path(entry.path)) for entry in it if entry.name.endswith(".md"))
+    return meta_file, files
+
+
+def _walk_skills():
+    """Yield (skill_dir, meta_file, files) for every skill, scanning each once."""
+    with os.scandir(SKILLS_DIR) as it:
+        skill_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+    for skill_dir in skill_dirs:
+        meta_file, files = _scan_skill(skill_dir)
+        yield skill_dir, meta_file, files
+
+
+def _index_files(jobs: list[tuple[str, str, Path]], previous: dict) -> dict:
+    """Index (skill name, relative file, path) jobs, reading files on a thread pool.
+
+    File reads release the GIL, so the threads overlap their I/O.
+    """
+    def read_entry(job):
+        skill_name, rel_file, file = job
+        key = f"{skill_name}:{rel_file}"
+        try:
+            return key, _index_file(skill_name, rel_file, file, previous.get(key))
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to read {file}: {e}")
+            return key, None
+
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(jobs))) as executor:
+            entries = list(executor.map(read_entry, jobs))
+    else:
+        entries = [read_entry(job) for job in jobs]
+    return {key: entry for key, entry in entries if entry is not None}
+
+
+def _index_skill(skill_dir: Path, previous: dict = None) -> dict:
+    """Build content index entries for one skill's SKILL.md, references and scripts.
+
+    previous is an existing content index to reuse unchanged entries from.
+    """
+    jobs = [(skill_dir.name, rel_file, file) for rel_file, file in _scan_skill(skill_dir)[1]]
+    return _index_files(jobs, previous or {})
+
+
 def build_content_index() -> dict:
-    """Build full-text search index from skill content."""
-    index = {}
+    """Build full-text search index from skill content.
 
+    Files unchanged since the current index was built (same mtime and
+    size) keep their entries instead of being read again.
+    """
     if not SKILLS_DIR.exists():
         logger.warning(f"Skills directory does not exist: {SKILLS_DIR}")
-        return index
+        return {}
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if not skill_dir.is_dir():
-            continue
+    jobs = [
+        (skill_dir.name, rel_file, file)
+        for skill_dir, _, files in _walk_skills()
+        for rel_file, file in files
+    ]
+    return _index_files(jobs, _CONTENT_INDEX or {})
 
-        skill_name = skill_dir.name
 
-        # Index SKILL.md
-        skill_file = skill_dir / "SKILL.md"
-        if skill_file.exists():
+def _postings_add(key: str, entry: dict):
+    """Add one content index entry to _POSTINGS if it tracks _CONTENT_INDEX."""
+    global _VOCAB
+
+    if _POSTINGS_SOURCE is _CONTENT_INDEX:
+        for token, count in entry["tokens"].items():
+            if token not in _POSTINGS:
+                _POSTINGS[token] = {}
+                _VOCAB = None
+            _POSTINGS[token][key] = count
+
+
+def _postings_remove(key: str, entry: dict):
+    """Remove one content index entry from _POSTINGS if it tracks _CONTENT_INDEX."""
+    global _VOCAB
+
+    if _POSTINGS_SOURCE is _CONTENT_INDEX:
+        for token in entry["tokens"]:
+            docs = _POSTINGS.get(token)
+            if docs is not None:
+                docs.pop(key, None)
+                if not docs:
+                    del _POSTINGS[token]
+                    _VOCAB = None
+
+
+def _get_postings() -> dict:
+    """Return the inverted index for _CONTENT_INDEX, rebuilding it if stale.
+
+    Call with _CONTENT_INDEX_LOCK held.
+    """
+    global _POSTINGS, _POSTINGS_SOURCE, _VOCAB
+
+    if _POSTINGS_SOURCE is not _CONTENT_INDEX:
+        postings = {}
+        for key, entry in (_CONTENT_INDEX or {}).items():
+            for token, count in entry["tokens"].items():
+                postings.setdefault(token, {})[key] = count
+        _POSTINGS = postings
+        _POSTINGS_SOURCE = _CONTENT_INDEX
+        _VOCAB = None
+    return _POSTINGS
+
+
+def _token_word_docs(words: list[str], postings: dict) -> dict[str, set]:
+    """Map each token-character word to the documents with a token containing it.
+
+    Several words are matched in one Aho-Corasick pass over the joined
+    vocabulary instead of one Python loop over the vocabulary per word.
+    Call with _CONTENT_INDEX_LOCK held.
+    """
+    global _VOCAB
+
+    word_docs = {word: set() for word in words}
+    if ahocorasick is None or len(word_docs) < 2:
+        for word, docs in word_docs.items():
+            for token, token_docs in postings.items():
+                if word in token:
+                    docs.update(token_docs)
+        return word_docs
+
+    if _VOCAB is None:
+        tokens = list(postings)
+        starts = []
+        offset = 0
+        for token in tokens:
+            starts.append(offset)
+            offset += len(token) + 1
+        _VOCAB = (tokens, "\n".join(tokens), starts)
+    tokens, text, starts = _VOCAB
+
+    automaton = ahocorasick.Automaton()
+    for word in word_docs:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+
+    # Tokens never contain the newline separator, so every hit lies inside one
+    hit_tokens = {word: set() for word in word_docs}
+    for end, word in automaton.iter(text):
+        hit_tokens[word].add(bisect_right(starts, end) - 1)
+    for word, token_ids in hit_tokens.items():
+        docs = word_docs[word]
+        for token_id in token_ids:
+            docs.update(postings[tokens[token_id]])
+    return word_docs
+
+
+def update_content_index(changed_paths, deleted_paths=()) -> int:
+    """Re-index only the skill files that changed instead of rebuilding.
+
+    Paths may be files or directories anywhere under SKILLS_DIR. A changed
+    path that no longer exists is treated as deleted. Paths that aren't an
+    indexed file (a skill directory, a moved folder, ...) re-index their
+    whole skill. Returns the number of paths applied.
+    """
+    with _CONTENT_INDEX_LOCK:
+        if _CONTENT_INDEX is None:
+            # Nothing built yet; the first get_index() does a full build
+            return 0
+
+        applied = 0
+        paths = [(p, False) for p in changed_paths] + [(p, True) for p in deleted_paths]
+        for path, deleted in paths:
             try:
-                content = skill_file.read_text(encoding="utf-8", errors="ignore").lower()
-                index[f"{skill_name}:SKILL.md"] = {
-                    "domain": skill_name,
-                    "sub_skill": None,
-                    "file": "SKILL.md",
-                    "content": content
-                }
-            except (OSError, UnicodeDecodeError) as e:
-                logger.warning(f"Failed to read {skill_file}: {e}")
-
-        # Index references
-        refs_dir = skill_dir / "references"
-        if refs_dir.exists():
-            for ref_file in refs_dir.glob("*.md"):
-                try:
-                    content = ref_file.read_text(encoding="utf-8", errors="ignore").lower()
-                    index[f"{skill_name}:references/{ref_file.name}"] = {
-                        "domain": skill_name,
-                        "sub_skill": ref_file.stem,
-                        "file": f"references/{ref_file.name}",
-                        "content": content
-                    }
-                except (OSError, UnicodeDecodeError) as e:
-                    logger.warning(f"Failed to read {ref_file}: {e}")
-
-        # Index scripts
-        scripts_dir = skill_dir / "scripts"
-        if scripts_dir.exists():
-            for script_file in scripts_dir.glob("*.md"):
-                try:
-                    content = script_file.read_text(encoding="utf-8", errors="ignore").lower()
-                    index[f"{skill_name}:scripts/{script_file.name}"] = {
-                        "domain": skill_name,
-                        "sub_skill": script_file.stem.replace('.js', '').replace('.ts', ''),
-                        "file": f"scripts/{script_file.name}",
-                        "content": content
-                    }
-                except (OSError, UnicodeDecodeError) as e:
-                    logger.warning(f"Failed to read {script_file}: {e}")
+                parts = Path(path).relative_to(SKILLS_DIR).parts
+            except ValueError:
+                continue
+            if not parts:
+                continue
+
+            skill_name = parts[0]
+            rel_file = "/".join(parts[1:])
+            key = f"{skill_name}:{rel_file}"
+            file = SKILLS_DIR.joinpath(*parts)
+            indexed_file = rel_file == "SKILL.md" or (
+                len(parts) == 3 and parts[1] in ("references", "scripts") and rel_file.endswith(".md")
+            )
+
+            if indexed_file:
+                old_entry = _CONTENT_INDEX.pop(key, None)
+                if old_entry is not None:
+                    _postings_remove(key, old_entry)
+                if not deleted and file.is_file():
+                    try:
+                        _CONTENT_INDEX[key] = _index_file(skill_name, rel_file, file)
+                        _postings_add(key, _CONTENT_INDEX[key])
+                    except (OSError, UnicodeDecodeError) as e:
+                        logger.warning(f"Failed to read {file}: {e}")
+            else:
+                if len(parts) > 2 or (len(parts) == 2 and parts[1] not in ("references", "scripts")):
+                    # Not something the content index covers
+                    continue
+                prefix = f"{skill_name}:"
+                stale = {k: _CONTENT_INDEX.pop(k) for k in [k for k in _CONTENT_INDEX if k.startswith(prefix)]}
+                for stale_key, stale_entry in stale.items():
+                    _postings_remove(stale_key, stale_entry)
+                skill_dir = SKILLS_DIR / skill_name
+                if skill_dir.is_dir():
+                    for new_key, new_entry in _index_skill(skill_dir, stale).items():
+                        _CONTENT_INDEX[new_key] = new_entry
+                        _postings_add(new_key, new_entry)
+            applied += 1
+
+        return applied
+
+
+def _lc(value) -> str:
+    return value.lower() if isinstance(value, str) else ""
 
-    return index
 
+def _add_search_keys(meta: dict):
+    """Attach the lowercased fields _search_skills matches against.
 
-def load_index() -> dict:
-    """Load or rebuild skill index from _meta.json files."""
+    The underscore keys are only read by _search_skills and never emitted.
+    """
+    if not isinstance(meta, dict):
+        return
+    meta["_name_lc"] = _lc(meta.get("name"))
+    meta["_desc_lc"] = _lc(meta.get("description"))
+    tags = meta.get("tags")
+    meta["_tags_lc"] = [_lc(tag) for tag in tags] if isinstance(tags, list) else []
+    sub_skills = meta.get("sub_skills")
+    for sub in sub_skills if isinstance(sub_skills, list) else []:
+        if isinstance(sub, dict):
+            sub["_name_lc"] = _lc(sub.get("name"))
+            triggers = sub.get("triggers")
+            sub["_triggers_lc"] = [_lc(t) for t in triggers] if isinstance(triggers, list) else []
+
+
+def load_index(rebuild_content: bool = True) -> dict:
+    """Load or rebuild skill index from _meta.json files.
+
+    With rebuild_content=False an already built content index is kept, for
+    callers that update it incrementally with update_content_index().
+    """
     global _CONTENT_INDEX
 
     index = {"skills": [], "validation_errors": []}
@@ -169,32 +501,35 @@ def load_index() -> dict:
         logger.error(f"Skills directory does not exist: {SKILLS_DIR}")
         return index
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if skill_dir.is_dir():
-            meta_file = skill_dir / "_meta.json"
-            if meta_file.exists():
-                try:
-                    meta = json.loads(meta_file.read_text(encoding="utf-8"))
-
-                    # Validate schema
-                    errors = validate_meta(meta, skill_dir.name)
-                    if errors:
-                        index["validation_errors"].extend(errors)
-                        logger.warning(f"Validation errors in {skill_dir.name}: {errors}")
-
-                    index["skills"].append(meta)
-                except json.JSONDecodeError as e:
-                    error = f"{skill_dir.name}: Invalid JSON in _meta.json: {e}"
-                    index["validation_errors"].append(error)
-                    logger.error(error)
-                except (OSError, UnicodeDecodeError) as e:
-                    error = f"{skill_dir.name}: Failed to read _meta.json: {e}"
-                    index["validation_errors"].append(error)
-                    logger.error(error)
+    # One walk feeds both the meta index and the content index
+    content_jobs = []
+    for skill_dir, meta_file, files in _walk_skills():
+        content_jobs.extend((skill_dir.name, rel_file, file) for rel_file, file in files)
+        if meta_file:
+            try:
+                meta = _jloads(meta_file.read_bytes())
+
+                # Validate schema
+                errors = validate_meta(meta, skill_dir.name)
+                if errors:
+                    index["validation_errors"].extend(errors)
+                    logger.warning(f"Validation errors in {skill_dir.name}: {errors}")
+
+                _add_search_keys(meta)
+                index["skills"].append(meta)
+            except json.JSONDecodeError as e:
+                error = f"{skill_dir.name}: Invalid JSON in _meta.json: {e}"
+                index["validation_errors"].append(error)
+                logger.error(error)
+            except (OSError, UnicodeDecodeError) as e:
+                error = f"{skill_dir.name}: Failed to read _meta.json: {e}"
+                index["validation_errors"].append(error)
+                logger.error(error)
 
     # Build content index for full-text search
     with _CONTENT_INDEX_LOCK:
-        _CONTENT_INDEX = build_content_index()
+        if rebuild_content or _CONTENT_INDEX is None:
+            _CONTENT_INDEX = _index_files(content_jobs, _CONTENT_INDEX or {})
     logger.info(f"Loaded {len(index['skills'])} skills, indexed {len(_CONTENT_INDEX)} files")
 
     return index
@@ -203,70 +538,83 @@ def load_index() -> dict:
 def get_index() -> dict:
     """Get the current index, reloading if needed."""
     global _INDEX
-    with _INDEX_LOCK:
-        if _INDEX is None:
-            _INDEX = load_index()
-        return _INDEX
+    # Readers take no lock: rebinding _INDEX is atomic, so they see either
+    # the old index or the new one
+    index = _INDEX
+    if index is None:
+        with _INIT_LOCK:
+            if _INDEX is None:
+                _INDEX = load_index()
+            index = _INDEX
+    return index
 
 
 def track_usage(tool_name: str, details: dict = None):
     """Track tool usage for metrics."""
+    details = details or {}
+
+    # A read-modify-write on a dict isn't atomic under the GIL, so only the
+    # counters are updated under the lock
     with _STATS_LOCK:
-        if tool_name not in _USAGE_STATS["tool_calls"]:
-            _USAGE_STATS["tool_calls"][tool_name] = 0
-        _USAGE_STATS["tool_calls"][tool_name] += 1
-
-        if details:
-            if "domain" in details:
-                domain = details["domain"]
-                if domain not in _USAGE_STATS["skill_loads"]:
-                    _USAGE_STATS["skill_loads"][domain] = 0
-                _USAGE_STATS["skill_loads"][domain] += 1
-
-            if "query" in details:
-                _USAGE_STATS["searches"].append({
-                    "query": details["query"],
-                    "timestamp": datetime.now().isoformat()
-                })
-                # Deque automatically limits to maxlen=100
+        tool_calls = _USAGE_STATS["tool_calls"]
+        tool_calls[tool_name] = tool_calls.get(tool_name, 0) + 1
+        if "domain" in details:
+            skill_loads = _USAGE_STATS["skill_loads"]
+            skill_loads[details["domain"]] = skill_loads.get(details["domain"], 0) + 1
+
+    if "query" in details:
+        # deque.append is thread-safe; the deque limits itself to maxlen=100
+        _USAGE_STATS["searches"].append({
+            "query": details["query"],
+            "timestamp": datetime.now().isoformat()
+        })
+
+
+def _scan_mtimes(directory: str, mtimes: dict):
+    """Record the mtime of every file under directory in mtimes, keyed by path.
+
+    Walks with os.scandir so the path strings and file types come straight
+    from the directory listing. Like rglob, doesn't descend into symlinked
+    directories.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError as e:
+        logger.warning(f"Cannot access {directory}: {e}")
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    _scan_mtimes(entry.path, mtimes)
+                elif entry.is_file():
+                    mtimes[entry.path] = entry.stat().st_mtime_ns
+            except OSError as e:
+                logger.warning(f"Cannot access {entry.path}: {e}")
 
 
 def check_for_changes() -> bool:
     """Check if any skill files have changed."""
     global _FILE_MTIMES
 
-    changed = False
     current_mtimes = {}
 
     if not SKILLS_DIR.exists():
         return False
 
     with _FILE_MTIMES_LOCK:
-        for skill_dir in SKILLS_DIR.iterdir():
-            if not skill_dir.is_dir():
-                continue
-
-            for file in skill_dir.rglob("*"):
-                if file.is_file():
-                    try:
-                        mtime = file.stat().st_mtime
-                        current_mtimes[str(file)] = mtime
-
-                        if str(file) in _FILE_MTIMES:
-                            if _FILE_MTIMES[str(file)] != mtime:
-                                changed = True
-                                logger.info(f"File changed: {file}")
-                        else:
-                            # New file
-                            changed = True
-                    except (OSError, PermissionError) as e:
-                        logger.warning(f"Cannot access {file}: {e}")
-                        continue
-
-        # Check for deleted files
-        for old_file in _FILE_MTIMES:
-            if old_file not in current_mtimes:
-                changed = True
+        with os.scandir(SKILLS_DIR) as skill_dirs:
+            for skill_dir in skill_dirs:
+                if skill_dir.is_dir():
+                    _scan_mtimes(skill_dir.path, current_mtimes)
+
+        # Comparing the dicts runs in C; only work out what differs for logging
+        changed = current_mtimes != _FILE_MTIMES
+        if changed:
+            for file in current_mtimes.keys() & _FILE_MTIMES.keys():
+                if current_mtimes[file] != _FILE_MTIMES[file]:
+                    logger.info(f"File changed: {file}")
+            for old_file in _FILE_MTIMES.keys() - current_mtimes.keys():
                 logger.info(f"File deleted: {old_file}")
 
         _FILE_MTIMES = current_mtimes
@@ -274,27 +622,90 @@ def check_for_changes() -> bool:
     return changed
 
 
+# Seconds to wait after the last file event before reloading
+RELOAD_DEBOUNCE = 0.5
+
+# Read-only access events that don't change anything on disk
+_IGNORED_EVENTS = {"opened", "closed_no_write"}
+
+
+def _reload_pending():
+    """Reload the index once for a burst of file events."""
+    global _INDEX
+
+    changed = set()
+    while _PENDING_EVENTS:
+        changed.add(_PENDING_EVENTS.popleft())
+    try:
+        logger.info("Changes detected, reloading index...")
+        new_index = load_index(rebuild_content=False)
+        update_content_index(changed)
+        _resolve_skill_path.cache_clear()
+        _INDEX = new_index
+    except Exception as e:
+        logger.error(f"File watcher error: {e}")
+
+
+def _schedule_reload():
+    """(Re)start the debounce timer so a burst of events reloads once."""
+    global _RELOAD_TIMER
+
+    with _RELOAD_TIMER_LOCK:
+        if _RELOAD_TIMER is not None:
+            _RELOAD_TIMER.cancel()
+        _RELOAD_TIMER = Timer(RELOAD_DEBOUNCE, _reload_pending)
+        _RELOAD_TIMER.daemon = True
+        _RELOAD_TIMER.start()
+
+
+class SkillsEventHandler(FileSystemEventHandler):
+    """Queue changed paths under SKILLS_DIR and schedule a debounced reload."""
+
+    def on_any_event(self, event):
+        if event.event_type in _IGNORED_EVENTS:
+            return
+        _PENDING_EVENTS.append(event.src_path)
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            _PENDING_EVENTS.append(dest_path)
+        _schedule_reload()
+
+
 def file_watcher():
-    """Background thread to watch for file changes."""
+    """Background thread that polls for file changes (no watchdog)."""
     global _INDEX
 
-    logger.info("File watcher started")
+    logger.info("File watcher started (polling)")
     while True:
         try:
             if check_for_changes():
                 logger.info("Changes detected, reloading index...")
                 new_index = load_index()
-                with _INDEX_LOCK:
-                    _INDEX = new_index
+                _resolve_skill_path.cache_clear()
+                _INDEX = new_index
         except Exception as e:
             logger.error(f"File watcher error: {e}")
 
         time.sleep(5)  # Check every 5 seconds
 
 
+def start_file_watcher():
+    """Watch SKILLS_DIR with OS file events, or poll if watchdog is missing."""
+    if Observer is None:
+        watcher = Thread(target=file_watcher, daemon=True)
+        watcher.start()
+        return watcher
+
+    observer = Observer()
+    observer.schedule(SkillsEventHandler(), str(SKILLS_DIR), recursive=True)
+    observer.daemon = True
+    observer.start()
+    logger.info("File watcher started")
+    return observer
+
+
 # Start file watcher in background
-_watcher_thread = Thread(target=file_watcher, daemon=True)
-_watcher_thread.start()
+_watcher_thread = start_file_watcher()
 
 
 # Core functions (testable without MCP)
@@ -314,18 +725,20 @@ def _list_skills() -> dict:
     }
 
 
-def _get_skill(name: str) -> dict:
-    """Load a skill's main SKILL.md content."""
+def _get_skill(name: str, meta: dict = None) -> dict:
+    """Load a skill's main SKILL.md content.
+
+    meta is the skill's index entry when the caller already has it.
+    """
     # Validate skill name to prevent path traversal
     if not is_safe_skill_name(name):
         return {"error": f"Invalid skill name: {name}"}
     
     track_usage("get_skill", {"domain": name})
 
-    skill_dir = SKILLS_DIR / name
-    
     # Validate resolved path is within SKILLS_DIR
-    if not validate_skill_path(skill_dir):
+    skill_dir = _resolve_skill_path(SKILLS_DIR, name)
+    if skill_dir is None:
         return {"error": f"Invalid skill path: {name}"}
     
     skill_file = skill_dir / "SKILL.md"
@@ -334,13 +747,14 @@ def _get_skill(name: str) -> dict:
         return {"error": f"Skill '{name}' not found"}
 
     try:
-        content = skill_file.read_text(encoding="utf-8")
+        content = _read_skill_text(skill_file)
     except (OSError, UnicodeDecodeError) as e:
         logger.error(f"Failed to read skill {name}: {e}")
         return {"error": f"Failed to read skill: {e}"}
 
-    index = get_index()
-    meta = next((s for s in index["skills"] if s["name"] == name), {})
+    if meta is None:
+        index = get_index()
+        meta = next((s for s in index["skills"] if s["name"] == name), {})
 
     return {
         "name": name,
@@ -350,16 +764,20 @@ def _get_skill(name: str) -> dict:
     }
 
 
-def _get_sub_skill(domain: str, sub_skill: str) -> dict:
-    """Load a specific sub-skill's content from a domain."""
+def _get_sub_skill(domain: str, sub_skill: str, meta: dict = None) -> dict:
+    """Load a specific sub-skill's content from a domain.
+
+    meta is the domain's index entry when the caller already has it.
+    """
     # Validate domain name
     if not is_safe_skill_name(domain):
         return {"error": f"Invalid domain name: {domain}"}
     
     track_usage("get_sub_skill", {"domain": domain, "sub_skill": sub_skill})
 
-    index = get_index()
-    meta = next((s for s in index["skills"] if s["name"] == domain), None)
+    if meta is None:
+        index = get_index()
+        meta = next((s for s in index["skills"] if s["name"] == domain), None)
     if not meta:
         return {"error": f"Domain '{domain}' not found"}
 
@@ -367,10 +785,9 @@ def _get_sub_skill(domain: str, sub_skill: str) -> dict:
     if not sub:
         return {"error": f"Sub-skill '{sub_skill}' not found in '{domain}'"}
 
-    file_path = SKILLS_DIR / domain / sub["file"]
-    
     # Validate resolved path is within SKILLS_DIR
-    if not validate_skill_path(file_path):
+    file_path = _resolve_skill_path(SKILLS_DIR, domain, sub["file"])
+    if file_path is None:
         logger.warning(f"Path traversal attempt detected: domain={domain}, file={sub['file']}")
         return {"error": f"Invalid file path"}
     
@@ -378,7 +795,7 @@ def _get_sub_skill(domain: str, sub_skill: str) -> dict:
         return {"error": f"File not found: {sub['file']}"}
 
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = _read_skill_text(file_path)
     except (OSError, UnicodeDecodeError) as e:
         logger.error(f"Failed to read sub-skill {domain}/{sub_skill}: {e}")
         return {"error": f"Failed to read sub-skill: {e}"}
@@ -391,18 +808,56 @@ def _get_sub_skill(domain: str, sub_skill: str) -> dict:
 
 
 def _get_skills_batch(requests: list[dict]) -> dict:
-    """Load multiple skills/sub-skills in a single request."""
+    """Load multiple skills/sub-skills in a single request.
+
+    Each distinct (domain, sub_skill) is loaded once, in parallel, and the
+    results are returned in request order.
+    """
     track_usage("get_skills_batch")
 
-    results = []
-    for req in requests:
+    by_name = {s["name"]: s for s in get_index()["skills"]}
+
+    def load(req):
+        domain, sub_skill = req
+        meta = by_name.get(domain, {}) if isinstance(domain, str) else None
+        if sub_skill:
+            return _get_sub_skill(domain, sub_skill, meta)
+        return _get_skill(domain, meta)
+
+    keys = []
+    unique = {}
+    for i, req in enumerate(requests):
         domain = req.get("domain")
         sub_skill = req.get("sub_skill")
+        # Only plain names are deduplicated; anything else is loaded as is
+        if isinstance(domain, (str, type(None))) and isinstance(sub_skill, (str, type(None))):
+            key = (domain, sub_skill)
+        else:
+            key = i
+        keys.append(key)
+        unique.setdefault(key, (domain, sub_skill))
 
-        if sub_skill:
-            results.append(_get_sub_skill(domain, sub_skill))
+    if len(unique) > 1:
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(unique))) as executor:
+            loaded = dict(zip(unique, executor.map(load, unique.values())))
+    else:
+        loaded = {key: load(req) for key, req in unique.items()}
+
+    results = []
+    seen = set()
+    for key in keys:
+        if key in seen:
+            # Count repeats in the usage stats as if they were loaded again
+            domain, sub_skill = unique[key]
+            if is_safe_skill_name(domain):
+                if sub_skill:
+                    track_usage("get_sub_skill", {"domain": domain, "sub_skill": sub_skill})
+                else:
+                    track_usage("get_skill", {"domain": domain})
+            results.append(dict(loaded[key]))
         else:
-            results.append(_get_skill(domain))
+            seen.add(key)
+            results.append(loaded[key])
 
     return {"results": results}
 
@@ -430,13 +885,13 @@ def _search_skills(query: str, limit: int = 5) -> dict:
         score = 0
         match_type = None
 
-        if query_lower in skill["name"].lower():
+        if query_lower in skill["_name_lc"]:
             score = 0.9
             match_type = "name"
-        elif query_lower in skill["description"].lower():
+        elif query_lower in skill["_desc_lc"]:
             score = 0.7
             match_type = "description"
-        elif any(query_lower in tag.lower() for tag in skill.get("tags", [])):
+        elif any(query_lower in tag for tag in skill["_tags_lc"]):
             score = 0.8
             match_type = "tags"
 
@@ -453,10 +908,10 @@ def _search_skills(query: str, limit: int = 5) -> dict:
             sub_score = 0
             sub_match = None
 
-            if query_lower in sub["name"].lower():
+            if query_lower in sub["_name_lc"]:
                 sub_score = 0.85
                 sub_match = "name"
-            elif any(query_lower in t.lower() for t in sub.get("triggers", [])):
+            elif any(query_lower in t for t in sub["_triggers_lc"]):
                 sub_score = 0.9
                 sub_match = "triggers"
 
@@ -468,8 +923,8 @@ def _search_skills(query: str, limit: int = 5) -> dict:
                     "match": sub_match
                 })
 
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return {"query": query, "results": results[:limit]}
+    # Same order as a stable descending sort, truncated to limit
+    return {"query": query, "results": heapq.nlargest(limit, results, key=itemgetter("score"))}
 
 
 def _search_content(query: str, limit: int = 10) -> dict:
@@ -490,86 +945,132 @@ def _search_content(query: str, limit: int = 10) -> dict:
     
     track_usage("search_content", {"query": query})
 
-    with _CONTENT_INDEX_LOCK:
-        if _CONTENT_INDEX is None:
-            get_index()  # Ensure index is loaded
+    if _CONTENT_INDEX is None:
+        get_index()  # Ensure index is loaded
+
+    # Indexed content is lowercased UTF-8 bytes, so match against bytes too
+    query_lower = query.lower()
+    query_bytes = query_lower.encode("utf-8", "surrogatepass")
+    query_words_bytes = [word.encode("utf-8", "surrogatepass") for word in query_words]
 
-        query_lower = query.lower()
+    with _CONTENT_INDEX_LOCK:
         results = []
+        postings = _get_postings()
+
+        # Documents containing each query word. A word made only of token
+        # characters can only occur inside an indexed token, so scanning the
+        # vocabulary finds exactly the documents a substring check would
+        token_docs = _token_word_docs([w for w in query_words if _TOKEN_RE.fullmatch(w)], postings)
+        word_docs = []
+        for word, word_bytes in zip(query_words, query_words_bytes):
+            if word in token_docs:
+                word_docs.append(token_docs[word])
+            else:
+                word_docs.append({key for key, entry in _CONTENT_INDEX.items() if word_bytes in entry["content"]})
+        # How many query words each candidate contains, counted in C
+        word_hits = Counter()
+        for docs in word_docs:
+            word_hits.update(docs)
 
         for key, entry in _CONTENT_INDEX.items():
+            matches = word_hits.get(key)
+            if not matches:
+                continue
             content = entry["content"]
 
             # Calculate relevance score
             score = 0
 
-            # Exact phrase match (highest priority)
-            if query_lower in content:
-                score = 1.0
-                # Boost for matches in first 500 chars (likely headings/intro)
-                if query_lower in content[:500]:
-                    score = 1.2
-
-            # All words present (medium priority)
-            elif all(word in content for word in query_words):
-                score = 0.7
-                matches = sum(content.count(word) for word in query_words)
-                score += min(matches * 0.05, 0.2)  # Bonus for frequency, capped
+            # All words present; an exact phrase match implies this too
+            if matches == len(query_words):
+                # Exact phrase match (highest priority)
+                phrase_pos = content.find(query_bytes)
+                if phrase_pos != -1:
+                    score = 1.0
+                    # Boost for matches in first 500 chars (likely headings/intro)
+                    if _char_offset(content, phrase_pos + len(query_bytes), 500) <= 500:
+                        score = 1.2
+                # All words present (medium priority)
+                else:
+                    score = 0.7
+                    matches = sum(content.count(word) for word in query_words_bytes)
+                    score += min(matches * 0.05, 0.2)  # Bonus for frequency, capped
 
             # Some words present (lower priority)
             else:
-                matches = sum(1 for word in query_words if word in content)
-                if matches > 0:
-                    score = 0.3 * (matches / len(query_words))
+                score = 0.3 * (matches / len(query_words))
 
-            if score > 0:
-                # Extract snippet around match
-                snippet = extract_snippet(content, query_lower, 150)
+            results.append((round(score, 3), entry))
 
-                results.append({
-                    "domain": entry["domain"],
-                    "sub_skill": entry["sub_skill"],
-                    "file": entry["file"],
-                    "score": round(score, 3),
-                    "snippet": snippet
-                })
+        # Keep the top hits (in stable sort order) and only build their snippets
+        return {"query": query, "results": [
+            {
+                "domain": entry["domain"],
+                "sub_skill": entry["sub_skill"],
+                "file": entry["file"],
+                "score": score,
+                "snippet": extract_snippet(entry["content"], query_lower, 150)
+            }
+            for score, entry in heapq.nlargest(limit, results, key=itemgetter(0))
+        ]}
+
+
+def _char_offset(content: bytes, byte_offset: int, limit: int) -> int:
+    """Character offset of byte_offset in UTF-8 content, or > limit if past it.
+
+    Only decodes when the answer isn't already clear from the byte count,
+    since a character is between one and four bytes.
+    """
+    if byte_offset <= limit or byte_offset > limit * 4:
+        return byte_offset
+    return len(content[:byte_offset].decode("utf-8"))
 
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return {"query": query, "results": results[:limit]}
 
+# Snippets show newlines as spaces
+_NEWLINE_TO_SPACE = bytes.maketrans(b"\n", b" ")
 
-def extract_snippet(content: str, query: str, max_length: int = 150) -> str:
-    """Extract a snippet around the query match."""
-    pos = content.find(query)
+
+def extract_snippet(content: bytes | str, query: str, max_length: int = 150) -> str:
+    """Extract a snippet around the query match.
+
+    content is normally an index entry's UTF-8 bytes; only the few hundred
+    bytes around the match are decoded, never the whole file.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    pos = content.find(query.encode("utf-8", "surrogatepass"))
     if pos == -1:
         # Try finding first query word
         for word in query.split():
-            pos = content.find(word)
+            pos = content.find(word.encode("utf-8", "surrogatepass"))
             if pos != -1:
                 break
 
+    # A character is at most 4 bytes, so each window holds one character
+    # more than the snippet keeps whenever the content has one; that extra
+    # character is what tells us to add "..."
     if pos == -1:
-        return content[:max_length] + "..."
+        return content[:4 * max_length].decode("utf-8", "ignore")[:max_length] + "..."
 
-    start = max(0, pos - 50)
-    end = min(len(content), pos + max_length)
+    before = content[max(0, pos - 4 * 51):pos].translate(_NEWLINE_TO_SPACE).decode("utf-8", "ignore")
+    after = content[pos:pos + 4 * (max_length + 1)].translate(_NEWLINE_TO_SPACE).decode("utf-8", "ignore")
 
-    snippet = content[start:end]
+    snippet = before[-50:] + after[:max_length]
 
-    if start > 0:
+    if len(before) > 50:
         snippet = "..." + snippet
-    if end < len(content):
+    if len(after) > max_length:
         snippet = snippet + "..."
 
-    return snippet.replace('\n', ' ').strip()
+    return snippet.strip()
 
 
 def _reload_index() -> dict:
     """Reload the skill index from disk."""
     global _INDEX
     new_index = load_index()
-    with _INDEX_LOCK:
-        _INDEX = new_index
+    _resolve_skill_path.cache_clear()
+    _INDEX = new_index
     track_usage("reload_index")
     
     with _CONTENT_INDEX_LOCK:
@@ -577,9 +1078,9 @@ def _reload_index() -> dict:
     
     return {
         "status": "reloaded",
-        "skill_count": len(_INDEX["skills"]),
+        "skill_count": len(new_index["skills"]),
         "content_files_indexed": content_count,
-        "validation_errors": _INDEX.get("validation_errors", [])
+        "validation_errors": new_index.get("validation_errors", [])
     }
 
 
@@ -589,8 +1090,8 @@ def _get_stats() -> dict:
     with _STATS_LOCK:
         stats_copy = {
             "uptime_since": _USAGE_STATS["start_time"],
-            "tool_calls": _USAGE_STATS["tool_calls"].copy(),
-            "skill_loads": _USAGE_STATS["skill_loads"].copy(),
+            "tool_calls": dict(_USAGE_STATS["tool_calls"]),
+            "skill_loads": dict(_USAGE_STATS["skill_loads"]),
             "recent_searches": list(_USAGE_STATS["searches"])[-10:],  # Last 10 searches
         }
     
@@ -627,7 +1128,7 @@ def _validate_skills() -> dict:
 
         # Validate meta
         try:
-            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            meta = _jloads(meta_file.read_bytes())
             meta_errors = validate_meta(meta, skill_name)
             errors.extend(meta_errors)
 
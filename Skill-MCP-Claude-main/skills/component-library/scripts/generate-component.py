@@ -6,199 +6,258 @@ Generates boilerplate code for shadcn/ui style components
 
 import os
 import sys
+import json
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 
-def generate_component(name, variant_type="default"):
-    """Generate a React component with shadcn/ui patterns"""
-    
-    # Convert name to proper formats
-    kebab_case = name.lower().replace(" ", "-")
-    pascal_case = "".join(word.capitalize() for word in name.split(" "))
-    
-    # Component template
-    component_template = f'''import * as React from "react"
-import {{ cva, type VariantProps }} from "class-variance-authority"
-import {{ cn }} from "@/lib/utils"
+# Component names are space-separated words; kebab-case swaps spaces for dashes
+_SPACE_TO_DASH = str.maketrans(' ', '-')
 
-const {kebab_case}Variants = cva(
+# Templates are parsed once at import; generate_component fills in
+# ${pascal_case} and ${kebab_case} for each component
+
+# Component template
+_COMPONENT_TPL = Template('''import * as React from "react"
+import { cva, type VariantProps } from "class-variance-authority"
+import { cn } from "@/lib/utils"
+
+const ${kebab_case}Variants = cva(
   "inline-flex items-center justify-center rounded-md text-sm font-medium transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50",
-  {{
-    variants: {{
-      variant: {{
+  {
+    variants: {
+      variant: {
         default: "bg-primary text-primary-foreground hover:bg-primary/90",
         secondary: "bg-secondary text-secondary-foreground hover:bg-secondary/80",
         outline: "border border-input bg-background hover:bg-accent hover:text-accent-foreground",
         ghost: "hover:bg-accent hover:text-accent-foreground",
-      }},
-      size: {{
+      },
+      size: {
         default: "h-10 px-4 py-2",
         sm: "h-9 rounded-md px-3",
         lg: "h-11 rounded-md px-8",
-      }},
-    }},
-    defaultVariants: {{
+      },
+    },
+    defaultVariants: {
       variant: "default",
       size: "default",
-    }},
-  }}
+    },
+  }
 )
 
-export interface {pascal_case}Props
+export interface ${pascal_case}Props
   extends React.HTMLAttributes<HTMLDivElement>,
-    VariantProps<typeof {kebab_case}Variants> {{
+    VariantProps<typeof ${kebab_case}Variants> {
   asChild?: boolean
-}}
+}
 
-const {pascal_case} = React.forwardRef<HTMLDivElement, {pascal_case}Props>(
-  ({{ className, variant, size, asChild = false, ...props }}, ref) => {{
+const ${pascal_case} = React.forwardRef<HTMLDivElement, ${pascal_case}Props>(
+  ({ className, variant, size, asChild = false, ...props }, ref) => {
     const Comp = asChild ? Slot : "div"
     return (
       <Comp
-        className={{cn({kebab_case}Variants({{ variant, size, className }})}}
-        ref={{ref}}
-        {{...props}}
+        className={cn(${kebab_case}Variants({ variant, size, className })}
+        ref={ref}
+        {...props}
       />
     )
-  }}
+  }
 )
-{pascal_case}.displayName = "{pascal_case}"
+${pascal_case}.displayName = "${pascal_case}"
 
-export {{ {pascal_case}, {kebab_case}Variants }}
-'''
+export { ${pascal_case}, ${kebab_case}Variants }
+''')
 
-    # Test template
-    test_template = f'''import {{ render, screen }} from '@testing-library/react'
-import {{ {pascal_case} }} from '@/components/ui/{kebab_case}'
+# Test template
+_TEST_TPL = Template('''import { render, screen } from '@testing-library/react'
+import { ${pascal_case} } from '@/components/ui/${kebab_case}'
 
-describe('{pascal_case}', () => {{
-  it('renders correctly', () => {{
-    render(<{pascal_case}>Test Content</{pascal_case}>)
+describe('${pascal_case}', () => {
+  it('renders correctly', () => {
+    render(<${pascal_case}>Test Content</${pascal_case}>)
     expect(screen.getByText('Test Content')).toBeInTheDocument()
-  }})
+  })
 
-  it('applies variant classes', () => {{
-    const {{ rerender }} = render(<{pascal_case} variant="outline">Content</{pascal_case}>)
+  it('applies variant classes', () => {
+    const { rerender } = render(<${pascal_case} variant="outline">Content</${pascal_case}>)
     const element = screen.getByText('Content')
     expect(element).toHaveClass('border')
     
-    rerender(<{pascal_case} variant="ghost">Content</{pascal_case}>)
+    rerender(<${pascal_case} variant="ghost">Content</${pascal_case}>)
     expect(element).toHaveClass('hover:bg-accent')
-  }})
+  })
 
-  it('applies size classes', () => {{
-    render(<{pascal_case} size="sm">Small</{pascal_case}>)
+  it('applies size classes', () => {
+    render(<${pascal_case} size="sm">Small</${pascal_case}>)
     const element = screen.getByText('Small')
     expect(element).toHaveClass('h-9')
-  }})
+  })
 
-  it('forwards ref', () => {{
+  it('forwards ref', () => {
     const ref = React.createRef<HTMLDivElement>()
-    render(<{pascal_case} ref={{ref}}>Ref Test</{pascal_case}>)
+    render(<${pascal_case} ref={ref}>Ref Test</${pascal_case}>)
     expect(ref.current).toBeInstanceOf(HTMLDivElement)
-  }})
-}})
-'''
-
-    # Story template
-    story_template = f'''import type {{ Meta, StoryObj }} from '@storybook/react'
-import {{ {pascal_case} }} from '@/components/ui/{kebab_case}'
-
-const meta: Meta<typeof {pascal_case}> = {{
-  title: 'UI/{pascal_case}',
-  component: {pascal_case},
-  parameters: {{
+  })
+})
+''')
+
+# Story template
+_STORY_TPL = Template('''import type { Meta, StoryObj } from '@storybook/react'
+import { ${pascal_case} } from '@/components/ui/${kebab_case}'
+
+const meta: Meta<typeof ${pascal_case}> = {
+  title: 'UI/${pascal_case}',
+  component: ${pascal_case},
+  parameters: {
     layout: 'centered',
-  }},
+  },
   tags: ['autodocs'],
-  argTypes: {{
-    variant: {{
+  argTypes: {
+    variant: {
       control: 'select',
       options: ['default', 'secondary', 'outline', 'ghost'],
-    }},
-    size: {{
+    },
+    size: {
       control: 'select',
       options: ['default', 'sm', 'lg'],
-    }},
-  }},
-}}
+    },
+  },
+}
 
 export default meta
 type Story = StoryObj<typeof meta>
 
-export const Default: Story = {{
-  args: {{
-    children: '{pascal_case} Component',
-  }},
-}}
+export const Default: Story = {
+  args: {
+    children: '${pascal_case} Component',
+  },
+}
 
-export const AllVariants: Story = {{
+export const AllVariants: Story = {
   render: () => (
     <div className="flex gap-4 flex-wrap">
-      <{pascal_case} variant="default">Default</{pascal_case}>
-      <{pascal_case} variant="secondary">Secondary</{pascal_case}>
-      <{pascal_case} variant="outline">Outline</{pascal_case}>
-      <{pascal_case} variant="ghost">Ghost</{pascal_case}>
+      <${pascal_case} variant="default">Default</${pascal_case}>
+      <${pascal_case} variant="secondary">Secondary</${pascal_case}>
+      <${pascal_case} variant="outline">Outline</${pascal_case}>
+      <${pascal_case} variant="ghost">Ghost</${pascal_case}>
     </div>
   ),
-}}
+}
 
-export const AllSizes: Story = {{
+export const AllSizes: Story = {
   render: () => (
     <div className="flex gap-4 items-center">
-      <{pascal_case} size="sm">Small</{pascal_case}>
-      <{pascal_case} size="default">Default</{pascal_case}>
-      <{pascal_case} size="lg">Large</{pascal_case}>
+      <${pascal_case} size="sm">Small</${pascal_case}>
+      <${pascal_case} size="default">Default</${pascal_case}>
+      <${pascal_case} size="lg">Large</${pascal_case}>
     </div>
   ),
-}}
-'''
+}
+''')
+
+def generate_component(name, variant_type="default"):
+    """Generate a React component with shadcn/ui patterns"""
+    
+    # Convert name to proper formats
+    kebab_case = name.translate(_SPACE_TO_DASH).lower()
+    pascal_case = "".join(map(str.capitalize, name.split(" ")))
+    names = {'kebab_case': kebab_case, 'pascal_case': pascal_case}
 
     return {
-        'component': component_template,
-        'test': test_template,
-        'story': story_template,
+        'component': _COMPONENT_TPL.substitute(names),
+        'test': _TEST_TPL.substitute(names),
+        'story': _STORY_TPL.substitute(names),
         'kebab_case': kebab_case,
         'pascal_case': pascal_case
     }
 
+def plan_files(templates, output_dir, with_tests=False, with_story=False):
+    """List (kind, path, content) for the component, plus test and story if requested"""
+    output_dir = Path(output_dir)
+    kebab_case = templates['kebab_case']
+    pending = [('component', output_dir / f"{kebab_case}.tsx", templates['component'])]
+
+    if with_tests:
+        test_dir = output_dir.parent / '__tests__' / 'components'
+        pending.append(('test', test_dir / f"{kebab_case}.test.tsx", templates['test']))
+
+    if with_story:
+        pending.append(('story', output_dir / f"{kebab_case}.stories.tsx", templates['story']))
+
+    return pending
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path):
+    """Create path and its parents, once per process"""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+def write_file(kind, path, content):
+    """Write one generated file as UTF-8 bytes, one write() with no text layer"""
+    path.write_bytes(content.encode('utf-8'))
+    return f"✅ Created {kind}: {path}"
+
+def generate_batch(entries):
+    """
+    Generate many components in one process.
+
+    entries is a list of {"name", "output_dir", "with_tests", "with_story"}
+    dicts; only name is required. Each output directory is created once,
+    then all files are written from a thread pool.
+    """
+    pending = []
+    for entry in entries:
+        templates = generate_component(entry['name'])
+        pending += plan_files(
+            templates,
+            entry.get('output_dir', './components/ui'),
+            entry.get('with_tests', False),
+            entry.get('with_story', False),
+        )
+
+    for _, path, _ in pending:
+        _ensure_dir(str(path.parent))
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for line in executor.map(lambda file: write_file(*file), pending):
+            print(line)
+
+    print(f"\n🎉 Successfully generated {len(entries)} components!")
+
 def main():
     parser = argparse.ArgumentParser(description='Generate shadcn/ui style React components')
-    parser.add_argument('name', help='Component name (e.g., "Button" or "Data Table")')
+    parser.add_argument('name', nargs='?', help='Component name (e.g., "Button" or "Data Table")')
     parser.add_argument('--output-dir', default='./components/ui', help='Output directory for component')
     parser.add_argument('--with-tests', action='store_true', help='Generate test file')
     parser.add_argument('--with-story', action='store_true', help='Generate Storybook story')
+    parser.add_argument('--batch', metavar='FILE',
+                        help='Generate every component in a JSON array of {name, output_dir, with_tests, with_story} ("-" reads stdin)')
     
     args = parser.parse_args()
+
+    if args.batch:
+        if args.batch == '-':
+            entries = json.load(sys.stdin)
+        else:
+            with open(args.batch, encoding='utf-8') as f:
+                entries = json.load(f)
+        generate_batch(entries)
+        return
+
+    if not args.name:
+        parser.error('name is required unless --batch is given')
     
     # Generate component files
     templates = generate_component(args.name)
-    
-    # Create output directory if it doesn't exist
-    output_dir = Path(args.output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Write component file
-    component_file = output_dir / f"{templates['kebab_case']}.tsx"
-    with open(component_file, 'w') as f:
-        f.write(templates['component'])
-    print(f"✅ Created component: {component_file}")
-    
-    # Write test file if requested
-    if args.with_tests:
-        test_dir = output_dir.parent / '__tests__' / 'components'
-        test_dir.mkdir(parents=True, exist_ok=True)
-        test_file = test_dir / f"{templates['kebab_case']}.test.tsx"
-        with open(test_file, 'w') as f:
-            f.write(templates['test'])
-        print(f"✅ Created test: {test_file}")
-    
-    # Write story file if requested
-    if args.with_story:
-        story_file = output_dir / f"{templates['kebab_case']}.stories.tsx"
-        with open(story_file, 'w') as f:
-            f.write(templates['story'])
-        print(f"✅ Created story: {story_file}")
+    pending = plan_files(templates, args.output_dir, args.with_tests, args.with_story)
+
+    # Create output directories if they don't exist
+    for _, path, _ in pending:
+        _ensure_dir(str(path.parent))
+
+    for kind, path, content in pending:
+        print(write_file(kind, path, content))
     
     print(f"\n🎉 Successfully generated {templates['pascal_case']} component!")
     print("\nNext steps:")
@@ -2,15 +2,18 @@
 # HTTP API server for managing skills with Claude Code CLI integration
 # Refactored to use shared core module
 
-from flask import Flask, jsonify, request, send_from_directory
+import logging
+import os
+
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from pathlib import Path
 
 from core import (
+    CORS_ORIGINS,
     get_skills_dir,
     get_app_dir,
     find_claude_cli,
-    list_all_skills,
     get_skill_by_name,
     create_skill,
     update_skill,
@@ -23,26 +26,38 @@ from core import (
     generate_skill_with_claude,
     improve_skill_with_claude,
 )
+from core.flask_json import (
+    ERROR_STATUS,
+    CREATE_SKILL_FIELDS,
+    UPDATE_SKILL_FIELDS,
+    IMPORT_FOLDER_FIELDS,
+    IMPORT_FILES_FIELDS,
+    RUN_PROMPT_FIELDS,
+    IMPROVE_SKILL_FIELDS,
+    use_orjson,
+)
+from core.flask_static import cached_skills_response, drop_skills_response, static_file_response
 
 app = Flask(__name__)
+use_orjson(app)
 
-# Security: Restrict CORS to localhost origins only
-CORS(app, origins=[
-    'http://localhost:5050',
-    'http://127.0.0.1:5050',
-    'http://localhost:3000',  # Dev server
-    'http://127.0.0.1:3000',
-], supports_credentials=False)
+# Security: Restrict CORS to localhost origins, and to the API routes only
+CORS(app, resources={r'/api/*': {'origins': CORS_ORIGINS}}, supports_credentials=False)
 
 SKILLS_DIR = get_skills_dir()
 APP_DIR = get_app_dir()
 
+# Debugger and per-request access log only when asked for with FLASK_DEBUG=1
+DEBUG = os.environ.get("FLASK_DEBUG") == "1"
+if not DEBUG:
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
 
 # ============ Static Files ============
 
 @app.route('/')
 def index():
-    return send_from_directory(str(APP_DIR), 'skills-manager.html')
+    return static_file_response(APP_DIR / 'skills-manager.html', 'text/html')
 
 
 # ============ Skills CRUD ============
@@ -50,8 +65,7 @@ def index():
 @app.route('/api/skills', methods=['GET'])
 def api_list_skills():
     """List all skills with their metadata."""
-    skills = list_all_skills()
-    return jsonify({"skills": skills})
+    return cached_skills_response(app)
 
 
 @app.route('/api/skills/<name>', methods=['GET'])
@@ -66,33 +80,20 @@ def api_get_skill(name: str):
 @app.route('/api/skills', methods=['POST'])
 def api_create_skill():
     """Create a new skill."""
-    data = request.json
-    result, error = create_skill(
-        name=data.get("name", ""),
-        description=data.get("description", ""),
-        content=data.get("content", ""),
-        tags=data.get("tags", []),
-        sub_skills=data.get("sub_skills", []),
-        overwrite=data.get("overwrite", False),
-    )
+    result, error = create_skill(*CREATE_SKILL_FIELDS(request.json))
     if error:
-        status = 409 if "already exists" in error else 400
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
+    drop_skills_response(app)
     return jsonify(result)
 
 
 @app.route('/api/skills/<name>', methods=['PUT'])
 def api_update_skill(name: str):
     """Update an existing skill."""
-    data = request.json
-    result, error = update_skill(
-        name=name,
-        description=data.get("description", ""),
-        content=data.get("content", ""),
-        tags=data.get("tags"),
-    )
+    result, error = update_skill(name, *UPDATE_SKILL_FIELDS(request.json))
     if error:
-        return jsonify({"error": error}), 404
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
+    drop_skills_response(app)
     return jsonify(result)
 
 
@@ -102,6 +103,7 @@ def api_delete_skill(name: str):
     result, error = delete_skill(name)
     if error:
         return jsonify({"error": error}), 404
+    drop_skills_response(app)
     return jsonify(result)
 
 
@@ -110,27 +112,20 @@ def api_delete_skill(name: str):
 @app.route('/api/import/folder', methods=['POST'])
 def api_import_folder():
     """Import a skill from a folder path on disk."""
-    data = request.json
-    result, error = import_folder(
-        source_path=data.get("path", ""),
-        new_name=data.get("name", ""),
-    )
+    result, error = import_folder(*IMPORT_FOLDER_FIELDS(request.json))
     if error:
-        status = 404 if "not found" in error.lower() else 409 if "exists" in error else 400
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
+    drop_skills_response(app)
     return jsonify(result)
 
 
 @app.route('/api/import/json', methods=['POST'])
 def api_import_files_json():
     """Import files via JSON with base64 content."""
-    data = request.json
-    result, error = import_files_json(
-        skill_name=data.get("skill_name", ""),
-        files=data.get("files", []),
-    )
+    result, error = import_files_json(*IMPORT_FILES_FIELDS(request.json))
     if error:
         return jsonify({"error": error}), 400
+    drop_skills_response(app)
     return jsonify(result)
 
 
@@ -150,8 +145,7 @@ def api_browse_filesystem():
     relative_path = request.args.get("path", "")
     result, error = browse_skills_directory(relative_path)
     if error:
-        status = 403 if "denied" in error.lower() else 404
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
@@ -166,14 +160,9 @@ def api_claude_status():
 @app.route('/api/claude/run', methods=['POST'])
 def api_claude_run():
     """Run a prompt through Claude CLI."""
-    data = request.json
-    result, error = run_claude_prompt(
-        prompt=data.get("prompt", ""),
-        skill_context=data.get("skill_context", ""),
-    )
+    result, error = run_claude_prompt(*RUN_PROMPT_FIELDS(request.json))
     if error:
-        status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 500
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
@@ -183,28 +172,23 @@ def api_claude_generate_skill():
     data = request.json
     result, error = generate_skill_with_claude(idea=data.get("idea", ""))
     if error:
-        status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 400
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
 @app.route('/api/claude/improve-skill', methods=['POST'])
 def api_claude_improve_skill():
     """Improve an existing skill using Claude CLI."""
-    data = request.json
-    result, error = improve_skill_with_claude(
-        skill_name=data.get("skill_name", ""),
-        improvement_request=data.get("request", ""),
-    )
+    result, error = improve_skill_with_claude(*IMPROVE_SKILL_FIELDS(request.json))
     if error:
-        status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 500
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
 @app.route('/api/reload', methods=['POST'])
 def api_reload_index():
     """Reload skills index."""
+    drop_skills_response(app)
     return jsonify({"success": True, "message": "Skills reloaded"})
 
 
@@ -222,4 +206,4 @@ if __name__ == "__main__":
   Browse:     RESTRICTED to skills/ directory
 ================================================================
 """)
-    app.run(port=5050, debug=True)
+    app.run(port=5050, debug=DEBUG, use_reloader=False)
@@ -12,20 +12,26 @@ import threading
 
 # Try to import Flask
 try:
-    from flask import Flask, jsonify, request, send_from_directory
+    from flask import Flask, jsonify, request
     from flask_cors import CORS
 except ImportError:
     print("Installing required packages...")
     subprocess.run([sys.executable, "-m", "pip", "install", "flask", "flask-cors"], check=True)
-    from flask import Flask, jsonify, request, send_from_directory
+    from flask import Flask, jsonify, request
     from flask_cors import CORS
 
+try:
+    from waitress import serve
+except ImportError:
+    # Fall back to Flask's built-in server
+    serve = None
+
 # Import from core module
 from core import (
+    CORS_ORIGINS,
     get_skills_dir,
     get_app_dir,
     find_claude_cli,
-    list_all_skills,
     get_skill_by_name,
     create_skill,
     update_skill,
@@ -37,6 +43,17 @@ from core import (
     run_claude_prompt,
     generate_skill_with_claude,
 )
+from core.flask_json import (
+    ERROR_STATUS,
+    CREATE_SKILL_FIELDS,
+    UPDATE_SKILL_FIELDS,
+    IMPORT_FOLDER_FIELDS,
+    IMPORT_FILES_FIELDS,
+    RUN_PROMPT_FIELDS,
+    use_orjson,
+)
+from core.config import BROWSER_WAIT_SECONDS, PORT_PROBE_TIMEOUT, SERVER_CONNECTION_LIMIT, SERVER_THREADS
+from core.flask_static import cached_skills_response, drop_skills_response, static_file_response
 
 # Configuration
 PORT = 5050
@@ -47,27 +64,23 @@ SKILLS_DIR = get_skills_dir()
 
 # Create Flask app
 app = Flask(__name__, static_folder=str(APP_DIR))
+use_orjson(app)
 
-# Security: Restrict CORS to localhost origins only
-CORS(app, origins=[
-    'http://localhost:5050',
-    'http://127.0.0.1:5050',
-    'http://localhost:3000',
-    'http://127.0.0.1:3000',
-], supports_credentials=False)
+# Security: Restrict CORS to localhost origins, and to the API routes only
+CORS(app, resources={r'/api/*': {'origins': CORS_ORIGINS}}, supports_credentials=False)
 
 
 # ============ Routes ============
 
 @app.route('/')
 def index():
-    return send_from_directory(str(APP_DIR), 'skills-manager.html')
+    return static_file_response(APP_DIR / 'skills-manager.html', 'text/html')
 
 
 @app.route('/api/skills', methods=['GET'])
 def api_list_skills():
     """List all skills with their metadata."""
-    return jsonify({"skills": list_all_skills()})
+    return cached_skills_response(app)
 
 
 @app.route('/api/skills/<name>', methods=['GET'])
@@ -82,32 +95,20 @@ def api_get_skill(name):
 @app.route('/api/skills', methods=['POST'])
 def api_create_skill():
     """Create a new skill."""
-    data = request.json
-    result, error = create_skill(
-        name=data.get("name", ""),
-        description=data.get("description", ""),
-        content=data.get("content", ""),
-        tags=data.get("tags", []),
-        overwrite=data.get("overwrite", False),
-    )
+    result, error = create_skill(*CREATE_SKILL_FIELDS(request.json))
     if error:
-        status = 409 if "exists" in error else 400
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
+    drop_skills_response(app)
     return jsonify(result)
 
 
 @app.route('/api/skills/<name>', methods=['PUT'])
 def api_update_skill(name):
     """Update an existing skill."""
-    data = request.json
-    result, error = update_skill(
-        name=name,
-        description=data.get("description", ""),
-        content=data.get("content", ""),
-        tags=data.get("tags"),
-    )
+    result, error = update_skill(name, *UPDATE_SKILL_FIELDS(request.json))
     if error:
-        return jsonify({"error": error}), 404
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
+    drop_skills_response(app)
     return jsonify(result)
 
 
@@ -117,33 +118,27 @@ def api_delete_skill(name):
     result, error = delete_skill(name)
     if error:
         return jsonify({"error": error}), 404
+    drop_skills_response(app)
     return jsonify(result)
 
 
 @app.route('/api/import/folder', methods=['POST'])
 def api_import_folder():
     """Import a skill from a folder path."""
-    data = request.json
-    result, error = import_folder(
-        source_path=data.get("path", ""),
-        new_name=data.get("name", ""),
-    )
+    result, error = import_folder(*IMPORT_FOLDER_FIELDS(request.json))
     if error:
-        status = 404 if "not found" in error.lower() else 409 if "exists" in error else 400
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
+    drop_skills_response(app)
     return jsonify(result)
 
 
 @app.route('/api/import/json', methods=['POST'])
 def api_import_files_json():
     """Import files via JSON."""
-    data = request.json
-    result, error = import_files_json(
-        skill_name=data.get("skill_name", ""),
-        files=data.get("files", []),
-    )
+    result, error = import_files_json(*IMPORT_FILES_FIELDS(request.json))
     if error:
         return jsonify({"error": error}), 400
+    drop_skills_response(app)
     return jsonify(result)
 
 
@@ -157,8 +152,7 @@ def api_browse_filesystem():
     relative_path = request.args.get("path", "")
     result, error = browse_skills_directory(relative_path)
     if error:
-        status = 403 if "denied" in error.lower() else 404
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
@@ -171,14 +165,9 @@ def api_claude_status():
 @app.route('/api/claude/run', methods=['POST'])
 def api_claude_run():
     """Run a prompt through Claude CLI."""
-    data = request.json
-    result, error = run_claude_prompt(
-        prompt=data.get("prompt", ""),
-        skill_context=data.get("skill_context", ""),
-    )
+    result, error = run_claude_prompt(*RUN_PROMPT_FIELDS(request.json))
     if error:
-        status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 500
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
@@ -188,14 +177,14 @@ def api_claude_generate_skill():
     data = request.json
     result, error = generate_skill_with_claude(idea=data.get("idea", ""))
     if error:
-        status = 408 if error == "Timeout" else 404 if "not found" in error.lower() else 400
-        return jsonify({"error": error}), status
+        return jsonify({"error": error}), ERROR_STATUS[error.kind]
     return jsonify(result)
 
 
 @app.route('/api/reload', methods=['POST'])
 def api_reload_index():
     """Reload skills index."""
+    drop_skills_response(app)
     return jsonify({"success": True})
 
 
@@ -203,11 +192,18 @@ def api_reload_index():
 
 def is_port_in_use(port):
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex((HOST, port)) == 0
+        s.settimeout(PORT_PROBE_TIMEOUT)
+        try:
+            return s.connect_ex((HOST, port)) == 0
+        except OSError:
+            return False
 
 
 def open_browser():
-    time.sleep(1.5)
+    # Open as soon as the server is listening instead of after a fixed delay
+    deadline = time.monotonic() + BROWSER_WAIT_SECONDS
+    while not is_port_in_use(PORT) and time.monotonic() < deadline:
+        time.sleep(0.025)
     webbrowser.open(f"http://{HOST}:{PORT}")
 
 
@@ -235,7 +231,10 @@ def main():
     threading.Thread(target=open_browser, daemon=True).start()
 
     try:
-        app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
+        if serve:
+            serve(app, host=HOST, port=PORT, threads=SERVER_THREADS, connection_limit=SERVER_CONNECTION_LIMIT)
+        else:
+            app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
     except KeyboardInterrupt:
         print("\n[*] Stopped.")
 
@@ -9,6 +9,8 @@ import socket
 import threading
 from pathlib import Path
 
+from core.config import BROWSER_WAIT_SECONDS, PORT_PROBE_TIMEOUT, SERVER_CONNECTION_LIMIT, SERVER_THREADS
+
 # Configuration
 PORT = 5050
 HOST = "127.0.0.1"
@@ -25,11 +27,17 @@ def get_app_dir():
 def is_port_in_use(port):
     """Check if port is already in use."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex((HOST, port)) == 0
+        s.settimeout(PORT_PROBE_TIMEOUT)
+        try:
+            return s.connect_ex((HOST, port)) == 0
+        except OSError:
+            return False
 
 def open_browser_delayed():
-    """Open browser after a short delay to let server start."""
-    time.sleep(2)
+    """Open browser once the server is listening (or after BROWSER_WAIT_SECONDS)."""
+    deadline = time.monotonic() + BROWSER_WAIT_SECONDS
+    while not is_port_in_use(PORT) and time.monotonic() < deadline:
+        time.sleep(0.025)
     webbrowser.open(f"http://{HOST}:{PORT}")
 
 def main():
@@ -67,8 +75,13 @@ def main():
         print(f"[✓] Claude CLI: {find_claude_cli() or 'Not found'}")
         print(f"\n[*] Server starting...\n")
         
-        # Run Flask (this blocks)
-        app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
+        # Run the server (this blocks); waitress when installed, else Flask's own
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
+        else:
+            serve(app, host=HOST, port=PORT, threads=SERVER_THREADS, connection_limit=SERVER_CONNECTION_LIMIT)
         
     except KeyboardInterrupt:
         print("\n[*] Server stopped.")
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
 import os
+from contextlib import contextmanager
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -221,6 +222,16 @@ Building accessible HTML forms with validation.
     return temp_skills_dir
 
 
+@contextmanager
+def patch_core_skills_dir(skills_dir):
+    """Point the core functions behind the Flask routes at skills_dir."""
+    with patch('core.skills.get_skills_dir', return_value=skills_dir), \
+         patch('core.browse.get_skills_dir', return_value=skills_dir), \
+         patch('core.browse.get_skills_dir_resolved', return_value=skills_dir.resolve()), \
+         patch('core.claude_cli.get_skills_dir', return_value=skills_dir):
+        yield
+
+
 @pytest.fixture
 def flask_test_client(temp_skills_dir):
     """Create a Flask test client with patched skills directory."""
@@ -235,7 +246,8 @@ def flask_test_client(temp_skills_dir):
     api.app.config['TESTING'] = True
     client = api.app.test_client()
 
-    yield client
+    with patch_core_skills_dir(temp_skills_dir):
+        yield client
 
     # Restore original
     api.SKILLS_DIR = original_skills_dir
@@ -256,13 +268,26 @@ def flask_app_test_client(temp_skills_dir):
     app_module.app.config['TESTING'] = True
     client = app_module.app.test_client()
 
-    yield client
+    with patch_core_skills_dir(temp_skills_dir):
+        yield client
 
     # Restore originals
     app_module.SKILLS_DIR = original_skills_dir
     app_module.APP_DIR = original_app_dir
 
 
+@pytest.fixture(autouse=True)
+def reset_claude_cli_caches():
+    """Clear cached Claude CLI lookups so each test sees its own patches."""
+    from core import config, claude_cli
+
+    config.find_claude_cli.cache_clear()
+    claude_cli._status_cache = None
+    yield
+    config.find_claude_cli.cache_clear()
+    claude_cli._status_cache = None
+
+
 @pytest.fixture
 def mock_claude_cli():
     """Mock the Claude CLI for testing."""
@@ -274,7 +299,9 @@ def mock_claude_cli():
 @pytest.fixture
 def mock_subprocess():
     """Mock subprocess for Claude CLI calls."""
-    with patch('subprocess.run') as mock_run:
+    # Prompts go through the warm process pool's _run_cli, status checks
+    # through subprocess.run; one mock stands in for both
+    with patch('subprocess.run') as mock_run, patch('core.claude_cli._run_cli', mock_run):
         mock_result = MagicMock()
         mock_result.stdout = "Mock Claude response"
         mock_result.stderr = ""
@@ -82,6 +82,51 @@ class TestFindClaudeCli:
                 assert result is None
 
 
+class TestIndexPage:
+    """Tests for GET / serving skills-manager.html."""
+
+    def test_serves_gzipped_html(self, flask_test_client):
+        """Test that the page is gzipped for clients that accept it."""
+        import gzip
+        import skills_manager_api as api
+        response = flask_test_client.get('/', headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.data) == (api.APP_DIR / 'skills-manager.html').read_bytes()
+
+    def test_returns_304_for_matching_etag(self, flask_test_client):
+        """Test that a revalidated page is answered with 304 Not Modified."""
+        etag = flask_test_client.get('/').headers["ETag"]
+        response = flask_test_client.get('/', headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestJSONFields:
+    """Tests for core.flask_json.JSONFields."""
+
+    def test_fields_in_order_with_defaults(self):
+        """Test fields come back in declaration order, defaults filling gaps."""
+        from core.flask_json import JSONFields
+        fields = JSONFields(name="", tags=(), overwrite=False)
+        assert fields({"overwrite": True, "name": "x", "extra": 1}) == ("x", (), True)
+
+    def test_single_field_is_a_tuple(self):
+        """Test one field still unpacks as one argument."""
+        from core.flask_json import JSONFields
+        fields = JSONFields(idea="")
+        assert fields({"idea": "abc"}) == ("abc",)
+        assert fields({}) == ("",)
+
+    def test_defaults_are_immutable(self):
+        """Test no field spec shares a mutable default across requests."""
+        from core import flask_json
+        specs = [value for value in vars(flask_json).values() if isinstance(value, flask_json.JSONFields)]
+        assert specs
+        for spec in specs:
+            for default in spec.defaults.values():
+                assert not isinstance(default, (list, dict, set))
+
+
 class TestListSkillsEndpoint:
     """Tests for GET /api/skills endpoint."""
 
@@ -133,6 +178,80 @@ class TestListSkillsEndpoint:
         data = response.get_json()
         assert data["skills"] == []
 
+    def test_returns_304_for_matching_etag(self, flask_test_client, temp_skills_dir, sample_skill):
+        """Test that an unchanged listing is answered with 304 Not Modified."""
+        with patch('core.skills.get_skills_dir', return_value=temp_skills_dir):
+            response = flask_test_client.get('/api/skills')
+            etag = response.headers["ETag"]
+
+            response = flask_test_client.get('/api/skills', headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.data == b""
+
+    def test_etag_changes_after_update(self, flask_test_client, temp_skills_dir, sample_skill):
+        """Test that updating a skill invalidates the cached listing."""
+        with patch('core.skills.get_skills_dir', return_value=temp_skills_dir):
+            etag = flask_test_client.get('/api/skills').headers["ETag"]
+            flask_test_client.put('/api/skills/test-skill',
+                json={"description": "Changed", "content": "# Changed"}
+            )
+
+            response = flask_test_client.get('/api/skills', headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            skill = next(s for s in response.get_json()["skills"] if s["name"] == "test-skill")
+            assert skill["description"] == "Changed"
+
+    def test_listing_refreshed_after_nested_import(self, flask_test_client, temp_skills_dir, sample_skill):
+        """Test a file imported below a subfolder shows up in file_count."""
+        with patch('core.skills.get_skills_dir', return_value=temp_skills_dir):
+            response = flask_test_client.get('/api/skills')
+            etag = response.headers["ETag"]
+            before = response.get_json()["skills"][0]["file_count"]
+            flask_test_client.post('/api/import/json',
+                json={
+                    "skill_name": "test-skill",
+                    "files": [{"path": "references/extra.md", "content": "# Extra"}]
+                }
+            )
+
+            response = flask_test_client.get('/api/skills', headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.get_json()["skills"][0]["file_count"] == before + 1
+
+
+class TestListAllSkillsCache:
+    """Tests for the cached entries behind core.list_all_skills."""
+
+    @pytest.fixture
+    def list_skills(self, temp_skills_dir, sample_skill):
+        """list_all_skills rooted at temp_skills_dir."""
+        from core.skills import list_all_skills
+        with patch('core.skills.get_skills_dir', return_value=temp_skills_dir):
+            yield list_all_skills
+
+    def test_nested_file_updates_file_count(self, list_skills, sample_skill):
+        """Test a file added below a subfolder is picked up."""
+        before = list_skills()[0]["file_count"]
+        (sample_skill / "references" / "extra.md").write_text("# Extra")
+        assert list_skills()[0]["file_count"] == before + 1
+
+    def test_nested_file_changes_etag(self, list_skills, sample_skill):
+        """Test the ETag covers files below subfolders."""
+        from core.skills import skills_etag
+        with patch('core.skills.get_skills_dir', return_value=sample_skill.parent):
+            etag = skills_etag()
+            (sample_skill / "references" / "extra.md").write_text("# Extra")
+            assert skills_etag() != etag
+
+    def test_returned_entries_are_copies(self, list_skills):
+        """Test mutating a listed skill doesn't change the cached entry."""
+        skill = list_skills()[0]
+        skill["tags"].append("mutated")
+        skill["sub_skills"].clear()
+        skill = list_skills()[0]
+        assert "mutated" not in skill["tags"]
+        assert skill["sub_skills"]
+
 
 class TestGetSkillEndpoint:
     """Tests for GET /api/skills/<name> endpoint."""
@@ -367,6 +486,20 @@ class TestImportFolderEndpoint:
         skill_md = temp_skills_dir / "no-skill-md" / "SKILL.md"
         assert skill_md.exists()
 
+    def test_undecodable_skill_md_keeps_default_description(self, flask_test_client, temp_skills_dir, tmp_path):
+        """Test a SKILL.md that isn't UTF-8 still imports, with the default description."""
+        source = tmp_path / "latin1-skill"
+        source.mkdir()
+        (source / "SKILL.md").write_bytes(b"---\ndescription: caf\xe9\n---\n# Latin-1")
+
+        response = flask_test_client.post('/api/import/folder',
+            json={"path": str(source)}
+        )
+        assert response.status_code == 200
+
+        meta = json.loads((temp_skills_dir / "latin1-skill" / "_meta.json").read_text())
+        assert meta["description"] == "Imported skill"
+
 
 class TestImportJsonEndpoint:
     """Tests for POST /api/import/json endpoint."""
@@ -432,6 +565,25 @@ class TestImportJsonEndpoint:
         data = response.get_json()
         assert len(data["files_imported"]) == 0
 
+    def test_skips_invalid_paths_and_keeps_order(self, flask_test_client, temp_skills_dir):
+        """Test entries without a string path are skipped and the rest keep request order."""
+        response = flask_test_client.post('/api/import/json',
+            json={
+                "skill_name": "ordered-import",
+                "files": [
+                    {"path": "refs/b.md", "content": "# B"},
+                    {"path": None, "content": "no path"},
+                    {"path": 7, "content": "not a string"},
+                    {"path": "SKILL.md", "content": "# Ordered"},
+                    {"path": "refs/a.md", "content": "# A"},
+                ]
+            }
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["files_imported"] == ["refs/b.md", "SKILL.md", "refs/a.md"]
+        assert (temp_skills_dir / "ordered-import" / "refs" / "a.md").read_text() == "# A"
+
 
 class TestBrowseFilesystemEndpoint:
     """Tests for GET /api/browse endpoint."""
@@ -486,6 +638,51 @@ class TestBrowseFilesystemEndpoint:
         assert response.status_code == 404
 
 
+class TestBrowseSkillsDirectory:
+    """Tests for core.browse.browse_skills_directory."""
+
+    @pytest.fixture
+    def browse(self, temp_skills_dir):
+        """browse_skills_directory rooted at temp_skills_dir."""
+        from core.browse import browse_skills_directory
+        (temp_skills_dir / "my-skill" / "scripts" / "lib").mkdir(parents=True)
+        (temp_skills_dir / "my-skill" / "scripts" / "run.js").write_text("x")
+        with patch('core.browse.get_skills_dir', return_value=temp_skills_dir), \
+             patch('core.browse.get_skills_dir_resolved', return_value=temp_skills_dir.resolve()):
+            yield browse_skills_directory
+
+    def test_paths_use_forward_slashes(self, browse):
+        """Test listed paths are "/"-separated."""
+        result, error = browse("my-skill/scripts")
+        assert error is None
+        assert result["dirs"][0]["path"] == "my-skill/scripts/lib"
+        assert result["files"][0]["path"] == "my-skill/scripts/run.js"
+
+    def test_parent_of_backslash_path(self, browse):
+        """Test a Windows-style path sent back by the client finds its parent."""
+        result, error = browse("my-skill\\scripts\\lib")
+        assert error is None
+        assert result["parent"] == "my-skill/scripts"
+
+    def test_parent_of_top_level_is_root(self, browse):
+        """Test the parent of a skill folder is the root."""
+        result, _ = browse("my-skill/")
+        assert result["parent"] == ""
+
+    @pytest.mark.parametrize("path, kind", [
+        ("../outside", "forbidden"),
+        ("missing-skill", "not_found"),
+        ("my-skill/scripts/run.js", "not_found"),
+    ])
+    def test_errors_carry_kind(self, browse, path, kind):
+        """Test errors are CoreErrors whose kind maps to an HTTP status."""
+        from core.flask_json import ERROR_STATUS
+        result, error = browse(path)
+        assert result is None
+        assert error.kind == kind
+        assert kind in ERROR_STATUS
+
+
 class TestClaudeStatusEndpoint:
     """Tests for GET /api/claude/status endpoint."""
 
@@ -507,6 +704,53 @@ class TestClaudeStatusEndpoint:
             assert data["available"] is False
 
 
+class TestWarmCliProcess:
+    """Tests for the warm `claude -p` process behind _run_cli."""
+
+    @pytest.fixture
+    def started(self):
+        """Patch _start_cli and record the fake processes it starts."""
+        import core.claude_cli as claude_cli
+        procs = []
+
+        def start(cli_path, cwd):
+            proc = MagicMock()
+            proc.poll.return_value = None
+            proc.returncode = 0
+            proc.communicate.return_value = ("out", "")
+            procs.append(proc)
+            return proc
+
+        claude_cli._shutdown_warm_cli()
+        with patch('core.claude_cli._start_cli', side_effect=start):
+            yield procs
+        claude_cli._shutdown_warm_cli()
+
+    def test_no_process_started_before_first_prompt(self, started):
+        """Test nothing is pre-started until a prompt completes."""
+        import core.claude_cli as claude_cli
+        assert claude_cli._warm_cli is None
+        assert started == []
+
+    def test_keeps_one_warm_process_after_prompt(self, started):
+        """Test a completed prompt leaves exactly one idle process."""
+        from core.claude_cli import _run_cli
+        _run_cli('/usr/bin/claude', "hi", timeout=5)
+        assert len(started) == 2
+        _run_cli('/usr/bin/claude', "again", timeout=5)
+        # The second prompt used the warm process and started one spare
+        assert len(started) == 3
+        assert started[1].communicate.call_args[0][0] == "again"
+
+    def test_other_cwd_replaces_warm_process(self, started):
+        """Test the spare is killed when a prompt needs another cwd."""
+        from core.claude_cli import _run_cli
+        _run_cli('/usr/bin/claude', "hi", timeout=5, cwd="/a")
+        _run_cli('/usr/bin/claude', "hi", timeout=5, cwd="/b")
+        started[1].kill.assert_called_once()
+        started[1].communicate.assert_not_called()
+
+
 class TestClaudeRunEndpoint:
     """Tests for POST /api/claude/run endpoint."""
 
@@ -533,7 +777,7 @@ class TestClaudeRunEndpoint:
             assert response.status_code == 200
             # Verify context was passed
             call_args = mock_subprocess.call_args
-            full_prompt = call_args[0][0][2]  # Third arg in command list
+            full_prompt = call_args[0][1]  # Prompt is _run_cli's second arg
             assert "skill context" in full_prompt.lower()
 
     def test_returns_404_when_cli_not_found(self, flask_test_client):
@@ -548,7 +792,7 @@ class TestClaudeRunEndpoint:
         """Test handling of timeout."""
         import subprocess
         with patch('skills_manager_api.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run', side_effect=subprocess.TimeoutExpired('cmd', 120)):
+            with patch('core.claude_cli._run_cli', side_effect=subprocess.TimeoutExpired('cmd', 120)):
                 response = flask_test_client.post('/api/claude/run',
                     json={"prompt": "Test"}
                 )
@@ -380,7 +380,7 @@ class TestClaudeRunEndpoint:
     def test_runs_prompt(self, flask_app_test_client):
         """Test running a prompt."""
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run') as mock_run:
+            with patch('core.claude_cli._run_cli') as mock_run:
                 mock_run.return_value.stdout = "Response"
                 mock_run.return_value.stderr = ""
                 response = flask_app_test_client.post('/api/claude/run',
@@ -393,7 +393,7 @@ class TestClaudeRunEndpoint:
     def test_includes_context(self, flask_app_test_client):
         """Test skill context is included."""
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run') as mock_run:
+            with patch('core.claude_cli._run_cli') as mock_run:
                 mock_run.return_value.stdout = "Response"
                 mock_run.return_value.stderr = ""
                 response = flask_app_test_client.post('/api/claude/run',
@@ -403,9 +403,9 @@ class TestClaudeRunEndpoint:
                     }
                 )
                 assert response.status_code == 200
-                # Verify context was in the command
-                call_args = mock_run.call_args[0][0]
-                assert "Context here" in call_args[2]
+                # Verify context was in the prompt
+                call_args = mock_run.call_args[0]
+                assert "Context here" in call_args[1]
 
     def test_returns_404_without_cli(self, flask_app_test_client):
         """Test 404 when CLI not found."""
@@ -419,7 +419,7 @@ class TestClaudeRunEndpoint:
         """Test timeout handling."""
         import subprocess
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run', side_effect=subprocess.TimeoutExpired('cmd', 120)):
+            with patch('core.claude_cli._run_cli', side_effect=subprocess.TimeoutExpired('cmd', 120)):
                 response = flask_app_test_client.post('/api/claude/run',
                     json={"prompt": "Test"}
                 )
@@ -432,7 +432,7 @@ class TestClaudeGenerateSkillEndpoint:
     def test_generates_skill(self, flask_app_test_client):
         """Test skill generation."""
         with patch('skills_manager_app.find_claude_cli', return_value='/usr/bin/claude'):
-            with patch('subprocess.run') as mock_run:
+            with patch('core.claude_cli._run_cli') as mock_run:
                 mock_run.return_value.stdout = """---
 name: generated
 description: Generated skill
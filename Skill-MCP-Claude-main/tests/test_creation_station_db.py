@@ -0,0 +1,196 @@
+# test_creation_station_db.py - Tests for the Creation Station SQLite store
+import pytest
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import creation_station_db as db
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """A fresh, initialized database connection."""
+    connection = db.connect(tmp_path / "creation_station.db")
+    db.init_db(tmp_path / "creation_station.db", conn=connection)
+    yield connection
+    connection.close()
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestInitDb:
+    """Tests for init_db."""
+
+    def test_creates_schema(self, conn):
+        """Test all tables and indexes are created."""
+        names = {
+            row["name"]
+            for row in conn.execute("SELECT name FROM sqlite_master")
+        }
+        assert {"skills", "skill_versions", "skill_files", "blob_store"} <= names
+        assert {"idx_sv_skill", "idx_sf_version", "idx_ro_run", "idx_fb_run"} <= names
+
+    def test_is_idempotent(self, tmp_path, conn):
+        """Test running init_db again on the same database is harmless."""
+        db.init_db(tmp_path / "creation_station.db", conn=conn)
+        assert _count(conn, "skills") == 0
+
+    def test_does_not_analyze(self, conn):
+        """Test init_db leaves ANALYZE to the seed."""
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone() is None
+
+    def test_migrates_pre_blob_store_database(self, tmp_path):
+        """Test a database from before blob_store gains content_hash and keeps its rows."""
+        path = tmp_path / "old.db"
+        old = sqlite3.connect(path)
+        old.executescript(
+            """
+            CREATE TABLE skill_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                skill_version_id INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                content_text TEXT,
+                content_blob BLOB,
+                is_binary INTEGER NOT NULL DEFAULT 0,
+                encoding TEXT NOT NULL DEFAULT 'utf-8',
+                created_at TEXT NOT NULL
+            );
+            INSERT INTO skill_files (skill_version_id, path, content_text, created_at)
+            VALUES (1, 'SKILL.md', '# Old', '2024-01-01');
+            """
+        )
+        old.commit()
+        old.close()
+
+        conn = db.connect(path)
+        db.init_db(path, conn=conn)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(skill_files)")}
+        assert "content_hash" in columns
+        rows = db.fetch_version_files(conn, 1)
+        assert [(row["path"], row["content_text"]) for row in rows] == [("SKILL.md", "# Old")]
+        conn.close()
+
+
+class TestCreateVersion:
+    """Tests for create_version and the fetch functions."""
+
+    def test_round_trip_with_duplicate_blob(self, conn):
+        """Test identical contents are stored once and read back for every file."""
+        skill_id = db.upsert_skill(conn, "my-skill")
+        files = [
+            db.SkillFile(path="SKILL.md", content="same", is_binary=False),
+            db.SkillFile(path="copy.md", content="same", is_binary=False),
+            db.SkillFile(path="logo.png", content=b"\x89PNG\x00", is_binary=True),
+        ]
+        version_id = db.create_version(conn, skill_id=skill_id, files=files, status="draft")
+
+        assert _count(conn, "blob_store") == 2
+        rows = {row["path"]: row for row in db.fetch_version_files(conn, version_id)}
+        assert rows["SKILL.md"]["content_text"] == "same"
+        assert rows["copy.md"]["content_text"] == "same"
+        assert bytes(rows["logo.png"]["content_blob"]) == b"\x89PNG\x00"
+        assert db.fetch_one_file_blob(conn, version_id, "logo.png") == b"\x89PNG\x00"
+        assert db.fetch_one_file_blob(conn, version_id, "missing.md") is None
+
+    def test_partial_failure_rolls_back(self, conn):
+        """Test a version whose file rows fail to insert leaves nothing behind."""
+        skill_id = db.upsert_skill(conn, "my-skill")
+        files = [
+            db.SkillFile(path="SKILL.md", content="# Hi", is_binary=False),
+            db.SkillFile(path=None, content="no path", is_binary=False),
+        ]
+        with pytest.raises(sqlite3.IntegrityError):
+            db.create_version(conn, skill_id=skill_id, files=files, status="draft")
+        assert not conn.in_transaction
+        assert _count(conn, "skill_versions") == 0
+        assert _count(conn, "blob_store") == 0
+        assert _count(conn, "skill_files") == 0
+
+    def test_joins_callers_transaction(self, conn):
+        """Test create_version inside BEGIN is undone by the caller's ROLLBACK."""
+        skill_id = db.upsert_skill(conn, "my-skill")
+        conn.execute("BEGIN")
+        version_id = db.create_version(conn, skill_id=skill_id, files=[], status="draft")
+        db.publish_version(conn, skill_id, version_id)
+        conn.execute("ROLLBACK")
+        assert _count(conn, "skill_versions") == 0
+
+    def test_numbers_versions_per_skill(self, conn):
+        """Test version numbers count up per skill."""
+        skill_id = db.upsert_skill(conn, "my-skill")
+        db.create_version(conn, skill_id=skill_id, files=[], status="draft")
+        db.create_version(conn, skill_id=skill_id, files=[], status="draft")
+        versions = db.fetch_skill_versions(conn, skill_id)
+        assert [row["version_number"] for row in versions] == [2, 1]
+
+
+class TestSeedSkillsFromFilesystem:
+    """Tests for seed_skills_from_filesystem."""
+
+    @pytest.fixture
+    def skills_dir(self, temp_skills_dir):
+        for name in ("alpha", "beta"):
+            (temp_skills_dir / name).mkdir()
+            (temp_skills_dir / name / "SKILL.md").write_text(f"# {name}")
+        return temp_skills_dir
+
+    def test_seeds_every_skill_once(self, conn, skills_dir):
+        """Test each skill gets one published version, and reseeding is a no-op."""
+        assert db.seed_skills_from_filesystem(skills_dir, conn=conn) == []
+        assert db.seed_skills_from_filesystem(skills_dir, conn=conn) == []
+        assert _count(conn, "skill_versions") == 2
+        row = conn.execute(
+            "SELECT current_published_version_id FROM skills WHERE name = 'alpha'"
+        ).fetchone()
+        assert row[0] is not None
+
+    def test_analyzes_after_seeding(self, conn, skills_dir):
+        """Test planner statistics exist once skills were seeded."""
+        db.seed_skills_from_filesystem(skills_dir, conn=conn)
+        stats = {row[0] for row in conn.execute("SELECT tbl FROM sqlite_stat1")}
+        assert "skill_versions" in stats
+
+    def test_skips_unreadable_skill(self, conn, skills_dir):
+        """Test a skill whose files can't be decoded is reported and skipped."""
+        (skills_dir / "beta" / "SKILL.md").write_bytes(b"\xff\xfe bad")
+        assert db.seed_skills_from_filesystem(skills_dir, conn=conn) == ["beta"]
+        names = [row["name"] for row in conn.execute("SELECT name FROM skills")]
+        assert names == ["alpha"]
+
+    def test_rolls_back_skill_that_fails_midway(self, conn, skills_dir):
+        """Test rows already written for a failing skill are rolled back."""
+        publish = db.publish_version
+
+        def failing_publish(conn, skill_id, version_id):
+            name = conn.execute("SELECT name FROM skills WHERE id = ?", (skill_id,)).fetchone()[0]
+            if name == "beta":
+                raise sqlite3.OperationalError("disk I/O error")
+            publish(conn, skill_id, version_id)
+
+        with patch.object(db, "publish_version", failing_publish):
+            assert db.seed_skills_from_filesystem(skills_dir, conn=conn) == ["beta"]
+
+        assert [row["name"] for row in conn.execute("SELECT name FROM skills")] == ["alpha"]
+        assert _count(conn, "skill_versions") == 1
+        assert _count(conn, "skill_files") == 1
+
+
+class TestWriteVersionToFilesystem:
+    """Tests for write_version_to_filesystem."""
+
+    def test_writes_nested_files(self, conn, tmp_path):
+        """Test every file of a version is written under destination."""
+        skill_id = db.upsert_skill(conn, "my-skill")
+        files = [
+            db.SkillFile(path="SKILL.md", content="# Hi", is_binary=False),
+            db.SkillFile(path="scripts/run.bin", content=b"\x00\x01", is_binary=True),
+        ]
+        version_id = db.create_version(conn, skill_id=skill_id, files=files, status="draft")
+        destination = tmp_path / "out"
+        db.write_version_to_filesystem(conn, version_id, destination)
+        assert (destination / "SKILL.md").read_text() == "# Hi"
+        assert (destination / "scripts" / "run.bin").read_bytes() == b"\x00\x01"
@@ -0,0 +1,297 @@
+# test_migrate.py - Tests for the skill migration tool
+import pytest
+import json
+import zipfile
+from pathlib import Path
+
+import migrate
+
+
+@pytest.fixture
+def skills_target(tmp_path, monkeypatch):
+    """Point migrate.SKILLS_DIR at an empty temporary directory."""
+    target = tmp_path / "skills"
+    target.mkdir()
+    monkeypatch.setattr(migrate, "SKILLS_DIR", target)
+    return target
+
+
+def _make_archive(path: Path, members: dict[str, str]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return path
+
+
+SKILL_MD = "# Demo Skill\n\nBuilds React forms with validation.\n\n## Usage\nSee references.\n"
+
+
+class TestMigrateSkillArchive:
+    """Tests for migrate_skill_archive."""
+
+    def test_migrates_archive(self, tmp_path, skills_target):
+        """Test SKILL.md, docs and scripts are copied and _meta.json generated."""
+        archive = _make_archive(tmp_path / "demo-skill.skill", {
+            "demo-skill/SKILL.md": SKILL_MD,
+            "demo-skill/references/forms.md": "# Forms\nclass FormBuilder {}",
+            "demo-skill/scripts/run.js": "console.log(1)",
+            "demo-skill/assets/logo.png": "not copied",
+        })
+        target = migrate.migrate_skill_archive(archive)
+
+        assert target == skills_target / "demo"
+        assert (target / "SKILL.md").read_text() == SKILL_MD
+        assert (target / "references" / "forms.md").exists()
+        assert (target / "scripts" / "run.js").read_text() == "console.log(1)"
+        assert not (target / "assets").exists()
+        meta = json.loads((target / "_meta.json").read_text())
+        assert meta["name"] == "demo"
+        assert [sub["file"] for sub in meta["sub_skills"]] == ["references/forms.md"]
+        assert "FormBuilder" in meta["sub_skills"][0]["triggers"]
+
+    def test_missing_skill_md_leaves_no_directory(self, tmp_path, skills_target):
+        """Test an archive without SKILL.md creates nothing."""
+        archive = _make_archive(tmp_path / "empty.skill", {"empty/README.md": "# Nope"})
+        assert migrate.migrate_skill_archive(archive) is None
+        assert list(skills_target.iterdir()) == []
+
+    def test_skips_macosx_folder(self, tmp_path, skills_target):
+        """Test the __MACOSX metadata folder is not taken for the skill folder."""
+        archive = _make_archive(tmp_path / "mac.skill", {
+            "__MACOSX/real-skill/._SKILL.md": "resource fork",
+            "real-skill/SKILL.md": SKILL_MD,
+        })
+        target = migrate.migrate_skill_archive(archive)
+        assert target == skills_target / "real"
+        assert (target / "SKILL.md").read_text() == SKILL_MD
+
+    def test_prefers_shallowest_nested_skill_md(self, tmp_path, skills_target):
+        """Test the least nested SKILL.md wins over namelist order."""
+        archive = _make_archive(tmp_path / "nested.skill", {
+            "wrap/examples/deep/SKILL.md": "# Deep example",
+            "wrap/inner/SKILL.md": SKILL_MD,
+        })
+        target = migrate.migrate_skill_archive(archive, "nested")
+        assert (target / "SKILL.md").read_text() == SKILL_MD
+
+    @pytest.mark.parametrize("members", [
+        {"../SKILL.md": SKILL_MD, "../references/r.md": "# R"},
+        {"/x/SKILL.md": SKILL_MD, "/x/references/r.md": "# R"},
+        {"demo/./SKILL.md": SKILL_MD},
+        {"demo//SKILL.md": SKILL_MD},
+    ])
+    def test_ignores_unsafe_members(self, tmp_path, skills_target, members):
+        """Test absolute, '..', '.' and empty member paths are never extracted."""
+        archive = _make_archive(tmp_path / "evil.skill", members)
+        assert migrate.migrate_skill_archive(archive) is None
+        assert list(skills_target.iterdir()) == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["evil.skill", "skills"]
+
+    @pytest.mark.parametrize("target_name", ["..", ".", "---"])
+    def test_rejects_unsafe_skill_name(self, tmp_path, skills_target, target_name):
+        """Test a skill name that normalizes to '', '.' or '..' is refused."""
+        archive = _make_archive(tmp_path / "demo.skill", {"demo/SKILL.md": SKILL_MD})
+        assert migrate.migrate_skill_archive(archive, target_name) is None
+        assert list(skills_target.iterdir()) == []
+        assert not (tmp_path / "SKILL.md").exists()
+
+    def test_rejects_target_outside_skills_dir(self, tmp_path, skills_target):
+        """Test a skill name that resolves outside SKILLS_DIR is refused."""
+        archive = _make_archive(tmp_path / "demo.skill", {"demo/SKILL.md": SKILL_MD})
+        assert migrate.migrate_skill_archive(archive, "../escaped") is None
+        assert not (tmp_path / "escaped").exists()
+
+
+class TestFindKeywords:
+    """Tests for find_keywords."""
+
+    SAMPLES = [
+        "Built with React and TypeScript, tested with Jest.",
+        "Reactive streams are not React; pythonic is not Python.",
+        "Uses Three.js and WebGL for the canvas. a11y and WCAG matter.",
+        "go Go GO golang",
+        "İstanbul team: React performance and caching",
+        "",
+    ]
+
+    @pytest.mark.parametrize("content", SAMPLES)
+    def test_automaton_matches_regex(self, content, monkeypatch):
+        """Test the Aho-Corasick scan finds what the regex alternation finds."""
+        if migrate._KEYWORD_AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+        found = migrate.find_keywords(content)
+        monkeypatch.setattr(migrate, "_KEYWORD_AUTOMATON", None)
+        assert migrate.find_keywords(content) == found
+
+    def test_whole_words_in_first_seen_order(self):
+        """Test keywords are lowercased, deduplicated and whole-word only."""
+        content = "Python, React and python again; Reactive is not a keyword"
+        assert migrate.find_keywords(content) == ["python", "react"]
+
+    def test_stops_at_limit(self):
+        """Test scanning stops once limit keywords were found."""
+        content = "React Vue Angular Svelte TypeScript"
+        assert migrate.find_keywords(content, limit=2) == ["react", "vue"]
+
+
+class TestExtractMetadataFromSkillMd:
+    """Tests for extract_metadata_from_skill_md."""
+
+    def test_description_is_first_paragraph(self):
+        """Test blank and heading lines are skipped, then one paragraph is joined."""
+        content = "# Title\n\n## Overview\n  First line\nsecond line\n\nNot included\n"
+        meta = migrate.extract_metadata_from_skill_md(content, "demo")
+        assert meta["description"] == "First line second line"
+
+    def test_description_truncated(self):
+        """Test long descriptions are cut to 200 characters."""
+        meta = migrate.extract_metadata_from_skill_md("# T\n" + "x" * 300, "demo")
+        assert meta["description"] == "x" * 200
+
+    def test_single_line_has_no_description(self):
+        """Test content without a second line gives an empty description."""
+        assert migrate.extract_metadata_from_skill_md("# Only", "demo")["description"] == ""
+
+    def test_tags_capped(self):
+        """Test at most MAX_TAGS tags are returned."""
+        content = "# T\n" + " ".join(migrate._KEYWORDS)
+        assert len(migrate.extract_metadata_from_skill_md(content, "demo")["tags"]) == migrate.MAX_TAGS
+
+
+class TestExtractTriggers:
+    """Tests for extract_triggers."""
+
+    SAMPLES = [
+        "class Foo {}\nfunction bar() {}\nconst baz = 1\ninterface Qux {}",
+        "constant value\nconst  spaced   =  2\nconst noequals\nclass\nclassify Thing",
+        "function a(){} function b(){} function c(){} function d(){}",
+        "## Getting Started\n## API\n## Very Long Heading That Goes Past Thirty Chars\n",
+    ]
+
+    @pytest.mark.parametrize("content", SAMPLES)
+    def test_small_doc_scan_matches_regex(self, content, monkeypatch):
+        """Test the str.find fast path finds what the trigger regexes find."""
+        found = migrate.extract_triggers(content, "doc")
+        monkeypatch.setattr(migrate, "SMALL_DOC_CHARS", 0)
+        assert migrate.extract_triggers(content, "doc") == found
+
+    def test_name_first_and_unique(self):
+        """Test the doc name leads and duplicates are dropped."""
+        triggers = migrate.extract_triggers("class Foo {}\nclass Foo {}", "foo-doc")
+        assert triggers == ["foo-doc", "Foo"]
+
+    def test_capped_at_max_triggers(self):
+        """Test no more than MAX_TRIGGERS triggers are returned."""
+        content = "\n".join(f"{kw} {kw.title()}{i}{' =' if kw == 'const' else ''}" for i in range(3)
+                            for kw in ("class", "function", "const", "interface"))
+        assert len(migrate.extract_triggers(content, "doc")) == migrate.MAX_TRIGGERS
+
+
+class TestNormalizeSkillName:
+    """Tests for _normalize_skill_name."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("My Skill", "my-skill"),
+        ("snake_case_name", "snake-case-name"),
+        ("  spaced -- out__", "spaced-out"),
+    ])
+    def test_normalizes(self, raw, expected):
+        assert migrate._normalize_skill_name(raw) == expected
+
+
+class TestMigrateSkillFolder:
+    """Tests for migrate_skill_folder."""
+
+    def test_migrates_folder(self, tmp_path, skills_target):
+        """Test docs become sub_skills and scripts are copied alongside."""
+        source = tmp_path / "src" / "My_Skill"
+        (source / "references").mkdir(parents=True)
+        (source / "scripts").mkdir()
+        (source / "SKILL.md").write_text(SKILL_MD)
+        (source / "references" / "guide.md").write_text("# Guide")
+        (source / "scripts" / "notes.md").write_text("# Notes")
+        (source / "scripts" / "build.js").write_text("function build() {}")
+
+        target = migrate.migrate_skill_folder(source)
+
+        assert target == skills_target / "my-skill"
+        assert (target / "scripts" / "build.js").read_text() == "function build() {}"
+        meta = json.loads((target / "_meta.json").read_text(encoding="utf-8"))
+        assert [sub["file"] for sub in meta["sub_skills"]] == ["references/guide.md", "scripts/notes.md"]
+        assert "react" in meta["tags"] and "validation" in meta["tags"]
+
+
+    def test_scripts_keep_mode_and_mtime(self, tmp_path, skills_target):
+        """Test copied scripts keep their permission bits and timestamps."""
+        source = tmp_path / "src" / "demo"
+        (source / "scripts").mkdir(parents=True)
+        (source / "SKILL.md").write_text(SKILL_MD)
+        script = source / "scripts" / "run.js"
+        script.write_text("#!/usr/bin/env node\n")
+        script.chmod(0o755)
+
+        target = migrate.migrate_skill_folder(source)
+        copied = target / "scripts" / "run.js"
+        assert copied.stat().st_mode & 0o777 == 0o755
+        assert copied.stat().st_mtime_ns == script.stat().st_mtime_ns
+
+    def test_rerun_keeps_meta_to_schema_keys(self, tmp_path, skills_target, capsys):
+        """Test migrating twice writes only schema keys and leaves the file alone the second time."""
+        source = tmp_path / "src" / "demo"
+        source.mkdir(parents=True)
+        (source / "SKILL.md").write_text(SKILL_MD)
+
+        target = migrate.migrate_skill_folder(source)
+        meta_path = target / "_meta.json"
+        mtime = meta_path.stat().st_mtime_ns
+        migrate.migrate_skill_folder(source)
+
+        assert set(json.loads(meta_path.read_text())) == {"name", "description", "tags", "sub_skills"}
+        assert meta_path.stat().st_mtime_ns == mtime
+        assert "_meta.json is up to date" in capsys.readouterr().out
+
+    def test_rerun_regenerates_changed_meta(self, tmp_path, skills_target):
+        """Test a _meta.json with extra or stale keys is rewritten."""
+        source = tmp_path / "src" / "demo"
+        source.mkdir(parents=True)
+        (source / "SKILL.md").write_text(SKILL_MD)
+        meta_path = skills_target / "demo" / "_meta.json"
+        meta_path.parent.mkdir()
+        meta_path.write_text(json.dumps({"name": "demo", "_content_hash": "abc"}))
+
+        migrate.migrate_skill_folder(source)
+        meta = json.loads(meta_path.read_text())
+        assert "_content_hash" not in meta
+        assert meta["description"] == "Builds React forms with validation."
+
+class TestMigrateBatch:
+    """Tests for migrate_batch."""
+
+    @pytest.fixture
+    def batch_dir(self, tmp_path):
+        batch = tmp_path / "batch"
+        for name in ("alpha", "beta", "gamma"):
+            (batch / name).mkdir(parents=True)
+            (batch / name / "SKILL.md").write_text(f"# {name}\n\nAbout {name}.")
+        (batch / "not-a-skill").mkdir()
+        return batch
+
+    def test_migrates_every_skill(self, batch_dir, skills_target):
+        """Test each folder with a SKILL.md is migrated."""
+        assert migrate.migrate_batch(batch_dir) == 0
+        assert sorted(p.name for p in skills_target.iterdir()) == ["alpha", "beta", "gamma"]
+
+    def test_one_failure_does_not_stop_the_batch(self, batch_dir, skills_target, capsys):
+        """Test a failing skill is reported while the others are still migrated."""
+        # A file where beta's target directory should go makes its mkdir fail
+        (skills_target / "beta").write_text("in the way")
+        assert migrate.migrate_batch(batch_dir) == 1
+        assert (skills_target / "alpha" / "_meta.json").exists()
+        assert (skills_target / "gamma" / "_meta.json").exists()
+        out = capsys.readouterr().out
+        assert "Failed to migrate beta" in out
+        assert "Migrated 2 of 3 skills" in out
+
+    def test_rejects_missing_directory(self, tmp_path, skills_target):
+        """Test a non-directory batch source is an error."""
+        assert migrate.migrate_batch(tmp_path / "missing") == 1
@@ -92,6 +92,37 @@ class TestValidateMeta:
         assert "sub_skill[0] missing required field 'file'" in errors[0]
 
 
+class TestIsSafeSkillName:
+    """Tests for is_safe_skill_name function."""
+
+    def test_accepts_plain_names(self, server_module):
+        """Test that letters, digits, hyphens and underscores are accepted."""
+        assert server_module.is_safe_skill_name("Test-skill_2") is True
+
+    def test_rejects_unsafe_names(self, server_module):
+        """Test that empty, non-string and path-like names are rejected."""
+        for name in ["", None, 42, "../etc", "a/b", "a b", "skill\n"]:
+            assert server_module.is_safe_skill_name(name) is False
+
+
+class TestValidateSkillPath:
+    """Tests for validate_skill_path function."""
+
+    def test_accepts_path_inside_skills_dir(self, server_module, sample_skill):
+        """Test that files under SKILLS_DIR are accepted."""
+        assert server_module.validate_skill_path(sample_skill / "SKILL.md") is True
+
+    def test_rejects_parent_traversal(self, server_module, temp_skills_dir):
+        """Test that ../ escapes are rejected."""
+        assert server_module.validate_skill_path(temp_skills_dir / ".." / "secret.md") is False
+
+    def test_rejects_sibling_with_shared_prefix(self, server_module, temp_skills_dir):
+        """Test that a sibling like skills_evil isn't treated as inside skills."""
+        evil_dir = temp_skills_dir.parent / (temp_skills_dir.name + "_evil")
+        evil_dir.mkdir()
+        assert server_module.validate_skill_path(evil_dir / "SKILL.md") is False
+
+
 class TestBuildContentIndex:
     """Tests for build_content_index function."""
 
@@ -107,7 +138,7 @@ class TestBuildContentIndex:
         assert key in index
         assert index[key]["domain"] == "test-skill"
         assert index[key]["sub_skill"] is None
-        assert "test skill" in index[key]["content"]
+        assert b"test skill" in index[key]["content"]
 
     def test_indexes_references(self, server_module, sample_skill):
         """Test that reference files are indexed."""
@@ -116,14 +147,14 @@ class TestBuildContentIndex:
         assert key in index
         assert index[key]["domain"] == "test-skill"
         assert index[key]["sub_skill"] == "advanced"
-        assert "mocking" in index[key]["content"]
+        assert b"mocking" in index[key]["content"]
 
     def test_content_is_lowercased(self, server_module, sample_skill):
         """Test that indexed content is lowercased for search."""
         index = server_module.build_content_index()
         key = "test-skill:SKILL.md"
         # Original has "Test Skill" but should be lowercase
-        assert "test skill" in index[key]["content"]
+        assert b"test skill" in index[key]["content"]
 
     def test_multiple_skills_indexed(self, server_module, multiple_skills):
         """Test indexing multiple skills."""
@@ -132,6 +163,70 @@ class TestBuildContentIndex:
         assert "forms:SKILL.md" in index
         assert "building:SKILL.md" in index
 
+    def test_rebuild_reuses_unchanged_entries(self, server_module, sample_skill):
+        """Test that a rebuild only re-reads files whose mtime or size changed."""
+        server_module._CONTENT_INDEX = server_module.build_content_index()
+        previous = server_module._CONTENT_INDEX
+        (sample_skill / "SKILL.md").write_text("# Changed\n")
+
+        index = server_module.build_content_index()
+
+        assert index["test-skill:references/advanced.md"] is previous["test-skill:references/advanced.md"]
+        assert index["test-skill:SKILL.md"]["content"] == b"# changed\n"
+
+    def test_indexes_large_file(self, server_module, sample_skill):
+        """Test that files read through mmap index like small ones."""
+        large = "# Large Reference\r\n" + "Filler line.\r\n" * 6000 + "Ünïcode tail\r\n"
+        (sample_skill / "references" / "advanced.md").write_bytes(large.encode("utf-8"))
+
+        index = server_module.build_content_index()
+        content = index["test-skill:references/advanced.md"]["content"]
+
+        assert len(large) > server_module.MMAP_THRESHOLD
+        assert content == large.replace("\r\n", "\n").lower().encode("utf-8")
+
+
+class TestUpdateContentIndex:
+    """Tests for update_content_index function."""
+
+    def test_updates_changed_file(self, server_module, sample_skill):
+        """Test that only the changed file's entry is re-read."""
+        server_module._CONTENT_INDEX = server_module.build_content_index()
+        skill_file = sample_skill / "SKILL.md"
+        skill_file.write_text("# Rewritten Skill\n")
+
+        server_module.update_content_index([str(skill_file)])
+
+        assert server_module._CONTENT_INDEX["test-skill:SKILL.md"]["content"] == b"# rewritten skill\n"
+        assert "test-skill:references/advanced.md" in server_module._CONTENT_INDEX
+
+    def test_removes_deleted_file(self, server_module, sample_skill):
+        """Test that deleted files are dropped from the index."""
+        server_module._CONTENT_INDEX = server_module.build_content_index()
+        ref_file = sample_skill / "references" / "advanced.md"
+        ref_file.unlink()
+
+        server_module.update_content_index([], [str(ref_file)])
+
+        assert "test-skill:references/advanced.md" not in server_module._CONTENT_INDEX
+        assert "test-skill:SKILL.md" in server_module._CONTENT_INDEX
+
+    def test_skill_directory_change_matches_full_rebuild(self, server_module, multiple_skills):
+        """Test that renaming a skill directory re-indexes that skill."""
+        server_module._CONTENT_INDEX = server_module.build_content_index()
+        old_dir = multiple_skills / "forms"
+        new_dir = multiple_skills / "forms-v2"
+        old_dir.rename(new_dir)
+
+        server_module.update_content_index([str(old_dir), str(new_dir)])
+
+        assert server_module._CONTENT_INDEX == server_module.build_content_index()
+
+    def test_noop_before_first_build(self, server_module, sample_skill):
+        """Test that updates are skipped until the index has been built."""
+        assert server_module.update_content_index([str(sample_skill / "SKILL.md")]) == 0
+        assert server_module._CONTENT_INDEX is None
+
 
 class TestLoadIndex:
     """Tests for load_index function."""
@@ -269,12 +364,49 @@ class TestCheckForChanges:
 
         assert server_module.check_for_changes() is True
 
+    def test_detects_nested_new_file(self, server_module, sample_skill):
+        """Test that files in skill subdirectories are tracked."""
+        server_module.check_for_changes()
+
+        (sample_skill / "references" / "extra.md").write_text("Extra reference")
+
+        assert server_module.check_for_changes() is True
+        assert str(sample_skill / "references" / "extra.md") in server_module._FILE_MTIMES
+
     def test_no_changes(self, server_module, sample_skill):
         """Test returns False when no changes."""
         server_module.check_for_changes()
         assert server_module.check_for_changes() is False
 
 
+class TestSkillsEventHandler:
+    """Tests for the event-driven file watcher."""
+
+    def test_burst_of_events_reloads_once(self, server_module, sample_skill):
+        """Test that several events inside the debounce window reload once."""
+        handler = server_module.SkillsEventHandler()
+        event = MagicMock(event_type="modified", src_path=str(sample_skill / "SKILL.md"), dest_path="")
+
+        with patch.object(server_module, "RELOAD_DEBOUNCE", 0.05), \
+                patch.object(server_module, "load_index", return_value={"skills": []}) as mock_load:
+            for _ in range(5):
+                handler.on_any_event(event)
+            server_module._RELOAD_TIMER.join(1)
+
+        assert mock_load.call_count == 1
+        assert server_module._INDEX == {"skills": []}
+
+    def test_ignores_read_only_events(self, server_module, sample_skill):
+        """Test that opening files doesn't schedule a reload."""
+        handler = server_module.SkillsEventHandler()
+        event = MagicMock(event_type="opened", src_path=str(sample_skill / "SKILL.md"))
+
+        with patch.object(server_module, "_schedule_reload") as mock_schedule:
+            handler.on_any_event(event)
+
+        mock_schedule.assert_not_called()
+
+
 class TestExtractSnippet:
     """Tests for extract_snippet function."""
 
@@ -314,6 +446,12 @@ class TestExtractSnippet:
         snippet = server_module.extract_snippet(content, "Line", 100)
         assert "\n" not in snippet
 
+    def test_counts_characters_in_bytes_content(self, server_module):
+        """Test that windows over UTF-8 bytes are measured in characters."""
+        content = ("é" * 60 + "target" + "ü" * 60).encode("utf-8")
+        snippet = server_module.extract_snippet(content, "target", 10)
+        assert snippet == "..." + "é" * 50 + "target" + "üüüü" + "..."
+
 
 class TestListSkills:
     """Tests for _list_skills function."""
@@ -381,6 +519,28 @@ class TestGetSkill:
         server_module._get_skill("test-skill")
         assert server_module._USAGE_STATS["skill_loads"]["test-skill"] == 1
 
+    def test_returns_edited_content(self, server_module, sample_skill):
+        """Test that cached SKILL.md content is refreshed after an edit."""
+        server_module._get_skill("test-skill")
+        (sample_skill / "SKILL.md").write_text("# Edited skill\n", encoding="utf-8")
+
+        result = server_module._get_skill("test-skill")
+        assert result["content"] == "# Edited skill\n"
+
+    def test_reload_clears_resolved_paths(self, server_module, sample_skill, temp_skills_dir, tmp_path):
+        """Test that a skill swapped for an outside symlink is rejected after reload."""
+        assert "error" not in server_module._get_skill("test-skill")
+
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "SKILL.md").write_text("# Outside\n")
+        sample_skill.rename(tmp_path / "moved-skill")
+        (temp_skills_dir / "test-skill").symlink_to(outside, target_is_directory=True)
+        server_module._reload_index()
+
+        result = server_module._get_skill("test-skill")
+        assert result["error"] == "Invalid skill path: test-skill"
+
 
 class TestGetSubSkill:
     """Tests for _get_sub_skill function."""
@@ -464,6 +624,20 @@ class TestGetSkillsBatch:
         assert "content" in result["results"][0]
         assert "error" in result["results"][1]
 
+    def test_duplicate_requests_keep_order_and_stats(self, server_module, multiple_skills):
+        """Test that repeated entries are answered in place and still counted."""
+        requests = [
+            {"domain": "forms", "sub_skill": "react"},
+            {"domain": "test-skill"},
+            {"domain": "forms", "sub_skill": "react"},
+        ]
+        result = server_module._get_skills_batch(requests)
+
+        assert [r.get("sub_skill") for r in result["results"]] == ["react", None, "react"]
+        assert result["results"][0] == result["results"][2]
+        assert server_module._USAGE_STATS["tool_calls"]["get_sub_skill"] == 2
+        assert server_module._USAGE_STATS["skill_loads"]["forms"] == 2
+
 
 class TestSearchSkills:
     """Tests for _search_skills function."""
@@ -562,6 +736,35 @@ class TestSearchContent:
             if early_match:
                 assert early_match["score"] >= 1.0
 
+    def test_matches_inside_words(self, server_module, sample_skill):
+        """Test that query words still match as substrings of longer words."""
+        result = server_module._search_content("mockin")
+        files = {r["file"] for r in result["results"]}
+        assert "references/advanced.md" in files
+
+    def test_sees_incremental_updates(self, server_module, sample_skill):
+        """Test that the inverted index follows update_content_index."""
+        server_module._search_content("test")
+        skill_file = sample_skill / "SKILL.md"
+        skill_file.write_text("# Test Skill\n\nNow about quasars.\n")
+        server_module.update_content_index([str(skill_file)])
+
+        result = server_module._search_content("quasar")
+        assert [r["file"] for r in result["results"]] == ["SKILL.md"]
+        assert server_module._search_content("meaningful")["results"] == []
+
+    def test_matches_non_ascii_content(self, server_module, sample_skill):
+        """Test phrase matching, boosting and snippets on non-ASCII text."""
+        skill_file = sample_skill / "SKILL.md"
+        skill_file.write_text("# Größe\n\n" + "ü" * 240 + " Straße Überblick\n", encoding="utf-8")
+        server_module.update_content_index([str(skill_file)])
+
+        result = server_module._search_content("straße überblick")
+        match = next(r for r in result["results"] if r["file"] == "SKILL.md")
+        # Ends at character 260 (past byte 500), so still gets the early boost
+        assert match["score"] == 1.2
+        assert "straße überblick" in match["snippet"]
+
     def test_handles_empty_index(self, server_module, temp_skills_dir):
         """Test searching with no indexed content."""
         # Force index load on empty dir